@@ -1,13 +1,27 @@
-from fastapi import APIRouter, Depends
+from typing import Optional
+from beanie import PydanticObjectId
+from fastapi import APIRouter, Depends, Query
 from core.security import get_admin_user
-from models.user import User
+from models.user import User, AdminUserView, UserAuthView
 
 router = APIRouter()
 
 @router.get("/users")
-async def list_all_users(admin: User = Depends(get_admin_user)):
-    """List all users (admin only)"""
-    users = await User.find_all().to_list()
+async def list_all_users(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    after: Optional[PydanticObjectId] = None,
+    admin: UserAuthView = Depends(get_admin_user),
+):
+    """List users page by page (admin only); pass the last id as `after` for stable paging"""
+    query = User.find_all() if after is None else User.find(User.id > after)
+    users = await (
+        query.sort(+User.id)
+        .skip(skip)
+        .limit(limit)
+        .project(AdminUserView)
+        .to_list()
+    )
     return [
         {
             "id": str(user.id),
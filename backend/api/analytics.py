@@ -1,35 +1,51 @@
 from fastapi import APIRouter, Depends
-from core.security import get_current_active_user
-from models.user import User
+from core.security import get_current_user_auth
+from core.cache import cache, dashboard_key
+from core.config import settings
+from models.user import UserAuthView
 from models.lead import Lead
-from models.usage import UsageTracking
+from models.usage import UsageTracking, current_month_utc
 from datetime import datetime, timedelta
+import asyncio
 
 router = APIRouter()
 
 @router.get("/dashboard")
-async def get_dashboard_stats(current_user: User = Depends(get_current_active_user)):
-    """Get dashboard analytics"""
-    # Count total leads
-    total_leads = await Lead.find(Lead.user.ref.id == current_user.id).count()
+async def get_dashboard_stats(current_user: UserAuthView = Depends(get_current_user_auth)):
+    """Get dashboard analytics (cached briefly per user, cleared on lead/email changes)"""
+    key = dashboard_key(current_user.id)
+    cached = await cache.get(key)
+    if cached is not None:
+        return cached
 
-    # Count contacted leads
-    contacted = await Lead.find(
-        Lead.user.ref.id == current_user.id,
-        Lead.status == "contacted"
-    ).count()
+    # Count total and contacted leads in one aggregation (Lead.user holds the owner's ObjectId)
+    pipeline = [
+        {"$match": {"user": current_user.id}},
+        {"$group": {
+            "_id": None,
+            "total": {"$sum": 1},
+            "contacted": {"$sum": {"$cond": [{"$eq": ["$status", "contacted"]}, 1, 0]}},
+        }},
+    ]
 
-    # Get current month usage
-    current_month = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    usage = await UsageTracking.find_one(
-        UsageTracking.user.id == current_user.id,
-        UsageTracking.month == current_month
+    # Get current month usage concurrently with the lead counts
+    current_month = current_month_utc()
+    counts, usage = await asyncio.gather(
+        Lead.get_motor_collection().aggregate(pipeline).to_list(1),
+        UsageTracking.find_one(
+            UsageTracking.user.id == current_user.id,
+            UsageTracking.month == current_month
+        ),
     )
 
+    total_leads = counts[0]["total"] if counts else 0
+    contacted = counts[0]["contacted"] if counts else 0
     emails_sent = usage.emails_sent if usage else 0
 
-    return {
+    stats = {
         "total_leads": total_leads,
         "emails_sent": emails_sent,
         "success_rate": round((contacted / total_leads * 100), 1) if total_leads > 0 else 0,
     }
+    await cache.set(key, stats, settings.DASHBOARD_CACHE_TTL)
+    return stats
@@ -1,59 +1,112 @@
+import asyncio
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Annotated, Optional
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    EmailStr,
+    Field,
+    StringConstraints,
+)
 from core.security import (
     get_password_hash,
-    verify_password,
+    verify_and_update_password,
     create_access_token,
     get_current_user,
 )
-from models.user import User
+from core.rate_limit import auth_rate_limit
+from core.cache import invalidate_user
+from pymongo.errors import DuplicateKeyError
+from models.user import User, LoginProjection
 import secrets
 
 router = APIRouter()
 
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+
+def _normalize_email_domain(value: str) -> str:
+    """Lowercase the domain, matching how EmailStr normalizes stored addresses"""
+    local, _, domain = value.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+# Cheap shape check for lookups; full EmailStr validation is kept for signup
+LookupEmail = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, pattern=EMAIL_PATTERN),
+    AfterValidator(_normalize_email_domain),
+]
+
 # Request/Response Models
 class SignupRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    
     email: EmailStr
     password: str = Field(..., min_length=8)
     full_name: str
     company_name: Optional[str] = None
 
 class LoginRequest(BaseModel):
-    email: EmailStr
+    model_config = ConfigDict(extra="forbid")
+    
+    email: LookupEmail
     password: str
 
+class UserOut(BaseModel):
+    """Public user fields, read straight off a User (or projection)"""
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: Annotated[str, BeforeValidator(str)]
+    email: str
+    full_name: str
+    company_name: Optional[str] = None
+    plan: str
+    email_verified: bool
+    avatar_url: Optional[str] = None
+
+class MeOut(UserOut):
+    lead_limit: int
+    leads_used: int
+    created_at: datetime
+
 class TokenResponse(BaseModel):
     access_token: str
     token_type: str = "bearer"
-    user: dict
+    user: UserOut
 
 class ForgotPasswordRequest(BaseModel):
-    email: EmailStr
+    model_config = ConfigDict(extra="forbid")
+    
+    email: LookupEmail
 
 class ResetPasswordRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    
     token: str
     new_password: str = Field(..., min_length=8)
 
 # Endpoints
-@router.post("/signup", response_model=TokenResponse)
+@router.post("/signup", response_model=TokenResponse, dependencies=[Depends(auth_rate_limit)])
 async def signup(request: SignupRequest, background_tasks: BackgroundTasks):
     """Register a new user"""
-    # Check if user already exists
-    existing_user = await User.find_one(User.email == request.email)
-    if existing_user:
-        raise HTTPException(status_code=400, detail="Email already registered")
+    # Hash off the event loop (CPU-bound)
+    password_hash = await asyncio.to_thread(get_password_hash, request.password)
     
     # Create user
     user = User(
         email=request.email,
-        password_hash=get_password_hash(request.password),
+        password_hash=password_hash,
         full_name=request.full_name,
         company_name=request.company_name,
         email_verified=False,  # Should verify via email
     )
-    await user.insert()
+    # The unique email index rejects existing accounts
+    try:
+        await user.insert()
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already registered")
     
     # TODO: Send verification email
     # background_tasks.add_task(send_verification_email, user.email, verification_token)
@@ -64,43 +117,38 @@ async def signup(request: SignupRequest, background_tasks: BackgroundTasks):
     return {
         "access_token": access_token,
         "token_type": "bearer",
-        "user": {
-            "id": str(user.id),
-            "email": user.email,
-            "full_name": user.full_name,
-            "company_name": user.company_name,
-            "plan": user.plan,
-            "email_verified": user.email_verified,
-        }
+        "user": UserOut.model_validate(user),
     }
 
-@router.post("/login", response_model=TokenResponse)
+@router.post("/login", response_model=TokenResponse, dependencies=[Depends(auth_rate_limit)])
 async def login(request: LoginRequest):
     """Login a user"""
-    # Find user
-    user = await User.find_one(User.email == request.email)
+    # Find user (only the fields needed to verify and respond)
+    user = await User.find_one(User.email == request.email, projection_model=LoginProjection)
     if not user:
         raise HTTPException(status_code=401, detail="Incorrect email or password")
     
-    # Verify password
-    if not verify_password(request.password, user.password_hash):
+    # Verify password off the event loop (CPU-bound)
+    verified, new_hash = await asyncio.to_thread(
+        verify_and_update_password, request.password, user.password_hash
+    )
+    if not verified:
         raise HTTPException(status_code=401, detail="Incorrect email or password")
     
+    # Upgrade legacy bcrypt hashes to argon2id
+    if new_hash:
+        await User.find_one(User.id == user.id).update(
+            {"$set": {"password_hash": new_hash, "updated_at": datetime.utcnow()}}
+        )
+        await invalidate_user(user.id)
+    
     # Create access token
     access_token = create_access_token(data={"sub": str(user.id)})
     
     return {
         "access_token": access_token,
         "token_type": "bearer",
-        "user": {
-            "id": str(user.id),
-            "email": user.email,
-            "full_name": user.full_name,
-            "company_name": user.company_name,
-            "plan": user.plan,
-            "email_verified": user.email_verified,
-            "avatar_url": user.avatar_url,
-        }
+        "user": UserOut.model_validate(user),
     }
 
 @router.post("/logout")
@@ -108,7 +156,7 @@ async def logout(current_user: User = Depends(get_current_user)):
     """Logout user (client should remove token)"""
     return {"message": "Successfully logged out"}
 
-@router.post("/forgot-password")
+@router.post("/forgot-password", dependencies=[Depends(auth_rate_limit)])
 async def forgot_password(request: ForgotPasswordRequest, background_tasks: BackgroundTasks):
     """Request password reset"""
     user = await User.find_one(User.email == request.email)
@@ -124,7 +172,7 @@ async def forgot_password(request: ForgotPasswordRequest, background_tasks: Back
     
     return {"message": "If the email exists, a reset link has been sent"}
 
-@router.post("/reset-password")
+@router.post("/reset-password", dependencies=[Depends(auth_rate_limit)])
 async def reset_password(request: ResetPasswordRequest):
     """Reset password with token"""
     # TODO: Verify reset token
@@ -132,18 +180,7 @@ async def reset_password(request: ResetPasswordRequest):
     # For now, just return success
     return {"message": "Password reset successfully"}
 
-@router.get("/me")
+@router.get("/me", response_model=MeOut)
 async def get_me(current_user: User = Depends(get_current_user)):
     """Get current user"""
-    return {
-        "id": str(current_user.id),
-        "email": current_user.email,
-        "full_name": current_user.full_name,
-        "company_name": current_user.company_name,
-        "plan": current_user.plan,
-        "lead_limit": current_user.lead_limit,
-        "leads_used": current_user.leads_used,
-        "email_verified": current_user.email_verified,
-        "avatar_url": current_user.avatar_url,
-        "created_at": current_user.created_at,
-    }
+    return MeOut.model_validate(current_user)
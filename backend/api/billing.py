@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends, Request, HTTPException
+from fastapi import APIRouter, Depends, Request, HTTPException, Response
+from beanie import PydanticObjectId
+from beanie.operators import Inc, Set
 from core.security import get_current_active_user
+from core.cache import invalidate_all_users, invalidate_user
 from models.user import User
 import os
 import json
+import asyncio
+import logging
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 # Stripe configuration
 STRIPE_SECRET_KEY = os.getenv("STRIPE_SECRET_KEY", "sk_test_...")
@@ -13,38 +19,60 @@ STRIPE_WEBHOOK_SECRET = os.getenv("STRIPE_WEBHOOK_SECRET", "whsec_...")
 
 try:
     import stripe
+    import requests
+    from requests.adapters import HTTPAdapter
     stripe.api_key = STRIPE_SECRET_KEY
+    
+    # Stripe calls run in worker threads; share one keep-alive pool between them
+    _stripe_session = requests.Session()
+    _stripe_session.mount("https://", HTTPAdapter(pool_connections=50, pool_maxsize=50))
+    stripe.default_http_client = stripe.http_client.RequestsClient(session=_stripe_session)
     STRIPE_AVAILABLE = True
 except ImportError:
     STRIPE_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 router = APIRouter()
 
+PRICING_PLANS = {
+    "plans": [
+        {
+            "name": "Free",
+            "price": 0,
+            "lead_limit": 50,
+            "features": ["50 leads/month", "AI email generation", "PDF portfolios"],
+        },
+        {
+            "name": "Pro",
+            "price": 9.99,
+            "lead_limit": 500,
+            "features": ["500 leads/month", "Email sending", "API access", "Priority support"],
+        },
+        {
+            "name": "Enterprise",
+            "price": 29.99,
+            "lead_limit": 999999,
+            "features": ["Unlimited leads", "White-label", "Phone support", "Custom integrations"],
+        }
+    ]
+}
+
+# The plans never change at runtime, so serialize them once
+_PLANS_BODY = orjson.dumps(PRICING_PLANS) if ORJSON_AVAILABLE else json.dumps(PRICING_PLANS).encode()
+
 @router.get("/plans")
 async def get_pricing_plans():
     """Get available pricing plans"""
-    return {
-        "plans": [
-            {
-                "name": "Free",
-                "price": 0,
-                "lead_limit": 50,
-                "features": ["50 leads/month", "AI email generation", "PDF portfolios"],
-            },
-            {
-                "name": "Pro",
-                "price": 9.99,
-                "lead_limit": 500,
-                "features": ["500 leads/month", "Email sending", "API access", "Priority support"],
-            },
-            {
-                "name": "Enterprise",
-                "price": 29.99,
-                "lead_limit": 999999,
-                "features": ["Unlimited leads", "White-label", "Phone support", "Custom integrations"],
-            }
-        ]
-    }
+    return Response(
+        content=_PLANS_BODY,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"},
+    )
 
 @router.post("/create-checkout-session")
 async def create_checkout_session(
@@ -73,7 +101,9 @@ async def create_checkout_session(
         if price_id not in price_mapping:
             raise HTTPException(status_code=400, detail="Invalid price ID")
         
-        checkout_session = stripe.checkout.Session.create(
+        # The Stripe SDK is blocking; keep its network I/O off the event loop
+        checkout_session = await asyncio.to_thread(
+            stripe.checkout.Session.create,
             customer_email=current_user.email,
             payment_method_types=['card'],
             line_items=[{
@@ -107,7 +137,8 @@ async def buy_leads(
     price = request.get("price", 4.99)
     
     try:
-        checkout_session = stripe.checkout.Session.create(
+        checkout_session = await asyncio.to_thread(
+            stripe.checkout.Session.create,
             customer_email=current_user.email,
             payment_method_types=['card'],
             line_items=[{
@@ -146,28 +177,34 @@ async def stripe_webhook(request: Request):
     sig_header = request.headers.get('stripe-signature')
     
     try:
-        # Verify webhook signature
-        event = stripe.Webhook.construct_event(
-            payload, sig_header, STRIPE_WEBHOOK_SECRET
+        # Verify webhook signature (HMAC + JSON parse) off the event loop
+        event = await asyncio.to_thread(
+            stripe.Webhook.construct_event, payload, sig_header, STRIPE_WEBHOOK_SECRET
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail="Invalid payload")
     except stripe.error.SignatureVerificationError as e:
         raise HTTPException(status_code=400, detail="Invalid signature")
     
-    # Handle the event
-    if event['type'] == 'checkout.session.completed':
-        session = event['data']['object']
-        await handle_checkout_completed(session)
-    elif event['type'] == 'invoice.payment_succeeded':
-        invoice = event['data']['object']
-        await handle_payment_succeeded(invoice)
-    elif event['type'] == 'customer.subscription.deleted':
-        subscription = event['data']['object']
-        await handle_subscription_cancelled(subscription)
+    # Process before acknowledging: a 5xx makes Stripe retry the event, so a
+    # transient database failure can't lose a subscription or payment update
+    try:
+        await dispatch_event(event)
+    except Exception:
+        logger.exception(f"Failed to process Stripe event {event.get('id')} ({event['type']})")
+        raise HTTPException(status_code=500, detail="Failed to process event")
     
     return {"status": "success"}
 
+async def dispatch_event(event):
+    """Route a verified Stripe event to its handler"""
+    handler = EVENT_HANDLERS.get(event['type'])
+    if handler is not None:
+        await handler(event['data']['object'])
+
+# Monthly lead limit granted by each subscription plan
+PLAN_LEAD_LIMITS = {'free': 50, 'pro': 500, 'enterprise': 999999}
+
 async def handle_checkout_completed(session):
     """Handle successful checkout completion"""
     user_id = session.metadata.get('user_id')
@@ -176,61 +213,73 @@ async def handle_checkout_completed(session):
     if not user_id:
         return
     
-    user = await User.get(user_id)
-    if not user:
-        return
+    # Targeted updates: no fetch, and only the changed fields are written
+    user_query = User.find_one(User.id == PydanticObjectId(user_id))
     
     if plan_type == 'subscription':
         # Update user plan and limits
-        if 'pro' in session.metadata.get('price_id', '').lower():
-            user.plan = 'pro'
-            user.lead_limit = 500
-        elif 'enterprise' in session.metadata.get('price_id', '').lower():
-            user.plan = 'enterprise'
-            user.lead_limit = 999999
-        
-        await user.save()
+        price_id = session.metadata.get('price_id', '').lower()
+        plan = 'pro' if 'pro' in price_id else 'enterprise' if 'enterprise' in price_id else None
+        if plan:
+            await user_query.update(Set({User.plan: plan, User.lead_limit: PLAN_LEAD_LIMITS[plan]}))
+            await invalidate_user(user_id)
     
     elif plan_type == 'one_time_leads':
-        # Add leads to user's limit
+        # Add leads to user's limit (atomic under concurrent purchases)
         lead_pack = int(session.metadata.get('lead_pack', 100))
-        user.lead_limit += lead_pack
-        await user.save()
+        await user_query.update(Inc({User.lead_limit: lead_pack}))
+        await invalidate_user(user_id)
 
 async def handle_payment_succeeded(invoice):
     """Handle successful payment for subscriptions"""
     customer_id = invoice.get('customer')
     if customer_id:
-        # Find user by stripe customer ID and ensure subscription is active
-        user = await User.find_one(User.stripe_customer_id == customer_id)
+        # Ensure the user's lead limit matches their plan, in a single server-side update
+        user = await User.get_motor_collection().find_one_and_update(
+            {"stripe_customer_id": customer_id, "plan": {"$in": ["pro", "enterprise"]}},
+            [{"$set": {"lead_limit": {"$switch": {
+                "branches": [
+                    {"case": {"$eq": ["$plan", plan]}, "then": PLAN_LEAD_LIMITS[plan]}
+                    for plan in ("pro", "enterprise")
+                ],
+                "default": "$lead_limit",
+            }}}}],
+            projection={"_id": 1},
+        )
         if user:
-            # Ensure user has the correct plan limits
-            if user.plan == 'pro':
-                user.lead_limit = 500
-            elif user.plan == 'enterprise':
-                user.lead_limit = 999999
-            await user.save()
+            await invalidate_user(user["_id"])
 
 async def handle_subscription_cancelled(subscription):
     """Handle subscription cancellation"""
     customer_id = subscription.get('customer')
     if customer_id:
-        user = await User.find_one(User.stripe_customer_id == customer_id)
+        # Downgrade to free plan
+        user = await User.get_motor_collection().find_one_and_update(
+            {"stripe_customer_id": customer_id},
+            {"$set": {"plan": 'free', "lead_limit": PLAN_LEAD_LIMITS['free']}},
+            projection={"_id": 1},
+        )
         if user:
-            # Downgrade to free plan
-            user.plan = 'free'
-            user.lead_limit = 50
-            await user.save()
+            await invalidate_user(user["_id"])
+
+EVENT_HANDLERS = {
+    'checkout.session.completed': handle_checkout_completed,
+    'invoice.payment_succeeded': handle_payment_succeeded,
+    'customer.subscription.deleted': handle_subscription_cancelled,
+}
 
 @router.post("/reset-usage")
 async def reset_monthly_usage(current_user: User = Depends(get_current_active_user)):
     """Reset monthly lead usage (for testing/admin)"""
     if current_user.is_admin:
         # Reset all users' leads_used to 0
-        await User.find_all().update({"$set": {"leads_used": 0}})
-        return {"message": "Monthly usage reset for all users"}
+        result = await User.get_motor_collection().update_many(
+            {"leads_used": {"$ne": 0}}, {"$set": {"leads_used": 0}}
+        )
+        await invalidate_all_users()
+        return {"message": "Monthly usage reset for all users", "modified": result.modified_count}
     else:
         # Reset only current user's usage
-        current_user.leads_used = 0
-        await current_user.save()
+        await User.find_one(User.id == current_user.id).update(Set({User.leads_used: 0}))
+        await invalidate_user(current_user.id)
         return {"message": "Your monthly usage has been reset"}
@@ -1,17 +1,17 @@
 from fastapi import APIRouter, Depends
-from core.security import get_current_active_user
-from models.user import User
+from core.security import get_current_user_auth
+from models.user import UserAuthView
 
 router = APIRouter()
 
 @router.get("/")
-async def list_campaigns(current_user: User = Depends(get_current_active_user)):
+async def list_campaigns(current_user: UserAuthView = Depends(get_current_user_auth)):
     """List all campaigns for current user"""
     # TODO: Implement campaign listing
     return []
 
 @router.post("/")
-async def create_campaign(current_user: User = Depends(get_current_active_user)):
+async def create_campaign(current_user: UserAuthView = Depends(get_current_user_auth)):
     """Create a new campaign"""
     # TODO: Implement campaign creation
     return {"message": "Campaign created"}
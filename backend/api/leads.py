@@ -1,13 +1,25 @@
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query
+import time
+import logging
+from types import MappingProxyType
+from typing import List, Optional, Union
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query, Response
 from pydantic import BaseModel, Field, HttpUrl
-from core.security import get_current_active_user
-from models.user import User
-from models.lead import Lead
+from core.security import get_current_active_user, get_current_user_auth
+from core.cache import cache, discovery_key, get_or_refresh, invalidate_user, invalidate_user_leads, leads_list_key
+from core.config import settings
+from models.user import User, UserAuthView
+from models.lead import Lead, LeadListView, LeadEmailSendView
+from services.email_service import EmailService
+from services.lead_discovery_service import discover_leads_task, release_lead_quota, reserve_lead_quota
 from datetime import datetime
 from beanie import PydanticObjectId
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Most leads a single discovery request may ask for, per plan
+# Free: 10, Pro: 100, Enterprise: unlimited
+MAX_LEADS_PER_REQUEST = MappingProxyType({"free": 10, "pro": 100, "enterprise": 999999})
 
 # Request/Response Models
 class DiscoverLeadsRequest(BaseModel):
@@ -46,6 +58,22 @@ class UpdateLeadRequest(BaseModel):
     status: Optional[str] = None
     notes: Optional[str] = None
 
+# Helpers
+def owned_lead_filter(lead_id: str, user: Union[User, UserAuthView]) -> dict:
+    """Raw filter matching a lead by id and owner (Lead.user holds the owner's ObjectId)"""
+    try:
+        oid = PydanticObjectId(lead_id)
+    except Exception:
+        raise HTTPException(status_code=404, detail="Lead not found")
+    return {"_id": oid, "user": user.id}
+
+async def get_owned_lead(lead_id: str, user: Union[User, UserAuthView]) -> Lead:
+    """Fetch a lead by id and owner in one query; 404 if missing or not the user's"""
+    lead = await Lead.find_one(owned_lead_filter(lead_id, user))
+    if lead is None:
+        raise HTTPException(status_code=404, detail="Lead not found")
+    return lead
+
 # Endpoints
 @router.post("/discover", response_model=DiscoverLeadsResponse)
 async def discover_leads(
@@ -61,10 +89,18 @@ async def discover_leads(
     print(f"   User: {current_user.email}")
     print(f"   Request: {request.dict()}")
     
-    from services.lead_discovery_service import discover_leads_task
+    # Check usage limits based on plan
+    max_allowed = MAX_LEADS_PER_REQUEST.get(current_user.plan, MAX_LEADS_PER_REQUEST["free"])
     
-    # Check lead limits
-    if current_user.leads_used + request.max_leads > current_user.lead_limit:
+    if request.max_leads > max_allowed:
+        raise HTTPException(
+            status_code=403,
+            detail=f"Your {current_user.plan} plan allows up to {max_allowed} leads"
+        )
+    
+    # Reserve the leads against the monthly limit atomically, so concurrent
+    # requests can't both pass the check; the task gives back what it doesn't use
+    if not await reserve_lead_quota(current_user.id, request.max_leads):
         remaining_leads = current_user.lead_limit - current_user.leads_used
         if remaining_leads <= 0:
             raise HTTPException(
@@ -76,30 +112,33 @@ async def discover_leads(
                 status_code=402,
                 detail=f"You can only generate {remaining_leads} more leads this month. Upgrade your plan for more."
             )
-    
-    # Check usage limits based on plan
-    # Free: 10, Pro: 100, Enterprise: unlimited
-    limits = {"free": 10, "pro": 100, "enterprise": 999999}
-    max_allowed = limits.get(current_user.plan, 10)
-    
-    if request.max_leads > max_allowed:
-        raise HTTPException(
-            status_code=403,
-            detail=f"Your {current_user.plan} plan allows up to {max_allowed} leads"
-        )
-    
-    # TODO: Check monthly usage limit
+    await invalidate_user(current_user.id)
+    
+    # Coalesce repeated clicks: an identical request that is already running
+    # (or finished recently) returns its task instead of paying for the APIs again
+    request_data = request.dict()
+    user_id = str(current_user.id)
+    task_id = f"discover_{user_id}_{time.time_ns()}"
+    dedup_key = discovery_key(user_id, request_data)
+    if not await cache.add(dedup_key, task_id, settings.DISCOVERY_DEDUP_TTL):
+        existing_task_id = await cache.get(dedup_key)
+        if existing_task_id is not None:
+            await release_lead_quota(current_user.id, request.max_leads)
+            return {
+                "task_id": existing_task_id,
+                "status": "in_progress",
+                "message": "An identical lead discovery was started recently.",
+            }
     
     # Start background task
-    task_id = f"discover_{current_user.id}_{datetime.utcnow().timestamp()}"
     print(f"   Task ID: {task_id}")
     print(f"   Adding background task...")
     
     background_tasks.add_task(
         discover_leads_task,
         task_id=task_id,
-        user_id=str(current_user.id),
-        request_data=request.dict(),
+        user_id=user_id,
+        request_data=request_data,
     )
     
     print(f"   ✅ Background task added!")
@@ -112,72 +151,113 @@ async def discover_leads(
 
 @router.get("/", response_model=List[LeadResponse])
 async def get_leads(
+    background_tasks: BackgroundTasks,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
     status: Optional[str] = None,
     industry: Optional[str] = None,
     has_email: Optional[bool] = None,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserAuthView = Depends(get_current_user_auth),
 ):
     """Get all leads for current user with pagination and filters"""
-    print(f"📊 GET LEADS ENDPOINT HIT!")
-    print(f"   User: {current_user.email}")
-    print(f"   User ID: {current_user.id}")
-    print(f"   Filters: skip={skip}, limit={limit}, status={status}, industry={industry}")
-    
-    # First check total leads in database
-    total_leads = await Lead.count()
-    print(f"   Total leads in database: {total_leads}")
+    logger.debug(
+        f"GET leads for {current_user.id}: skip={skip}, limit={limit}, "
+        f"status={status}, industry={industry}, has_email={has_email}"
+    )
     
+    # Cached per user and query (stale-while-revalidate); cleared whenever
+    # the user's leads change
+    key = leads_list_key(current_user.id, skip, limit, status, industry, has_email)
+    return await get_or_refresh(
+        key,
+        lambda: _fetch_leads_page(current_user.id, skip, limit, status, industry, has_email),
+        settings.LEADS_CACHE_TTL,
+        background_tasks,
+        response,
+    )
+
+async def _fetch_leads_page(
+    user_id: PydanticObjectId,
+    skip: int,
+    limit: int,
+    status: Optional[str],
+    industry: Optional[str],
+    has_email: Optional[bool],
+) -> List[dict]:
+    """Query one page of a user's leads as JSON-ready dicts"""
+    # Single filter document
     # Fix: Use Lead.user directly for Link field comparison (contains ObjectId)
-    query = Lead.find(Lead.user == current_user.id)
-    
+    query = {"user": user_id}
     if status:
-        query = query.find(Lead.status == status)
+        query["status"] = status
     if industry:
-        query = query.find(Lead.industry == industry)
+        query["industry"] = industry
     if has_email is not None:
-        if has_email:
-            query = query.find(Lead.contact_email != None)
-        else:
-            query = query.find(Lead.contact_email == None)
-    
-    leads = await query.sort(-Lead.created_at).skip(skip).limit(limit).to_list()
-    
-    print(f"   Found {len(leads)} leads for this user")
-    if len(leads) > 0:
-        print(f"   First lead: {leads[0].company_name}")
+        query["contact_email"] = {"$ne": None} if has_email else None
+    
+    leads = await (
+        Lead.find(query)
+        .sort(-Lead.created_at)
+        .skip(skip)
+        .limit(limit)
+        .project(LeadListView)
+        .to_list()
+    )
+    logger.debug(f"Found {len(leads)} leads for {user_id}")
     
-    return [
-        LeadResponse(
-            id=str(lead.id),
-            company_name=lead.company_name,
-            website=lead.website,
-            industry=lead.industry,
-            services=lead.services,
-            contact_email=lead.contact_email,
-            email_subject=lead.email_subject,
-            email_body=lead.email_body,
-            portfolio_path=lead.portfolio_path,
-            status=lead.status,
-            created_at=lead.created_at,
-        )
-        for lead in leads
-    ]
+    # LeadListView has exactly the LeadResponse fields, so dump the projected
+    # rows directly instead of re-validating each one through LeadResponse
+    return [lead.model_dump(mode="json") for lead in leads]
 
 @router.get("/stats")
 async def get_lead_stats(
+    background_tasks: BackgroundTasks,
+    response: Response,
     current_user: User = Depends(get_current_active_user),
 ):
     """Get lead statistics for debugging"""
-    total_leads = await Lead.find(Lead.user.id == current_user.id).count()
-    leads_with_email = await Lead.find(
-        Lead.user.id == current_user.id,
-        Lead.contact_email != None
-    ).count()
+    lead_stats = await get_or_refresh(
+        leads_list_key(current_user.id, "stats"),
+        lambda: _fetch_lead_stats(current_user.id),
+        settings.LEADS_CACHE_TTL,
+        background_tasks,
+        response,
+    )
     
-    # Get latest leads
-    latest = await Lead.find(Lead.user.id == current_user.id).sort(-Lead.created_at).limit(5).to_list()
+    return {
+        **lead_stats,
+        "user_settings": {
+            "serpapi_configured": bool(current_user.serpapi_key),
+            "hunter_configured": bool(current_user.hunter_api_key),
+            "ai_provider": current_user.ai_provider,
+            "google_sheets_enabled": current_user.google_sheets_enabled,
+            "smtp_configured": bool(current_user.smtp_host and current_user.smtp_username)
+        }
+    }
+
+async def _fetch_lead_stats(user_id: PydanticObjectId) -> dict:
+    """Lead counts and the latest leads of a user in one round trip"""
+    # Lead.user holds the owner's ObjectId directly (leads are created with Link(user.id, User))
+    pipeline = [
+        {"$match": {"user": user_id}},
+        {"$facet": {
+            "counts": [{"$group": {
+                "_id": None,
+                "total": {"$sum": 1},
+                "with_email": {"$sum": {"$cond": [{"$ifNull": ["$contact_email", False]}, 1, 0]}},
+            }}],
+            "latest": [
+                {"$sort": {"created_at": -1}},
+                {"$limit": 5},
+                {"$project": {"company_name": 1, "created_at": 1, "contact_email": 1, "status": 1}},
+            ],
+        }},
+    ]
+    result = (await Lead.get_motor_collection().aggregate(pipeline).to_list(1))[0]
+    counts = result["counts"][0] if result["counts"] else {"total": 0, "with_email": 0}
+    total_leads = counts["total"]
+    leads_with_email = counts["with_email"]
     
     return {
         "total_leads": total_leads,
@@ -185,38 +265,25 @@ async def get_lead_stats(
         "leads_without_email": total_leads - leads_with_email,
         "latest_leads": [
             {
-                "company_name": lead.company_name,
-                "created_at": lead.created_at.isoformat(),
-                "has_email": bool(lead.contact_email),
-                "status": lead.status
+                "company_name": lead["company_name"],
+                "created_at": lead["created_at"].isoformat(),
+                "has_email": bool(lead.get("contact_email")),
+                "status": lead["status"]
             }
-            for lead in latest
+            for lead in result["latest"]
         ],
-        "user_settings": {
-            "serpapi_configured": bool(current_user.serpapi_key),
-            "hunter_configured": bool(current_user.hunter_api_key),
-            "ai_provider": current_user.ai_provider,
-            "google_sheets_enabled": current_user.google_sheets_enabled,
-            "smtp_configured": bool(current_user.smtp_host and current_user.smtp_username)
-        }
     }
 
 @router.get("/{lead_id}", response_model=LeadResponse)
 async def get_lead(
     lead_id: str,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserAuthView = Depends(get_current_user_auth),
 ):
     """Get a specific lead"""
-    try:
-        lead = await Lead.get(PydanticObjectId(lead_id))
-    except:
-        raise HTTPException(status_code=404, detail="Lead not found")
-    
-    # Fix: Check ownership using Link field comparison (same as get_leads)
-    if lead.user != current_user.id:
-        raise HTTPException(status_code=403, detail="You don't have access to this lead")
+    lead = await get_owned_lead(lead_id, current_user)
     
-    return LeadResponse(
+    # Trusted database values; skip re-validating every field
+    return LeadResponse.model_construct(
         id=str(lead.id),
         company_name=lead.company_name,
         website=lead.website,
@@ -234,44 +301,31 @@ async def get_lead(
 async def update_lead(
     lead_id: str,
     request: UpdateLeadRequest,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserAuthView = Depends(get_current_user_auth),
 ):
     """Update a lead"""
-    try:
-        lead = await Lead.get(PydanticObjectId(lead_id))
-    except:
-        raise HTTPException(status_code=404, detail="Lead not found")
-    
-    # Fix: Check ownership using Link field comparison
-    if lead.user != current_user.id:
-        raise HTTPException(status_code=403, detail="You don't have access to this lead")
-    
-    # Update fields
+    # Ownership check and write in one atomic round trip
     update_data = request.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(lead, field, value)
-    
-    lead.updated_at = datetime.utcnow()
-    await lead.save()
+    result = await Lead.get_motor_collection().update_one(
+        owned_lead_filter(lead_id, current_user),
+        {"$set": {**update_data, "updated_at": datetime.utcnow()}},
+    )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Lead not found")
+    await invalidate_user_leads(current_user.id)
     
     return {"message": "Lead updated successfully"}
 
 @router.delete("/{lead_id}")
 async def delete_lead(
     lead_id: str,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserAuthView = Depends(get_current_user_auth),
 ):
     """Delete a lead"""
-    try:
-        lead = await Lead.get(PydanticObjectId(lead_id))
-    except:
+    result = await Lead.get_motor_collection().delete_one(owned_lead_filter(lead_id, current_user))
+    if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Lead not found")
-    
-    # Fix: Check ownership using Link field comparison
-    if lead.user != current_user.id:
-        raise HTTPException(status_code=403, detail="You don't have access to this lead")
-    
-    await lead.delete()
+    await invalidate_user_leads(current_user.id)
     
     return {"message": "Lead deleted successfully"}
 
@@ -282,16 +336,7 @@ async def send_email_to_lead(
     current_user: User = Depends(get_current_active_user),
 ):
     """Send email to a specific lead"""
-    from services.email_service import EmailService
-    
-    try:
-        lead = await Lead.get(PydanticObjectId(lead_id))
-    except:
-        raise HTTPException(status_code=404, detail="Lead not found")
-    
-    # Fix: Check ownership using Link field comparison
-    if lead.user != current_user.id:
-        raise HTTPException(status_code=403, detail="You don't have access to this lead")
+    lead = await get_owned_lead(lead_id, current_user)
     
     if not lead.contact_email:
         raise HTTPException(status_code=400, detail="Lead has no email address")
@@ -313,58 +358,34 @@ async def send_emails_to_all_leads(
     current_user: User = Depends(get_current_active_user),
 ):
     """Send emails to all leads that have email addresses"""
-    from services.email_service import EmailService
-    
     # Get all leads for this user that have email addresses
     leads = await Lead.find(
         Lead.user == current_user.id,
         Lead.contact_email != None,
         Lead.status != "contacted"  # Don't send to already contacted leads
-    ).to_list()
+    ).project(LeadEmailSendView).to_list()
     
     if not leads:
         raise HTTPException(status_code=400, detail="No leads found with email addresses to contact")
     
-    sent_count = 0
-    failed_count = 0
+    # Sends run concurrently over a few persistent SMTP connections; lead
+    # status and usage are updated in bulk by the service
+    send_results = await EmailService.send_bulk(current_user, leads)
+    
     results = []
+    for lead, result in zip(leads, send_results):
+        entry = {
+            "lead_id": str(lead.id),
+            "company": lead.company_name,
+            "email": lead.contact_email,
+            "status": "sent" if result["success"] else "failed",
+        }
+        if not result["success"]:
+            entry["error"] = result.get("error", "Unknown error")
+        results.append(entry)
     
-    for lead in leads:
-        try:
-            result = await EmailService.send_email(
-                user=current_user,
-                lead=lead
-            )
-            
-            if result["success"]:
-                sent_count += 1
-                # Update lead status to contacted
-                lead.status = "contacted"
-                await lead.save()
-                results.append({
-                    "lead_id": str(lead.id),
-                    "company": lead.company_name,
-                    "email": lead.contact_email,
-                    "status": "sent"
-                })
-            else:
-                failed_count += 1
-                results.append({
-                    "lead_id": str(lead.id),
-                    "company": lead.company_name,
-                    "email": lead.contact_email,
-                    "status": "failed",
-                    "error": result.get("error", "Unknown error")
-                })
-        except Exception as e:
-            failed_count += 1
-            results.append({
-                "lead_id": str(lead.id),
-                "company": lead.company_name,
-                "email": lead.contact_email,
-                "status": "failed",
-                "error": str(e)
-            })
+    sent_count = sum(1 for result in send_results if result["success"])
+    failed_count = len(send_results) - sent_count
     
     return {
         "message": f"Email sending completed. {sent_count} sent, {failed_count} failed",
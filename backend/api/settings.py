@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
 from pydantic import BaseModel, EmailStr
 from typing import Optional
 from core.security import get_current_active_user
+from core.cache import get_or_refresh, invalidate_user, user_settings_key
+from core.config import settings
 from models.user import User
+from beanie.operators import Set
 from datetime import datetime
 
 router = APIRouter()
@@ -53,10 +56,23 @@ class SettingsResponse(BaseModel):
     smtp_from_name: Optional[str] = None
 
 @router.get("/", response_model=SettingsResponse)
-async def get_settings(current_user: User = Depends(get_current_active_user)):
+async def get_settings(
+    background_tasks: BackgroundTasks,
+    response: Response,
+    current_user: User = Depends(get_current_active_user),
+):
     """Get current user's settings (API keys masked)"""
-    from core.config import settings
-    
+    # Only the masked response is cached, never the raw keys
+    return await get_or_refresh(
+        user_settings_key(current_user.id),
+        lambda: _build_settings(current_user),
+        settings.USER_CACHE_TTL,
+        background_tasks,
+        response,
+    )
+
+async def _build_settings(current_user: User) -> dict:
+    """Masked settings response for a user"""
     return SettingsResponse(
         serpapi_key_set=bool(current_user.serpapi_key),
         hunter_api_key_set=bool(current_user.hunter_api_key),
@@ -73,7 +89,17 @@ async def get_settings(current_user: User = Depends(get_current_active_user)):
         smtp_password_set=bool(current_user.smtp_password),
         smtp_from_email=current_user.smtp_from_email or settings.SENDER_EMAIL,
         smtp_from_name=current_user.smtp_from_name or settings.SENDER_NAME,
+    ).model_dump()
+
+async def _set_user_fields(user: User, fields: dict):
+    """
+    Write only the given fields with $set, never the whole document, so
+    counters updated elsewhere (leads_used, lead_limit) aren't overwritten
+    """
+    await User.find_one(User.id == user.id).update(
+        Set({**fields, "updated_at": datetime.utcnow()})
     )
+    await invalidate_user(user.id)
 
 @router.put("/api-keys")
 async def update_api_keys(
@@ -81,21 +107,7 @@ async def update_api_keys(
     current_user: User = Depends(get_current_active_user),
 ):
     """Update API keys for integrations"""
-    if keys.serpapi_key is not None:
-        current_user.serpapi_key = keys.serpapi_key
-    if keys.hunter_api_key is not None:
-        current_user.hunter_api_key = keys.hunter_api_key
-    if keys.ai_provider is not None:
-        current_user.ai_provider = keys.ai_provider
-    if keys.openai_api_key is not None:
-        current_user.openai_api_key = keys.openai_api_key
-    if keys.ollama_base_url is not None:
-        current_user.ollama_base_url = keys.ollama_base_url
-    if keys.ollama_model is not None:
-        current_user.ollama_model = keys.ollama_model
-    
-    current_user.updated_at = datetime.utcnow()
-    await current_user.save()
+    await _set_user_fields(current_user, keys.dict(exclude_none=True))
     
     return {"message": "API keys updated successfully"}
 
@@ -105,21 +117,7 @@ async def update_smtp_settings(
     current_user: User = Depends(get_current_active_user),
 ):
     """Update SMTP settings for email sending"""
-    if smtp.smtp_host is not None:
-        current_user.smtp_host = smtp.smtp_host
-    if smtp.smtp_port is not None:
-        current_user.smtp_port = smtp.smtp_port
-    if smtp.smtp_username is not None:
-        current_user.smtp_username = smtp.smtp_username
-    if smtp.smtp_password is not None:
-        current_user.smtp_password = smtp.smtp_password
-    if smtp.smtp_from_email is not None:
-        current_user.smtp_from_email = smtp.smtp_from_email
-    if smtp.smtp_from_name is not None:
-        current_user.smtp_from_name = smtp.smtp_from_name
-    
-    current_user.updated_at = datetime.utcnow()
-    await current_user.save()
+    await _set_user_fields(current_user, smtp.dict(exclude_none=True))
     
     return {"message": "SMTP settings updated successfully"}
 
@@ -129,15 +127,7 @@ async def update_google_sheets(
     current_user: User = Depends(get_current_active_user),
 ):
     """Update Google Sheets integration settings"""
-    if sheets.google_sheets_enabled is not None:
-        current_user.google_sheets_enabled = sheets.google_sheets_enabled
-    if sheets.google_sheets_credentials is not None:
-        current_user.google_sheets_credentials = sheets.google_sheets_credentials
-    if sheets.google_sheet_id is not None:
-        current_user.google_sheet_id = sheets.google_sheet_id
-    
-    current_user.updated_at = datetime.utcnow()
-    await current_user.save()
+    await _set_user_fields(current_user, sheets.dict(exclude_none=True))
     
     return {"message": "Google Sheets settings updated successfully"}
 
@@ -154,8 +144,6 @@ async def delete_api_key(
             detail=f"Invalid key name. Must be one of: {', '.join(valid_keys)}"
         )
     
-    setattr(current_user, key_name, None)
-    current_user.updated_at = datetime.utcnow()
-    await current_user.save()
+    await _set_user_fields(current_user, {key_name: None})
     
     return {"message": f"{key_name} deleted successfully"}
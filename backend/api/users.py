@@ -1,13 +1,21 @@
 from fastapi import APIRouter, Depends
 from core.security import get_current_active_user
+from core.cache import cache, invalidate_user, user_profile_key
+from core.config import settings
 from models.user import User
+from beanie.operators import Set
 
 router = APIRouter()
 
 @router.get("/me")
 async def get_current_user_profile(current_user: User = Depends(get_current_active_user)):
     """Get current user profile"""
-    return {
+    key = user_profile_key(current_user.id)
+    cached = await cache.get(key)
+    if cached is not None:
+        return cached
+    
+    profile = {
         "id": str(current_user.id),
         "email": current_user.email,
         "full_name": current_user.full_name,
@@ -16,6 +24,8 @@ async def get_current_user_profile(current_user: User = Depends(get_current_acti
         "plan": current_user.plan,
         "email_verified": current_user.email_verified,
     }
+    await cache.set(key, profile, settings.USER_CACHE_TTL)
+    return profile
 
 @router.put("/me")
 async def update_user_profile(
@@ -24,10 +34,14 @@ async def update_user_profile(
     current_user: User = Depends(get_current_active_user)
 ):
     """Update user profile"""
+    updates = {}
     if full_name:
-        current_user.full_name = full_name
+        updates[User.full_name] = full_name
     if company_name:
-        current_user.company_name = company_name
+        updates[User.company_name] = company_name
     
-    await current_user.save()
+    # Targeted $set so fields updated elsewhere (leads_used, plan) aren't clobbered
+    if updates:
+        await User.find_one(User.id == current_user.id).update(Set(updates))
+    await invalidate_user(current_user.id)
     return {"message": "Profile updated successfully"}
@@ -0,0 +1,283 @@
+"""
+Response cache shared by the API routers.
+
+Uses Redis when USE_REDIS_CACHE is enabled (shared across workers), otherwise
+a per-process TTL dict. Cache failures are logged and treated as misses so a
+Redis outage never breaks a request. Values must be JSON-serializable.
+"""
+import time
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+from pymongo.errors import ConnectionFailure
+from core.config import settings
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def dashboard_key(user_id) -> str:
+    """Cache key for a user's dashboard analytics"""
+    return f"dash:{user_id}"
+
+
+def user_settings_key(user_id) -> str:
+    """Cache key for a user's (masked) settings response"""
+    return f"user:{user_id}:settings"
+
+
+def user_profile_key(user_id) -> str:
+    """Cache key for a user's profile response"""
+    return f"user:{user_id}:profile"
+
+
+def user_auth_key(user_id) -> str:
+    """Cache key for the authenticated user's slim auth view"""
+    return f"user:{user_id}:auth"
+
+
+def fallback_key(key: str) -> str:
+    """Long-lived last-known-good copy of a cached response, kept out of the
+    `user:`/`leads:` namespaces so invalidation doesn't drop it"""
+    return f"lkg:{key}"
+
+
+def discovery_key(user_id, request_data: dict) -> str:
+    """Key identifying one discovery request of a user, for coalescing repeats"""
+    digest = hashlib.sha256(repr(sorted(request_data.items())).encode()).hexdigest()[:16]
+    return f"disc:{user_id}:{digest}"
+
+
+def leads_prefix(user_id) -> str:
+    """Key prefix shared by all cached lead-list pages of a user"""
+    return f"leads:{user_id}:"
+
+
+def leads_list_key(user_id, *params) -> str:
+    """Cache key for one lead-list page; the user id is always part of the key"""
+    digest = hashlib.blake2b(repr(params).encode(), digest_size=12).hexdigest()
+    return f"{leads_prefix(user_id)}{digest}"
+
+
+class MemoryCache:
+    """In-process TTL cache (per worker)"""
+
+    def __init__(self, maxsize: int = 10000):
+        self.maxsize = maxsize
+        self._data: Dict[str, Tuple[float, Any]] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return entry[1]
+
+    async def set(self, key: str, value: Any, ttl: int):
+        if len(self._data) >= self.maxsize:
+            # Drop expired entries first, then the oldest insertions
+            now = time.monotonic()
+            for k in [k for k, (exp, _) in self._data.items() if exp <= now]:
+                del self._data[k]
+            while len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+        self._data[key] = (time.monotonic() + ttl, value)
+
+    async def add(self, key: str, value: Any, ttl: int) -> bool:
+        """Set the key only if it is absent; returns whether it was set"""
+        if await self.get(key) is not None:
+            return False
+        await self.set(key, value, ttl)
+        return True
+
+    async def incr(self, key: str, ttl: int) -> int:
+        """Increment a counter; the TTL starts with the first increment"""
+        now = time.monotonic()
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= now:
+            await self.set(key, 1, ttl)
+            return 1
+        count = entry[1] + 1
+        self._data[key] = (entry[0], count)
+        return count
+
+    async def delete(self, *keys: str):
+        for key in keys:
+            self._data.pop(key, None)
+
+    async def delete_prefix(self, prefix: str):
+        for key in [k for k in self._data if k.startswith(prefix)]:
+            del self._data[key]
+
+    async def close(self):
+        self._data.clear()
+
+
+class RedisCache:
+    """Redis-backed cache (shared by all workers)"""
+
+    def __init__(self, url: str):
+        self._redis = aioredis.from_url(url)
+
+    @staticmethod
+    def _dumps(value: Any) -> bytes:
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(value, default=str)
+        return json.dumps(value, default=str).encode()
+
+    @staticmethod
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            data = await self._redis.get(key)
+        except RedisError as e:
+            logger.warning(f"Cache get failed for {key}: {e}")
+            return None
+        return None if data is None else self._loads(data)
+
+    async def set(self, key: str, value: Any, ttl: int):
+        try:
+            await self._redis.set(key, self._dumps(value), ex=ttl)
+        except RedisError as e:
+            logger.warning(f"Cache set failed for {key}: {e}")
+
+    async def add(self, key: str, value: Any, ttl: int) -> bool:
+        """Set the key only if it is absent (atomic SET NX); returns whether it was set"""
+        try:
+            return bool(await self._redis.set(key, self._dumps(value), ex=ttl, nx=True))
+        except RedisError as e:
+            logger.warning(f"Cache add failed for {key}: {e}")
+            return True
+
+    async def incr(self, key: str, ttl: int) -> int:
+        """Increment a counter; the TTL starts with the first increment"""
+        try:
+            count = await self._redis.incr(key)
+            if count == 1:
+                await self._redis.expire(key, ttl)
+            return count
+        except RedisError as e:
+            logger.warning(f"Cache incr failed for {key}: {e}")
+            return 0
+
+    async def delete(self, *keys: str):
+        if not keys:
+            return
+        try:
+            await self._redis.delete(*keys)
+        except RedisError as e:
+            logger.warning(f"Cache delete failed for {keys}: {e}")
+
+    async def delete_prefix(self, prefix: str):
+        try:
+            keys = [key async for key in self._redis.scan_iter(match=f"{prefix}*")]
+            if keys:
+                await self._redis.delete(*keys)
+        except RedisError as e:
+            logger.warning(f"Cache delete failed for {prefix}*: {e}")
+
+    async def close(self):
+        await self._redis.aclose()
+
+
+if settings.USE_REDIS_CACHE and REDIS_AVAILABLE:
+    cache = RedisCache(settings.REDIS_URL)
+else:
+    cache = MemoryCache()
+
+
+# Keys with a background refresh in flight (per worker), so a burst of
+# stale hits schedules one recomputation instead of many
+_refreshing: Set[str] = set()
+
+
+async def _refresh(key: str, compute: Callable[[], Awaitable[Any]], ttl: int) -> Any:
+    value = await compute()
+    entry = {"value": value, "fresh_until": time.time() + ttl}
+    await cache.set(key, entry, ttl + settings.CACHE_STALE_TTL)
+    await cache.set(fallback_key(key), value, settings.CACHE_FALLBACK_TTL)
+    return value
+
+
+async def _background_refresh(key: str, compute: Callable[[], Awaitable[Any]], ttl: int):
+    try:
+        await _refresh(key, compute, ttl)
+    except Exception as e:
+        logger.warning(f"Background refresh failed for {key}: {e}")
+    finally:
+        _refreshing.discard(key)
+
+
+async def get_or_refresh(
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    ttl: int,
+    background_tasks=None,
+    response=None,
+) -> Any:
+    """
+    Stale-while-revalidate lookup.
+
+    Fresh entries are returned as-is. Entries past `ttl` but within
+    CACHE_STALE_TTL are still returned, and a refresh is scheduled on
+    `background_tasks` so the request never waits on the database. Misses
+    (including anything invalidated after a write) are computed inline.
+
+    If MongoDB is unreachable on a miss, the last-known-good value (kept for
+    CACHE_FALLBACK_TTL) is served instead, flagged with a `Warning` header
+    on `response` when given.
+    """
+    entry = await cache.get(key)
+    if not isinstance(entry, dict) or "fresh_until" not in entry:
+        try:
+            return await _refresh(key, compute, ttl)
+        except ConnectionFailure as e:
+            stale = await cache.get(fallback_key(key))
+            if stale is None:
+                raise
+            logger.warning(f"Database unavailable, serving stale {key}: {e}")
+            if response is not None:
+                response.headers["Warning"] = '110 - "Response is Stale"'
+            return stale
+
+    if time.time() >= entry["fresh_until"] and background_tasks is not None and key not in _refreshing:
+        _refreshing.add(key)
+        background_tasks.add_task(_background_refresh, key, compute, ttl)
+    return entry["value"]
+
+
+async def invalidate_user_leads(user_id):
+    """Drop every cached view derived from a user's leads"""
+    await cache.delete(dashboard_key(user_id))
+    await cache.delete_prefix(leads_prefix(user_id))
+
+
+async def invalidate_user(user_id):
+    """Drop the cached auth view, settings and profile responses of a user"""
+    await cache.delete(
+        user_auth_key(user_id),
+        user_settings_key(user_id),
+        user_profile_key(user_id),
+    )
+
+
+async def invalidate_all_users():
+    """Drop every cached per-user entry (after bulk user updates)"""
+    await cache.delete_prefix("user:")
@@ -1,6 +1,7 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import init_beanie
 from core.config import settings
+from core.migrations import run_migrations
 from models.user import User
 from models.lead import Lead
 from models.campaign import Campaign, CampaignRecipient
@@ -19,14 +20,33 @@ db = Database()
 async def connect_db():
     """Connect to MongoDB and initialize Beanie"""
     try:
-        db.client = AsyncIOMotorClient(settings.MONGODB_URL, serverSelectionTimeoutMS=5000)
+        # One client (and connection pool) for the whole process; minPoolSize
+        # keeps warm sockets around so bursts don't pay for new handshakes.
+        # Wire compression is negotiated with the server (zstd needs zstandard,
+        # zlib is built in) and shrinks the text-heavy lead documents
+        db.client = AsyncIOMotorClient(
+            settings.MONGODB_URL,
+            serverSelectionTimeoutMS=5000,
+            maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+            minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+            waitQueueTimeoutMS=settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+            maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+            compressors=settings.MONGODB_COMPRESSORS,
+            retryWrites=True,
+        )
         
-        # Test connection
+        # Test connection (also opens the first pooled socket)
         await db.client.admin.command('ping')
         logger.info("✅ Connected to MongoDB successfully!")
         
+        database = db.client[settings.MONGODB_DB_NAME]
+        
+        # Reconcile indexes older deployments built differently; init_beanie
+        # would otherwise fail on the conflicts and leave the DB layer down
+        await run_migrations(database)
+        
         await init_beanie(
-            database=db.client[settings.MONGODB_DB_NAME],
+            database=database,
             document_models=[
                 User,
                 Lead,
@@ -0,0 +1,120 @@
+"""
+Index migrations run at startup, before init_beanie.
+
+init_beanie only creates missing indexes; it never drops or replaces
+existing ones (allow_index_dropping is off). Index changes that conflict
+with what older deployments already built are reconciled here. Every step
+is idempotent, so running it on each boot (and from several workers) is safe.
+"""
+import logging
+from pymongo import ASCENDING
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+# MongoDB error code when dropping an index that no longer exists
+INDEX_NOT_FOUND = 27
+
+
+async def run_migrations(database):
+    """Apply all startup index migrations to the application database"""
+    await migrate_user_email_index(database)
+    await migrate_usage_month_index(database)
+
+
+async def _drop_index_if_exists(collection, name: str):
+    try:
+        await collection.drop_index(name)
+        logger.info(f"Dropped index {collection.name}.{name}")
+    except OperationFailure as e:
+        if e.code != INDEX_NOT_FOUND:
+            raise
+
+
+async def migrate_user_email_index(database):
+    """
+    Replace the old non-unique users.email_1 index with the unique
+    email_unique index.
+
+    Both indexes have the key pattern {email: 1}, which MongoDB does not
+    allow twice, so email_1 must be dropped first. Users sharing an email
+    would block the unique build: the oldest account is kept and the others
+    are copied to `users_duplicates` and removed from `users`.
+    """
+    users = database["users"]
+    if "email_unique" in await users.index_information():
+        return
+
+    duplicates = users.aggregate([
+        {"$sort": {"created_at": ASCENDING, "_id": ASCENDING}},
+        {"$group": {"_id": "$email", "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+        {"$match": {"count": {"$gt": 1}}},
+    ])
+    backup = database["users_duplicates"]
+    async for group in duplicates:
+        extra_ids = group["ids"][1:]
+        async for doc in users.find({"_id": {"$in": extra_ids}}):
+            await backup.replace_one({"_id": doc["_id"]}, doc, upsert=True)
+        await users.delete_many({"_id": {"$in": extra_ids}})
+        logger.warning(
+            f"Moved {len(extra_ids)} duplicate user(s) for {group['_id']} to users_duplicates"
+        )
+
+    await _drop_index_if_exists(users, "email_1")
+    await users.create_index([("email", ASCENDING)], unique=True, name="email_unique")
+    logger.info("Created unique index users.email_unique")
+
+
+# Counters summed together when merging duplicate usage rows
+USAGE_COUNTERS = ("leads_discovered", "emails_sent", "api_calls", "pdfs_generated")
+
+
+async def migrate_usage_month_index(database):
+    """
+    Enforce one usage_tracking document per (user, month).
+
+    Duplicate rows are merged into the oldest one by summing their
+    counters, the extras are deleted, and the old non-unique
+    user_1_month_1 index is dropped before user_month_unique is built.
+    """
+    usage = database["usage_tracking"]
+    if "user_month_unique" in await usage.index_information():
+        return
+
+    duplicates = usage.aggregate([
+        # Rows without a DBRef user can't be attributed; leave them alone
+        {"$match": {"user.$id": {"$exists": True}}},
+        {"$sort": {"_id": ASCENDING}},
+        {"$group": {
+            "_id": {"user": "$user.$id", "month": "$month"},
+            "ids": {"$push": "$_id"},
+            "count": {"$sum": 1},
+            **{field: {"$sum": f"${field}"} for field in USAGE_COUNTERS},
+        }},
+        {"$match": {"count": {"$gt": 1}}},
+    ])
+    async for group in duplicates:
+        keep_id, extra_ids = group["ids"][0], group["ids"][1:]
+        await usage.update_one(
+            {"_id": keep_id},
+            {"$set": {field: group[field] for field in USAGE_COUNTERS}},
+        )
+        await usage.delete_many({"_id": {"$in": extra_ids}})
+        logger.warning(
+            f"Merged {len(extra_ids)} duplicate usage row(s) for {group['_id']} into {keep_id}"
+        )
+
+    await _drop_index_if_exists(usage, "user_1_month_1")
+    try:
+        await usage.create_index(
+            [("user.$id", ASCENDING), ("month", ASCENDING)],
+            unique=True,
+            name="user_month_unique",
+        )
+    except OperationFailure as e:
+        logger.error(
+            "Could not build usage_tracking.user_month_unique; remove duplicate "
+            f"(user, month) rows (e.g. ones without a DBRef user) and restart: {e}"
+        )
+        raise
+    logger.info("Created unique index usage_tracking.user_month_unique")
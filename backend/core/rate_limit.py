@@ -0,0 +1,27 @@
+"""
+Fixed-window rate limiting for expensive endpoints.
+
+Counters live in the shared response cache, so limits are enforced across
+workers when USE_REDIS_CACHE is enabled and per worker otherwise.
+"""
+from fastapi import HTTPException, Request
+from core.cache import cache
+from core.config import settings
+
+
+def rate_limit(times: int, seconds: int):
+    """Build a dependency allowing `times` requests per `seconds` per client IP and path"""
+    async def dependency(request: Request):
+        host = request.client.host if request.client else "unknown"
+        key = f"rl:{request.url.path}:{host}"
+        if await cache.incr(key, seconds) > times:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many attempts. Please try again later.",
+                headers={"Retry-After": str(seconds)},
+            )
+    return dependency
+
+
+# Shared by the auth endpoints, which hash passwords (CPU-heavy by design)
+auth_rate_limit = rate_limit(settings.AUTH_RATE_LIMIT_ATTEMPTS, settings.AUTH_RATE_LIMIT_WINDOW)
@@ -1,19 +1,54 @@
+import time
+import hashlib
 from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
+from typing import Dict, Optional, Tuple
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, Security, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from core.config import settings
-from models.user import User
+from core.cache import cache, user_auth_key
+from models.user import User, UserAuthView
+from beanie import PydanticObjectId
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use argon2id; existing bcrypt hashes still verify and are
+# flagged for rehashing on the next successful login. Costs come from
+# settings so each deployment can tune them (hashes made with older costs
+# are also flagged for rehashing)
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="id",
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=1,
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
 security = HTTPBearer()
 
+# Parse the signing key once; jose reuses Key objects instead of
+# re-constructing them from the raw secret on every encode/decode
+_JWT_KEY = jwk.construct(settings.SECRET_KEY, settings.ALGORITHM)
+
+# Verified token payloads (per worker), keyed by a token digest. Dashboards
+# send the same token many times a second, so each one is verified at most
+# once per TTL; entries never outlive the token's own exp claim
+TOKEN_CACHE_TTL = 30
+TOKEN_CACHE_MAXSIZE = 10000
+_token_cache: Dict[str, Tuple[float, dict]] = {}
+
+# The hashing helpers below are CPU-bound (tens to hundreds of ms) and
+# synchronous; async callers run them with asyncio.to_thread so the event
+# loop keeps serving other requests. passlib compares digests in constant time.
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash"""
     return pwd_context.verify(plain_password, hashed_password)
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Verify a password and return a replacement hash if the stored one is outdated"""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
 def get_password_hash(password: str) -> str:
     """Hash a password"""
     return pwd_context.hash(password)
@@ -27,30 +62,70 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 def decode_token(token: str) -> dict:
     """Decode a JWT token"""
+    key = hashlib.sha256(token.encode()).hexdigest()[:32]
+    now = time.time()
+    entry = _token_cache.get(key)
+    if entry is not None:
+        if entry[0] > now:
+            return entry[1]
+        del _token_cache[key]
+    
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
+        payload = jwt.decode(token, _JWT_KEY, algorithms=[settings.ALGORITHM])
     except JWTError:
         raise HTTPException(status_code=401, detail="Could not validate credentials")
+    
+    expires_at = min(now + TOKEN_CACHE_TTL, payload.get("exp", now))
+    if expires_at > now:
+        if len(_token_cache) >= TOKEN_CACHE_MAXSIZE:
+            _token_cache.clear()
+        _token_cache[key] = (expires_at, payload)
+    return payload
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Security(security)) -> User:
-    """Get the current authenticated user"""
-    token = credentials.credentials
+def _token_user_id(token: str) -> str:
+    """User id (sub claim) of a valid token"""
     payload = decode_token(token)
-    
     user_id: str = payload.get("sub")
     if user_id is None:
         raise HTTPException(status_code=401, detail="Could not validate credentials")
+    return user_id
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Security(security)) -> User:
+    """Get the current authenticated user"""
+    user_id = _token_user_id(credentials.credentials)
     
+    # Always read the full document fresh: it carries the password hash,
+    # SMTP password and API keys, which must not be written to the cache.
+    # Endpoints that only need id/permissions use get_current_user_auth
     user = await User.get(user_id)
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return user
+
+async def get_current_user_auth(credentials: HTTPAuthorizationCredentials = Security(security)) -> UserAuthView:
+    """
+    Get a slim view of the authenticated user (id, plan, flags).
+
+    For endpoints that only need the caller's id or permissions; skips
+    loading credentials, API keys and other large fields of the document.
+    """
+    user_id = _token_user_id(credentials.credentials)
+    
+    key = user_auth_key(user_id)
+    cached = await cache.get(key)
+    if cached is not None:
+        return UserAuthView.model_validate(cached)
+    
+    user = await User.find_one(User.id == PydanticObjectId(user_id), projection_model=UserAuthView)
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
     
+    await cache.set(key, user.model_dump(mode="json", by_alias=True), settings.USER_DOC_CACHE_TTL)
     return user
 
 async def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
@@ -60,7 +135,7 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
     #     raise HTTPException(status_code=403, detail="Email not verified")
     return current_user
 
-async def get_admin_user(current_user: User = Depends(get_current_active_user)) -> User:
+async def get_admin_user(current_user: UserAuthView = Depends(get_current_user_auth)) -> UserAuthView:
     """Get current user if they are an admin"""
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Not enough permissions")
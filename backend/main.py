@@ -1,38 +1,90 @@
+import asyncio
+import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from core.database import connect_db, close_db
+from core.cache import cache, get_or_refresh, leads_list_key, user_settings_key
 from core.config import settings
 from api import auth, users, leads, campaigns, billing, analytics, admin, settings as settings_api, emails, chatbot
+from models.user import User
+from services.http_client import close_http_client
+from services.email_service import close_smtp_pools
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+async def warm_caches(max_users: int = settings.CACHE_WARM_USERS, concurrency: int = 20):
+    """
+    Prime the settings response and first lead page of the most recently
+    active users, so their first requests after a deploy are cache hits.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def warm(user: User):
+        async with semaphore:
+            # Same keys and defaults as GET /api/settings and GET /api/leads
+            await get_or_refresh(
+                user_settings_key(user.id),
+                lambda: settings_api._build_settings(user),
+                settings.USER_CACHE_TTL,
+            )
+            await get_or_refresh(
+                leads_list_key(user.id, 0, 10, None, None, None),
+                lambda: leads._fetch_leads_page(user.id, 0, 10, None, None, None),
+                settings.LEADS_CACHE_TTL,
+            )
+    
+    try:
+        users_to_warm = await User.find().sort(-User.updated_at).limit(max_users).to_list()
+        await asyncio.gather(*(warm(user) for user in users_to_warm))
+        logger.info(f"Warmed caches for {len(users_to_warm)} users")
+    except Exception as e:
+        logger.warning(f"Cache warming failed: {e}")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    warm_task = None
     try:
         print("🚀 Starting up the application...")
         await connect_db()
         print("✅ Database connected successfully!")
+        # Runs in the background so startup isn't delayed
+        warm_task = asyncio.create_task(warm_caches())
     except Exception as e:
         print(f"❌ Database connection failed: {e}")
         # Don't raise exception, let app start anyway
         # raise
     yield
     # Shutdown
+    if warm_task is not None:
+        warm_task.cancel()
     try:
         await close_db()
         print("✅ Database connection closed!")
     except Exception as e:
         print(f"❌ Error closing database: {e}")
+    await cache.close()
+    await close_http_client()
+    await close_smtp_pools()
 
 app = FastAPI(
     title="LeadGen AI API",
     description="B2B Smart Marketing Assistant API",
     version="1.0.0",
     lifespan=lifespan,  # Enable lifespan
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse,
 )
 
 # CORS middleware
@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import Optional
 from beanie import Document, Link
 from pydantic import Field
+from pymongo import ASCENDING
 from models.user import User
 from models.lead import Lead
 
@@ -25,6 +26,8 @@ class Campaign(Document):
             "user",
             "status",
             "created_at",
+            # Scheduler: status == "scheduled" and scheduled_at <= now
+            [("status", ASCENDING), ("scheduled_at", ASCENDING)],
         ]
 
 class CampaignRecipient(Document):
@@ -43,4 +46,6 @@ class CampaignRecipient(Document):
             "campaign",
             "lead",
             "status",
+            # Campaign progress counts by recipient status (Link is stored as a DBRef)
+            [("campaign.$id", ASCENDING), ("status", ASCENDING)],
         ]
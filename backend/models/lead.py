@@ -1,7 +1,8 @@
 from datetime import datetime
 from typing import Optional, List
-from beanie import Document, Link
-from pydantic import Field, HttpUrl
+from beanie import Document, Link, PydanticObjectId
+from pydantic import BaseModel, Field, HttpUrl
+from pymongo import ASCENDING, DESCENDING
 from models.user import User
 
 class Lead(Document):
@@ -27,6 +28,13 @@ class Lead(Document):
             "status",
             "contact_email",
             "created_at",
+            # Dashboard counts filter on owner then status, and status-filtered
+            # list pages also sort newest first (user holds the owner's ObjectId)
+            [("user", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING)],
+            # Lead list pages: owner filter, newest first, no in-memory sort
+            [("user", ASCENDING), ("created_at", DESCENDING)],
+            # has_email filters and bulk email sends
+            [("user", ASCENDING), ("contact_email", ASCENDING)],
         ]
     
     class Config:
@@ -39,3 +47,28 @@ class Lead(Document):
                 "status": "new",
             }
         }
+
+
+class LeadListView(BaseModel):
+    """Fields returned by the lead list endpoint"""
+    id: PydanticObjectId = Field(alias="_id")
+    company_name: str
+    website: Optional[str] = None
+    industry: Optional[str] = None
+    services: Optional[str] = None
+    contact_email: Optional[str] = None
+    email_subject: Optional[str] = None
+    email_body: Optional[str] = None
+    portfolio_path: Optional[str] = None
+    status: str = "new"
+    created_at: datetime
+
+
+class LeadEmailSendView(BaseModel):
+    """Fields needed to email a lead"""
+    id: PydanticObjectId = Field(alias="_id")
+    company_name: str
+    contact_email: Optional[str] = None
+    email_subject: Optional[str] = None
+    email_body: Optional[str] = None
+    status: str = "new"
@@ -1,8 +1,25 @@
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
 from beanie import Document, Link
 from pydantic import Field
+from pymongo import ASCENDING, IndexModel
 from models.user import User
 
+# (epoch seconds when the cached month ends, first day of the cached month)
+_current_month_cache = (0.0, None)
+
+def current_month_utc() -> datetime:
+    """First day of the current UTC month, recomputed only when the month rolls over"""
+    global _current_month_cache
+    expires_at, month = _current_month_cache
+    if time.time() < expires_at:
+        return month
+    
+    month = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    next_month = (month + timedelta(days=32)).replace(day=1)
+    _current_month_cache = (next_month.replace(tzinfo=timezone.utc).timestamp(), month)
+    return month
+
 class UsageTracking(Document):
     user: Link[User]
     month: datetime  # First day of the month
@@ -16,5 +33,12 @@ class UsageTracking(Document):
         indexes = [
             "user",
             "month",
-            [("user", 1), ("month", 1)],  # Compound unique index
+            # One usage document per user per month (Link is stored as a DBRef).
+            # core.migrations merges duplicate rows and drops the old
+            # non-unique user_1_month_1 index before this is built
+            IndexModel(
+                [("user.$id", ASCENDING), ("month", ASCENDING)],
+                unique=True,
+                name="user_month_unique",
+            ),
         ]
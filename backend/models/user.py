@@ -1,10 +1,11 @@
 from datetime import datetime
 from typing import Optional
-from beanie import Document
-from pydantic import EmailStr, Field
+from beanie import Document, PydanticObjectId
+from pydantic import BaseModel, EmailStr, Field
+from pymongo import ASCENDING, IndexModel
 
 class User(Document):
-    email: EmailStr = Field(..., unique=True, index=True)
+    email: EmailStr  # unique: see Settings.indexes / core.migrations
     password_hash: str
     full_name: str
     company_name: Optional[str] = None
@@ -45,7 +46,9 @@ class User(Document):
     class Settings:
         name = "users"
         indexes = [
-            "email",
+            # Replaces the old non-unique "email_1" index, which
+            # core.migrations drops (after de-duplicating) before init_beanie
+            IndexModel([("email", ASCENDING)], unique=True, name="email_unique"),
             "stripe_customer_id",
         ]
     
@@ -58,3 +61,32 @@ class User(Document):
                 "plan": "free",
             }
         }
+
+
+class LoginProjection(BaseModel):
+    """Fields needed to verify a login and build its response"""
+    id: PydanticObjectId = Field(alias="_id")
+    email: EmailStr
+    password_hash: str
+    full_name: str
+    company_name: Optional[str] = None
+    plan: str = "free"
+    email_verified: bool = False
+    avatar_url: Optional[str] = None
+
+
+class AdminUserView(BaseModel):
+    """Fields shown in the admin user list"""
+    id: PydanticObjectId = Field(alias="_id")
+    email: EmailStr
+    full_name: str
+    plan: str = "free"
+    created_at: datetime
+
+
+class UserAuthView(BaseModel):
+    """Fields needed to authorize a request (for endpoints that only need the id)"""
+    id: PydanticObjectId = Field(alias="_id")
+    plan: str = "free"
+    email_verified: bool = False
+    is_admin: bool = False
@@ -1,7 +1,23 @@
-import requests
 import json
+import hashlib
 from typing import Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 from models.user import User
+from core.cache import cache
+from core.config import settings
+from services.http_client import http_client
+
+# Longer conversations are too personal to be worth caching
+CHAT_CACHE_MAX_HISTORY = 20
+
+# orjson parses bytes directly (no decode step); its JSONDecodeError
+# subclasses json.JSONDecodeError, so callers catch the same exception
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
 
 class AIService:
     """Service for generating email content using AI (Ollama or OpenAI)"""
@@ -41,11 +57,23 @@ Return ONLY in this JSON format:
     "body": "email body here"
 }}"""
 
+        # Bulk discovery often repeats the same company/industry/description;
+        # the prompt already carries the sender, so key on provider, model and prompt
+        model = "gpt-3.5-turbo" if user.ai_provider == "openai" else user.ollama_model
+        payload = f"{user.ai_provider}\0{model}\0{prompt}"
+        cache_key = "email:" + hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             if user.ai_provider == "openai":
-                return await AIService._generate_with_openai(user, prompt)
+                email_data = await AIService._generate_with_openai(user, prompt)
             else:  # ollama
-                return await AIService._generate_with_ollama(user, prompt)
+                email_data = await AIService._generate_with_ollama(user, prompt)
+            
+            await cache.set(cache_key, email_data, settings.EMAIL_CACHE_TTL)
+            return email_data
         except Exception as e:
             print(f"❌ AI Generation Error: {str(e)}")
             # Fallback to template
@@ -72,7 +100,7 @@ Best regards,
             
             print(f"🤖 Generating email with Ollama ({model})")
             
-            response = requests.post(
+            response = await http_client.post(
                 f"{base_url}/api/generate",
                 json={
                     "model": model,
@@ -83,14 +111,14 @@ Best regards,
                 timeout=60
             )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             
             # Parse the response
             generated_text = data.get("response", "{}")
             
             # Try to extract JSON from response
             try:
-                email_data = json.loads(generated_text)
+                email_data = json_loads(generated_text)
                 if "subject" in email_data and "body" in email_data:
                     return email_data
             except json.JSONDecodeError:
@@ -124,7 +152,7 @@ Best regards,
         try:
             print(f"🤖 Generating email with OpenAI (GPT-3.5)")
             
-            response = requests.post(
+            response = await http_client.post(
                 "https://api.openai.com/v1/chat/completions",
                 headers={
                     "Authorization": f"Bearer {user.openai_api_key}",
@@ -142,10 +170,10 @@ Best regards,
                 timeout=30
             )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             
             content = data["choices"][0]["message"]["content"]
-            email_data = json.loads(content)
+            email_data = json_loads(content)
             
             return email_data
             
@@ -196,12 +224,26 @@ Keep responses professional, helpful, and focused on business growth."""
         
         # Add current user message
         messages.append({"role": "user", "content": message})
+        
+        # Identical questions (same user, model and recent context) reuse the answer
+        cache_key = None
+        if not conversation_history or len(conversation_history) <= CHAT_CACHE_MAX_HISTORY:
+            model = "gpt-3.5-turbo" if user.ai_provider == "openai" else user.ollama_model
+            payload = json.dumps({"u": str(user.id), "m": model, "msgs": messages[1:]}, sort_keys=True)
+            cache_key = "chat:" + hashlib.sha256(payload.encode()).hexdigest()
+            cached = await cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         try:
             if user.ai_provider == "openai":
-                return await AIService._chat_with_openai(user, messages)
+                response = await AIService._chat_with_openai(user, messages)
             else:  # ollama
-                return await AIService._chat_with_ollama(user, messages)
+                response = await AIService._chat_with_ollama(user, messages)
+            
+            if cache_key:
+                await cache.set(cache_key, response, settings.CHAT_CACHE_TTL)
+            return response
         except Exception as e:
             print(f"❌ Chat Error: {str(e)}")
             return "I apologize, but I'm having trouble processing your request right now. Please try again later or contact support if the issue persists."
@@ -215,7 +257,7 @@ Keep responses professional, helpful, and focused on business growth."""
         try:
             print(f"🤖 Chatting with OpenAI")
             
-            response = requests.post(
+            response = await http_client.post(
                 "https://api.openai.com/v1/chat/completions",
                 headers={
                     "Authorization": f"Bearer {user.openai_api_key}",
@@ -230,7 +272,7 @@ Keep responses professional, helpful, and focused on business growth."""
                 timeout=30
             )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             
             return data["choices"][0]["message"]["content"]
             
@@ -259,7 +301,7 @@ Keep responses professional, helpful, and focused on business growth."""
             
             prompt += "Assistant: "
             
-            response = requests.post(
+            response = await http_client.post(
                 f"{base_url}/api/generate",
                 json={
                     "model": model,
@@ -273,7 +315,7 @@ Keep responses professional, helpful, and focused on business growth."""
                 timeout=60
             )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             
             return data.get("response", "I apologize, but I couldn't generate a response.")
             
@@ -1,15 +1,101 @@
+import asyncio
 import smtplib
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+from beanie.operators import In, Set
+from bson import DBRef
 from models.user import User
 from models.lead import Lead
-from models.usage import UsageTracking
+from models.usage import UsageTracking, current_month_utc
+from core.cache import invalidate_user_leads
+from services.smtp_pool import SmtpPool, AIOSMTPLIB_AVAILABLE
 from datetime import datetime
 
+if AIOSMTPLIB_AVAILABLE:
+    import aiosmtplib
+    _AIOSMTPLIB_AUTH_ERRORS = (aiosmtplib.SMTPAuthenticationError,)
+    _AIOSMTPLIB_ERRORS = (aiosmtplib.SMTPException,)
+else:
+    _AIOSMTPLIB_AUTH_ERRORS = ()
+    _AIOSMTPLIB_ERRORS = ()
+
+# Single sends reuse one logged-in session per user (and SMTP account);
+# pools unused for this long are closed
+SMTP_POOL_IDLE_TIMEOUT = 300
+_user_pools: Dict[tuple, Tuple[SmtpPool, float]] = {}
+
+
+async def _user_pool(user: User) -> SmtpPool:
+    """Persistent single-connection pool for a user's SMTP account"""
+    now = time.monotonic()
+    for key, (pool, last_used) in list(_user_pools.items()):
+        if now - last_used > SMTP_POOL_IDLE_TIMEOUT:
+            del _user_pools[key]
+            await pool.close()
+    
+    # Keyed on the credentials too, so changed settings get a fresh session
+    key = (str(user.id), user.smtp_host, user.smtp_port, user.smtp_username, user.smtp_password)
+    entry = _user_pools.get(key)
+    pool = entry[0] if entry else SmtpPool(
+        user.smtp_host,
+        user.smtp_port,
+        user.smtp_username,
+        user.smtp_password,
+        max_connections=1,
+        max_idle=SMTP_POOL_IDLE_TIMEOUT,
+    )
+    _user_pools[key] = (pool, now)
+    return pool
+
+
+async def close_smtp_pools():
+    """Close all cached per-user SMTP sessions (on application shutdown)"""
+    while _user_pools:
+        _, (pool, _) = _user_pools.popitem()
+        await pool.close()
+
 class EmailService:
     """Service for sending emails via SMTP"""
     
+    @staticmethod
+    def build_message(
+        user: User,
+        lead: Lead,
+        subject: Optional[str] = None,
+        body: Optional[str] = None,
+    ) -> MIMEMultipart:
+        """Build the plain-text + HTML message for a lead (pure, no I/O)"""
+        # Use provided subject/body or lead's default
+        email_subject = subject or lead.email_subject or f"Partnership Opportunity with {user.company_name}"
+        email_body = body or lead.email_body or "Hello, we'd like to discuss a partnership opportunity."
+        
+        # Create message
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = email_subject
+        msg['From'] = f"{user.smtp_from_name or user.full_name} <{user.smtp_from_email}>"
+        msg['To'] = lead.contact_email
+        
+        # Add plain text and HTML versions
+        text_part = MIMEText(email_body, 'plain')
+        html_body = email_body.replace('\n', '<br>')
+        html_part = MIMEText(f"""
+        <html>
+          <body>
+            <p>{html_body}</p>
+            <br>
+            <p>Best regards,<br>
+            {user.smtp_from_name or user.full_name}<br>
+            {user.company_name or ''}</p>
+          </body>
+        </html>
+        """, 'html')
+        
+        msg.attach(text_part)
+        msg.attach(html_part)
+        return msg
+    
     @staticmethod
     async def send_email(
         user: User,
@@ -44,50 +130,22 @@ class EmailService:
                 "error": "Lead has no email address"
             }
         
-        # Use provided subject/body or lead's default
-        email_subject = subject or lead.email_subject or f"Partnership Opportunity with {user.company_name}"
-        email_body = body or lead.email_body or "Hello, we'd like to discuss a partnership opportunity."
-        
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = email_subject
-            msg['From'] = f"{user.smtp_from_name or user.full_name} <{user.smtp_from_email}>"
-            msg['To'] = lead.contact_email
-            
-            # Add plain text and HTML versions
-            text_part = MIMEText(email_body, 'plain')
-            html_body = email_body.replace('\n', '<br>')
-            html_part = MIMEText(f"""
-            <html>
-              <body>
-                <p>{html_body}</p>
-                <br>
-                <p>Best regards,<br>
-                {user.smtp_from_name or user.full_name}<br>
-                {user.company_name or ''}</p>
-              </body>
-            </html>
-            """, 'html')
+            msg = EmailService.build_message(user, lead, subject, body)
             
-            msg.attach(text_part)
-            msg.attach(html_part)
+            print(f"📧 Sending email to {lead.contact_email} via {user.smtp_host}:{user.smtp_port}")
+            if AIOSMTPLIB_AVAILABLE:
+                pool = await _user_pool(user)
+                await pool.send(msg)
+            else:
+                await asyncio.to_thread(EmailService._send_blocking, user, msg)
+            print(f"   ✅ Email sent successfully!")
             
-            # Connect to SMTP server and send
-            print(f"📧 Connecting to SMTP server {user.smtp_host}:{user.smtp_port}")
-            
-            with smtplib.SMTP(user.smtp_host, user.smtp_port) as server:
-                server.starttls()  # Secure the connection
-                print(f"   Logging in as {user.smtp_username}")
-                server.login(user.smtp_username, user.smtp_password)
-                print(f"   Sending email to {lead.contact_email}")
-                server.send_message(msg)
-                print(f"   ✅ Email sent successfully!")
-            
-            # Update lead status
+            # Update lead status (targeted update, so projected leads work too)
             lead.status = 'contacted'
-            lead.updated_at = datetime.utcnow()
-            await lead.save()
+            await Lead.find_one(Lead.id == lead.id).update(
+                Set({Lead.status: 'contacted', Lead.updated_at: datetime.utcnow()})
+            )
             
             # Track email usage
             await EmailService.track_email_sent(user)
@@ -97,12 +155,12 @@ class EmailService:
                 "message": f"Email sent successfully to {lead.contact_email}"
             }
             
-        except smtplib.SMTPAuthenticationError:
+        except (smtplib.SMTPAuthenticationError, *_AIOSMTPLIB_AUTH_ERRORS):
             return {
                 "success": False,
                 "error": "SMTP authentication failed. Please check your username and password."
             }
-        except smtplib.SMTPException as e:
+        except (smtplib.SMTPException, *_AIOSMTPLIB_ERRORS) as e:
             return {
                 "success": False,
                 "error": f"SMTP error: {str(e)}"
@@ -113,6 +171,76 @@ class EmailService:
                 "error": f"Failed to send email: {str(e)}"
             }
     
+    @staticmethod
+    def _send_blocking(user: User, msg: MIMEMultipart):
+        """Send one message on a fresh smtplib connection (used without aiosmtplib)"""
+        with smtplib.SMTP(user.smtp_host, user.smtp_port, timeout=30) as server:
+            server.starttls()  # Secure the connection
+            server.login(user.smtp_username, user.smtp_password)
+            server.send_message(msg)
+    
+    @staticmethod
+    async def send_bulk(user: User, leads: List[Lead], max_concurrency: int = 5) -> List[dict]:
+        """
+        Send emails to many leads over a small pool of persistent SMTP sessions
+        
+        Args:
+            user: User object with SMTP configuration
+            leads: Leads to email (each must have contact_email)
+            max_concurrency: Simultaneous sends / open connections
+            
+        Returns:
+            List of per-lead dicts with success status, in the order of `leads`
+        """
+        if not all([user.smtp_host, user.smtp_port, user.smtp_username,
+                   user.smtp_password, user.smtp_from_email]):
+            error = "SMTP not configured. Please configure SMTP settings first."
+            return [{"success": False, "error": error} for _ in leads]
+        
+        if not AIOSMTPLIB_AVAILABLE:
+            # One connection per email, sequentially
+            return [await EmailService.send_email(user=user, lead=lead) for lead in leads]
+        
+        pool = SmtpPool(
+            user.smtp_host,
+            user.smtp_port,
+            user.smtp_username,
+            user.smtp_password,
+            max_connections=max_concurrency,
+        )
+        
+        # Template every message up front so the send phase is pure I/O
+        messages = [EmailService.build_message(user, lead) for lead in leads]
+        
+        async def send_one(lead: Lead, msg: MIMEMultipart) -> dict:
+            try:
+                await pool.send(msg)
+                return {"success": True, "message": f"Email sent successfully to {lead.contact_email}"}
+            except Exception as e:
+                return {"success": False, "error": f"Failed to send email: {str(e)}"}
+        
+        try:
+            results = await asyncio.gather(*(send_one(lead, msg) for lead, msg in zip(leads, messages)))
+        finally:
+            await pool.close()
+        
+        # Record all successful sends with one update each for leads and usage
+        sent_ids = [lead.id for lead, result in zip(leads, results) if result["success"]]
+        if sent_ids:
+            await Lead.find(In(Lead.id, sent_ids)).update(
+                Set({Lead.status: 'contacted', Lead.updated_at: datetime.utcnow()})
+            )
+            await EmailService.track_email_sent(user, count=len(sent_ids))
+        
+        return results
+    
+    @staticmethod
+    def _login_blocking(user: User):
+        """Connect and log in with smtplib (used without aiosmtplib)"""
+        with smtplib.SMTP(user.smtp_host, user.smtp_port, timeout=10) as server:
+            server.starttls()
+            server.login(user.smtp_username, user.smtp_password)
+    
     @staticmethod
     async def test_smtp_connection(user: User) -> dict:
         """Test SMTP connection with user's settings"""
@@ -123,9 +251,21 @@ class EmailService:
             }
         
         try:
-            with smtplib.SMTP(user.smtp_host, user.smtp_port, timeout=10) as server:
-                server.starttls()
-                server.login(user.smtp_username, user.smtp_password)
+            if AIOSMTPLIB_AVAILABLE:
+                smtp = aiosmtplib.SMTP(
+                    hostname=user.smtp_host,
+                    port=user.smtp_port,
+                    timeout=10,
+                    use_tls=user.smtp_port == 465,
+                    start_tls=user.smtp_port != 465,
+                )
+                await smtp.connect()
+                try:
+                    await smtp.login(user.smtp_username, user.smtp_password)
+                finally:
+                    smtp.close()
+            else:
+                await asyncio.to_thread(EmailService._login_blocking, user)
             
             return {
                 "success": True,
@@ -138,23 +278,22 @@ class EmailService:
             }
     
     @staticmethod
-    async def track_email_sent(user: User):
+    async def track_email_sent(user: User, count: int = 1):
         """Track email usage for analytics"""
-        current_month = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        current_month = current_month_utc()
         
-        # Find or create usage tracking for current month
-        usage = await UsageTracking.find_one(
-            UsageTracking.user.id == user.id,
-            UsageTracking.month == current_month
+        # Single atomic upsert, so concurrent sends can't lose increments
+        await UsageTracking.get_motor_collection().update_one(
+            {"user.$id": user.id, "month": current_month},
+            {
+                "$inc": {"emails_sent": count},
+                "$setOnInsert": {
+                    "user": DBRef(User.Settings.name, user.id),
+                    "leads_discovered": 0,
+                    "api_calls": 0,
+                    "pdfs_generated": 0,
+                },
+            },
+            upsert=True,
         )
-        
-        if not usage:
-            usage = UsageTracking(
-                user=user,
-                month=current_month,
-                emails_sent=1
-            )
-        else:
-            usage.emails_sent += 1
-        
-        await usage.save()
+        await invalidate_user_leads(user.id)
@@ -5,7 +5,9 @@ from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from models.user import User
+from beanie.operators import Set
 from models.lead import Lead
+from core.cache import invalidate_user
 from datetime import datetime
 
 class GoogleSheetsService:
@@ -123,7 +125,8 @@ class GoogleSheetsService:
                 # Create new sheet
                 sheet_id = await GoogleSheetsService.create_or_get_sheet(user)
                 user.google_sheet_id = sheet_id
-                await user.save()
+                await User.find_one(User.id == user.id).update(Set({User.google_sheet_id: sheet_id}))
+                await invalidate_user(user.id)
             
             # Prepare lead data
             values = []
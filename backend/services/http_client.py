@@ -0,0 +1,19 @@
+"""
+Shared async HTTP client for outbound API calls (OpenAI, Ollama, SerpAPI,
+Hunter.io).
+
+One client per process keeps connections alive between calls and, unlike
+`requests`, doesn't block the event loop while waiting on slow APIs.
+"""
+import httpx
+
+http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=60,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+)
+
+
+async def close_http_client():
+    """Close pooled connections (on application shutdown)"""
+    await http_client.aclose()
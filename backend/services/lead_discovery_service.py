@@ -9,18 +9,51 @@ from typing import List, Dict
 from models.user import User
 from models.lead import Lead
 from models.usage import UsageTracking
+from core.cache import invalidate_user, invalidate_user_leads
 from services.search_service import SearchService
 from services.ai_service import AIService
 from services.google_sheets_service import GoogleSheetsService
-from beanie import Link
+from beanie import Link, PydanticObjectId
 from datetime import datetime
 import asyncio
 
+# Businesses enriched (email lookup + AI email) at the same time per task
+DISCOVERY_CONCURRENCY = 10
+
+async def reserve_lead_quota(user_id, count: int) -> bool:
+    """
+    Atomically add `count` to the user's leads_used if it stays within
+    lead_limit. Returns False (and changes nothing) if it would not.
+    """
+    result = await User.get_motor_collection().update_one(
+        {
+            "_id": PydanticObjectId(user_id),
+            "$expr": {"$lte": [{"$add": ["$leads_used", count]}, "$lead_limit"]},
+        },
+        {"$inc": {"leads_used": count}},
+    )
+    return result.modified_count == 1
+
+async def release_lead_quota(user_id, count: int):
+    """Give back reserved leads that were not generated"""
+    if count <= 0:
+        return
+    await User.get_motor_collection().update_one(
+        {"_id": PydanticObjectId(user_id)},
+        {"$inc": {"leads_used": -count}},
+    )
+    await invalidate_user(user_id)
+
 async def discover_leads_task(task_id: str, user_id: str, request_data: dict):
     """
     Background task to discover leads using real APIs (SerpAPI + Hunter.io)
     Saves results to MongoDB and optionally to Google Sheets
+
+    The endpoint has already reserved `max_leads` against the user's limit;
+    whatever isn't saved is released when the task finishes.
     """
+    max_leads = request_data.get('max_leads', 10)
+    saved_count = 0
     try:
         print(f"🚀 Starting lead discovery task: {task_id}")
         print(f"   User ID: {user_id}")
@@ -34,14 +67,13 @@ async def discover_leads_task(task_id: str, user_id: str, request_data: dict):
         # Prepare parameters
         industry = request_data.get('target_industry', 'businesses')
         region = request_data.get('target_region', 'United States')
-        max_leads = request_data.get('max_leads', 10)
         
         print(f"📊 Discovering leads for {industry} in {region}")
         
         # Check if SerpAPI is configured
         if not user.serpapi_key:
             print(f"⚠️ SerpAPI not configured, creating demo leads")
-            await _create_demo_leads(user, request_data, task_id)
+            saved_count = await _create_demo_leads(user, request_data, task_id)
             return
         
         # Search for businesses
@@ -55,69 +87,69 @@ async def discover_leads_task(task_id: str, user_id: str, request_data: dict):
         if isinstance(businesses, dict) and "error" in businesses:
             print(f"❌ Search failed: {businesses['error']}")
             print(f"⚠️ Falling back to demo leads")
-            await _create_demo_leads(user, request_data, task_id)
+            saved_count = await _create_demo_leads(user, request_data, task_id)
             return
         
         if not businesses:
             print(f"⚠️ No businesses found, creating demo leads")
-            await _create_demo_leads(user, request_data, task_id)
+            saved_count = await _create_demo_leads(user, request_data, task_id)
             return
         
         print(f"✅ Found {len(businesses)} businesses")
         
-        # Process each business
-        saved_count = 0
-        leads_to_export = []
+        # Process businesses concurrently (email lookup + AI generation are
+        # network-bound), with a cap so the APIs aren't flooded
+        semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
         
-        for business_data in businesses:
-            try:
-                company_name = business_data.get('company_name', 'Unknown')
-                website = business_data.get('website', '')
-                description = business_data.get('description', '')
-                
-                # Find email if Hunter.io is configured
-                contact_email = None
-                if website and user.hunter_api_key:
-                    contact_email = await SearchService.find_email(
+        async def process_business(business_data: dict):
+            async with semaphore:
+                try:
+                    company_name = business_data.get('company_name', 'Unknown')
+                    website = business_data.get('website', '')
+                    description = business_data.get('description', '')
+                    
+                    # Find email if Hunter.io is configured
+                    contact_email = None
+                    if website and user.hunter_api_key:
+                        contact_email = await SearchService.find_email(
+                            user=user,
+                            domain=website,
+                            company_name=company_name
+                        )
+                    
+                    # Generate personalized email using AI
+                    email_data = await AIService.generate_email(
                         user=user,
-                        domain=website,
-                        company_name=company_name
+                        company_name=company_name,
+                        industry=industry,
+                        description=description
                     )
-                
-                # Generate personalized email using AI
-                email_data = await AIService.generate_email(
-                    user=user,
-                    company_name=company_name,
-                    industry=industry,
-                    description=description
-                )
-                
-                # Create Lead document
-                lead = Lead(
-                    user=Link(user.id, User),
-                    company_name=company_name,
-                    website=website,
-                    industry=industry,
-                    services=description[:500] if description else f"Services in {industry}",
-                    contact_email=contact_email,
-                    email_subject=email_data.get('subject', ''),
-                    email_body=email_data.get('body', ''),
-                    status='new',
-                    created_at=datetime.utcnow(),
-                )
-                
-                await lead.insert()
-                saved_count += 1
-                leads_to_export.append(lead)
-                print(f"   💾 Saved: {company_name} {f'({contact_email})' if contact_email else ''}")
-                
-                # Increment user's leads_used counter
-                user.leads_used += 1
-                await user.save()
-                
-            except Exception as e:
-                print(f"   ❌ Error saving lead: {str(e)}")
-                continue
+                    
+                    # Create Lead document
+                    lead = Lead(
+                        user=Link(user.id, User),
+                        company_name=company_name,
+                        website=website,
+                        industry=industry,
+                        services=description[:500] if description else f"Services in {industry}",
+                        contact_email=contact_email,
+                        email_subject=email_data.get('subject', ''),
+                        email_body=email_data.get('body', ''),
+                        status='new',
+                        created_at=datetime.utcnow(),
+                    )
+                    
+                    await lead.insert()
+                    print(f"   💾 Saved: {company_name} {f'({contact_email})' if contact_email else ''}")
+                    return lead
+                    
+                except Exception as e:
+                    print(f"   ❌ Error saving lead: {str(e)}")
+                    return None
+        
+        results = await asyncio.gather(*(process_business(b) for b in businesses))
+        leads_to_export = [lead for lead in results if lead is not None]
+        saved_count = len(leads_to_export)
         
         print(f"✅ Saved {saved_count} leads to database")
         
@@ -135,6 +167,9 @@ async def discover_leads_task(task_id: str, user_id: str, request_data: dict):
                 import traceback
                 traceback.print_exc()
         
+        await invalidate_user_leads(user.id)
+        await invalidate_user(user.id)
+        
         # Update usage tracking
         usage = await UsageTracking.find_one(UsageTracking.user.id == user.id)
         if usage:
@@ -148,10 +183,11 @@ async def discover_leads_task(task_id: str, user_id: str, request_data: dict):
         import traceback
         traceback.print_exc()
     finally:
+        await release_lead_quota(user_id, max_leads - saved_count)
         print(f"🏁 Lead discovery task completed: {task_id}")
 
-async def _create_demo_leads(user: User, request_data: dict, task_id: str):
-    """Create demo leads for testing when discovery fails"""
+async def _create_demo_leads(user: User, request_data: dict, task_id: str) -> int:
+    """Create demo leads for testing when discovery fails; returns how many were saved"""
     print(f"Creating demo leads for testing...")
     print(f"   User info: ID={user.id}, Email={user.email}")
     
@@ -204,10 +240,6 @@ async def _create_demo_leads(user: User, request_data: dict, task_id: str):
             saved_count += 1
             print(f"   💾 Created demo lead: {lead.company_name}")
             
-            # Increment user's leads_used counter
-            user.leads_used += 1
-            await user.save()
-            
         except Exception as e:
             print(f"   ⚠️  Failed to create demo lead: {e}")
             continue
@@ -219,7 +251,7 @@ async def _create_demo_leads(user: User, request_data: dict, task_id: str):
         try:
             print(f"📊 Attempting to export {saved_count} demo leads to Google Sheets...")
             # Get the leads we just created
-            demo_leads = await Lead.find(Lead.user.id == user.id).sort(-Lead.created_at).limit(saved_count).to_list()
+            demo_leads = await Lead.find(Lead.user == user.id).sort(-Lead.created_at).limit(saved_count).to_list()
             result = await GoogleSheetsService.export_leads(user, demo_leads)
             if result.get('success'):
                 print(f"✅ Exported demo leads to Google Sheets: {result.get('sheet_url')}")
@@ -230,6 +262,9 @@ async def _create_demo_leads(user: User, request_data: dict, task_id: str):
             import traceback
             traceback.print_exc()
     
+    await invalidate_user_leads(user.id)
+    await invalidate_user(user.id)
+    
     # Update usage tracking
     usage = await UsageTracking.find_one(UsageTracking.user.id == user.id)
     if usage:
@@ -237,3 +272,5 @@ async def _create_demo_leads(user: User, request_data: dict, task_id: str):
         usage.updated_at = datetime.utcnow()
         await usage.save()
         print(f"📊 Updated usage: +{saved_count} leads")
+    
+    return saved_count
@@ -1,7 +1,8 @@
-import requests
 import json
+import httpx
 from typing import List, Dict, Optional
 from models.user import User
+from services.http_client import http_client
 
 class SearchService:
     """Service for searching businesses using SerpAPI"""
@@ -41,7 +42,7 @@ class SearchService:
             }
             
             print(f"🔍 Searching Google: {query}")
-            response = requests.get("https://serpapi.com/search", params=params, timeout=30)
+            response = await http_client.get("https://serpapi.com/search", params=params, timeout=30)
             response.raise_for_status()
             data = response.json()
             
@@ -77,7 +78,7 @@ class SearchService:
             print(f"📊 Total businesses found: {len(businesses)}")
             return businesses
             
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             print(f"❌ SerpAPI Error: {str(e)}")
             return {"error": f"Search failed: {str(e)}"}
         except Exception as e:
@@ -125,7 +126,7 @@ class SearchService:
                 "limit": 1,
             }
             
-            response = requests.get(url, params=params, timeout=15)
+            response = await http_client.get(url, params=params, timeout=15)
             response.raise_for_status()
             data = response.json()
             
@@ -139,7 +140,7 @@ class SearchService:
                 print(f"   ⚠️ No email found for {domain}")
                 return None
                 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             print(f"   ❌ Hunter.io Error: {str(e)}")
             return None
         except Exception as e:
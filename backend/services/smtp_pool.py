@@ -0,0 +1,119 @@
+"""
+Pool of persistent SMTP sessions for bulk sending.
+
+Each connection performs STARTTLS and login once and is reused for up to
+`max_messages` sends (or until idle for `max_idle` seconds) before being
+recycled, instead of paying the TCP + TLS + AUTH handshake for every email.
+"""
+import asyncio
+import random
+import time
+from contextlib import asynccontextmanager
+from email.message import Message
+from typing import List, Tuple
+
+try:
+    import aiosmtplib
+    AIOSMTPLIB_AVAILABLE = True
+except ImportError:
+    AIOSMTPLIB_AVAILABLE = False
+
+# Temporary SMTP replies (service unavailable, mailbox busy, local error,
+# insufficient storage) worth retrying with backoff
+RETRYABLE_SMTP_CODES = (421, 450, 451, 452)
+
+
+class SmtpPool:
+    """Bounded pool of logged-in aiosmtplib connections to one server"""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        max_connections: int = 5,
+        max_messages: int = 100,
+        max_idle: float = 60,
+        timeout: float = 30,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.max_messages = max_messages
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self._slots = asyncio.Semaphore(max_connections)
+        self._idle: List[Tuple[object, float]] = []  # (connection, released at)
+        self._sent = {}
+
+    async def _connect(self):
+        # Port 465 is implicit TLS; everything else upgrades with STARTTLS
+        smtp = aiosmtplib.SMTP(
+            hostname=self.host,
+            port=self.port,
+            timeout=self.timeout,
+            use_tls=self.port == 465,
+            start_tls=self.port != 465,
+        )
+        await smtp.connect()
+        await smtp.login(self.username, self.password)
+        self._sent[smtp] = 0
+        return smtp
+
+    async def _discard(self, smtp):
+        self._sent.pop(smtp, None)
+        try:
+            await smtp.quit()
+        except Exception:
+            smtp.close()
+
+    async def _checkout(self):
+        # Servers drop idle sessions on their own; don't hand those out
+        while self._idle:
+            smtp, released_at = self._idle.pop()
+            if smtp.is_connected and time.monotonic() - released_at < self.max_idle:
+                return smtp
+            await self._discard(smtp)
+        return await self._connect()
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Borrow a connection, opening one if none is idle"""
+        async with self._slots:
+            smtp = await self._checkout()
+            try:
+                yield smtp
+            except Exception:
+                # The session state is unknown after a failure; don't reuse it
+                await self._discard(smtp)
+                raise
+
+            self._sent[smtp] += 1
+            if self._sent[smtp] >= self.max_messages or not smtp.is_connected:
+                await self._discard(smtp)
+            else:
+                self._idle.append((smtp, time.monotonic()))
+
+    async def send(self, message: Message, max_attempts: int = 4):
+        """Send a message, retrying temporary SMTP failures with backoff"""
+        delay = 1.0
+        for attempt in range(1, max_attempts + 1):
+            try:
+                async with self.acquire() as smtp:
+                    return await smtp.send_message(message)
+            except aiosmtplib.SMTPResponseException as e:
+                if e.code not in RETRYABLE_SMTP_CODES or attempt == max_attempts:
+                    raise
+            except aiosmtplib.SMTPServerDisconnected:
+                if attempt == max_attempts:
+                    raise
+            await asyncio.sleep(delay + random.random())
+            delay *= 2
+
+    async def close(self):
+        """Close all idle connections"""
+        while self._idle:
+            smtp, _ = self._idle.pop()
+            await self._discard(smtp)
@@ -14,11 +14,10 @@ from typing import Optional
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# AIGenerator, PortfolioGenerator and SheetsManager are imported where they are
+# used so email/analytics/validate commands don't load OpenAI, ReportLab or Google APIs
 from src.core.web_analyzer import WebAnalyzer
 from src.core.lead_discovery import LeadDiscovery
-from src.core.ai_generator import AIGenerator
-from src.core.portfolio_generator import PortfolioGenerator
-from src.core.sheets_manager import SheetsManager
 from src.utils.logger import setup_logger, get_logger
 from src.utils.config import get_config
 from src.utils.analytics import Analytics
@@ -41,6 +40,8 @@ class SmartMarketingAssistant:
     
     def __init__(self):
         """Initialize the Smart Marketing Assistant."""
+        from src.core import AIGenerator, PortfolioGenerator, SheetsManager
+        
         self.config = get_config()
         self.logger = setup_logger("SmartMarketingAssistant", self.config.LOG_LEVEL)
         
@@ -150,25 +151,22 @@ class SmartMarketingAssistant:
                     else:
                         website_content = lead.get('description', '')
                     
+                    # Truncate once per lead; the AI prompts take pre-sliced snippets
+                    website_snippet = website_content[:self.ai_generator.SUMMARY_SNIPPET_CHARS]
+                    
                     # Track industry
                     if lead['industry'] not in results['industries']:
                         results['industries'].append(lead['industry'])
                     
-                    # Step 4: Match services
-                    print("  🎯 Matching services...")
-                    matched_services = self.ai_generator.match_services_to_lead(
-                        your_business['services'],
-                        lead,
-                        website_content
-                    )
-                    
-                    # Step 5: Generate email
-                    print("  ✉️  Generating personalized email...")
-                    email_content = self.ai_generator.generate_outreach_email(
+                    # Step 4-5: Match services and generate email in a single AI call
+                    print("  🎯 Matching services and generating personalized email...")
+                    email_content = self.ai_generator.generate_lead_package(
                         your_business,
                         lead,
-                        matched_services
+                        your_business['services'],
+                        website_snippet
                     )
+                    matched_services = email_content['matched_services']
                     
                     if email_content.get('success'):
                         results['emails_generated'] += 1
@@ -325,6 +323,8 @@ def handle_send_single_email(lead_index: int):
     print(f"\n📧 Sending email to lead #{lead_index}...\n")
     
     try:
+        from src.core import SheetsManager
+        
         sheets_manager = SheetsManager()
         email_sender = EmailSender()
         
@@ -397,6 +397,8 @@ def handle_send_all_emails():
     print("\n📧 Sending emails to all unsent leads...\n")
     
     try:
+        from src.core import SheetsManager
+        
         sheets_manager = SheetsManager()
         email_sender = EmailSender()
         
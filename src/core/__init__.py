@@ -1,18 +1,39 @@
 """
 Core Module Initialization
 Exports main classes and functions from core modules.
+
+AIGenerator, PortfolioGenerator and SheetsManager are imported lazily on first
+access so that code paths which don't need OpenAI, ReportLab or the Google API
+client don't pay for importing them.
 """
 
+from importlib import import_module
+
 from .web_analyzer import WebAnalyzer
 from .lead_discovery import LeadDiscovery
-from .ai_generator import AIGenerator
-from .portfolio_generator import PortfolioGenerator
-from .sheets_manager import SheetsManager
+
+_LAZY_EXPORTS = {
+    'AIGenerator': '.ai_generator',
+    'AsyncAIGenerator': '.ai_generator',
+    'PortfolioGenerator': '.portfolio_generator',
+    'SheetsManager': '.sheets_manager',
+}
 
 __all__ = [
     'WebAnalyzer',
     'LeadDiscovery',
     'AIGenerator',
+    'AsyncAIGenerator',
     'PortfolioGenerator',
     'SheetsManager'
 ]
+
+
+def __getattr__(name):
+    """Import heavy core classes on first access (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
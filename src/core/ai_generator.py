@@ -12,11 +12,99 @@ Features:
 - Tone customization
 """
 
+import asyncio
+import functools
+import hashlib
+import json
+import re
+import string
+import threading
+import time
 import openai
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional
 from src.utils.logger import LoggerMixin
 from src.utils.config import get_config
+from src.utils.dns_cache import install_dns_cache
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    EMBEDDINGS_AVAILABLE = True
+except ImportError:
+    EMBEDDINGS_AVAILABLE = False
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# OpenAI sampling settings; token budgets are sized per task to keep decode time short
+OPENAI_TEMPERATURE = 0.7
+OPENAI_MAX_TOKENS = {
+    "email": 320,     # 150-200 word email plus subject and sign-off
+    "summary": 160,   # 2-3 sentences
+    "match": 120,     # 3-5 service names
+    "package": 640,   # summary + services + email as JSON
+}
+OPENAI_DEFAULT_MAX_TOKENS = 500
+OPENAI_LATENCY_EXTRA_BODY = {"performance_config": {"latency": "optimized"}}
+
+# "SUBJECT: ... BODY: ..." layout requested by the email prompt; both markers
+# are required, case-sensitive, and BODY: must start a line
+_EMAIL_RE = re.compile(r'\s*SUBJECT:\s*(.*?)\s*^BODY:\s*(.*?)\s*\Z', re.DOTALL | re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=32)
+def _your_business_block(name: str, description: str, services: tuple) -> str:
+    """
+    Build the campaign-invariant head of the email prompt.
+    
+    Args:
+        name: Your business name
+        description: Your business description
+        services: Up to five of your services
+    
+    Returns:
+        Prompt head describing your company
+    """
+    return f"""You are a B2B marketing expert writing a personalized outreach email.
+
+YOUR COMPANY:
+- Name: {name}
+- Description: {description}
+- Services: {', '.join(services)}
+
+"""
 
 
 class AIGenerator(LoggerMixin):
@@ -30,20 +118,167 @@ class AIGenerator(LoggerMixin):
     - Value propositions
     """
     
+    SYSTEM_PROMPT = "You are an expert B2B marketing copywriter specializing in personalized outreach."
+    
+    # Lead count above which OpenAI batch email generation goes through the Batch API
+    BATCH_API_THRESHOLD = 1000
+    
+    # Website content length expected by summarize_lead_business / match_services_to_lead
+    SUMMARY_SNIPPET_CHARS = 1000
+    MATCH_SNIPPET_CHARS = 500
+    
+    # Number of services returned by embedding-based matching
+    EMBEDDING_TOP_K = 5
+    
+    # Ollama decoding limits sized for the fixed prompt shape (~1k tokens in, <=500 out)
+    OLLAMA_OPTIONS = {
+        "num_predict": 500,
+        "num_ctx": 2048,
+        "num_batch": 512
+    }
+    
+    _SUMMARY_TMPL = string.Template("""
+Analyze the following information about a company and provide a concise 2-3 sentence summary of their business:
+
+Company: $company
+Website: $website
+Industry: $industry
+
+Website Content:
+$content
+
+Provide a clear, professional summary of what this company does and their main offerings.
+""")
+    
+    _MATCH_TMPL = string.Template("""
+Analyze which services would be most relevant and valuable for this company:
+
+LEAD COMPANY:
+Name: $company
+Industry: $industry
+Description: $description
+
+Website Content Summary:
+$content
+
+AVAILABLE SERVICES:
+$services
+
+TASK:
+Select the 3-5 most relevant services that would benefit this company. Return ONLY the exact service names, one per line, without numbers or explanations.
+""")
+    
+    _PACKAGE_TMPL = string.Template("""
+You are a B2B marketing expert preparing outreach for a lead. Complete all three tasks.
+
+YOUR COMPANY:
+- Name: $your_name
+- Description: $your_description
+
+LEAD COMPANY:
+- Name: $company
+- Website: $website
+- Industry: $industry
+- Description: $description
+
+Website Content:
+$content
+
+AVAILABLE SERVICES:
+$services
+
+TASK 1 SUMMARIZE:
+Write a concise 2-3 sentence summary of what the lead company does and their main offerings.
+
+TASK 2 MATCH SERVICES:
+Select the 3-5 most relevant services for the lead, copied exactly from AVAILABLE SERVICES.
+
+TASK 3 WRITE EMAIL:
+Write a personalized B2B outreach email with a $tone tone (150-200 words) that highlights how
+the matched services benefit their business, focuses on value, includes a clear call-to-action,
+uses their company name and ends with "Best regards,\n$your_name".
+
+OUTPUT JSON SCHEMA:
+Return ONLY a JSON object with exactly these keys:
+{"summary": string, "matched_services": [string], "email_subject": string, "email_body": string}
+""")
+    
     def __init__(self):
         """Initialize AI Generator with API configuration."""
         self.setup_logging("AIGenerator")
         self.config = get_config()
         
+        # Reuse hostname lookups for repeated OpenAI/Ollama calls
+        install_dns_cache(ttl=self.config.DNS_CACHE_TTL)
+        
+        # Pooled HTTP session per thread (requests.Session isn't thread-safe),
+        # so back-to-back Ollama calls reuse connections, including from the
+        # worker threads of generate_outreach_emails_batch
+        self._thread_local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+        
+        # Numbered service lists for match prompts, keyed by services tuple
+        self._services_text_cache: Dict[tuple, str] = {}
+        
+        # Cache of AI responses keyed by prompt hash (persistent when diskcache is installed)
+        self._cache = None
+        if self.config.AI_CACHE_ENABLED:
+            if DISKCACHE_AVAILABLE:
+                self._cache = diskcache.Cache(str(self.config.CACHE_DIR / 'ai_cache'))
+            else:
+                self._cache = {}
+        
+        # Local embedding model for service matching
+        self._embedder = None
+        self._service_embeddings = {}
+        if self.config.USE_EMBEDDING_MATCH:
+            if EMBEDDINGS_AVAILABLE:
+                self._embedder = SentenceTransformer(self.config.EMBEDDING_MODEL)
+                self.log_info(f"Using embedding model for service matching: {self.config.EMBEDDING_MODEL}")
+            else:
+                self.log_warning("USE_EMBEDDING_MATCH is set but sentence-transformers is not installed")
+        
         # Configure AI backend
         if self.config.USE_OLLAMA:
             self.backend = "ollama"
-            self.log_info(f"Using Ollama with model: {self.config.OLLAMA_MODEL}")
+            self.log_info(
+                f"Using Ollama with models: email={self.config.OLLAMA_MODEL_EMAIL}, "
+                f"summary={self.config.OLLAMA_MODEL_SUMMARY}, match={self.config.OLLAMA_MODEL_MATCH}"
+            )
         else:
             self.backend = "openai"
             openai.api_key = self.config.OPENAI_API_KEY
             self.log_info(f"Using OpenAI with model: {self.config.OPENAI_MODEL}")
     
+    @property
+    def session(self) -> requests.Session:
+        """Pooled HTTP session of the calling thread."""
+        session = getattr(self._thread_local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update({
+                'Content-Type': 'application/json',
+                'Connection': 'keep-alive'
+            })
+            self._thread_local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+    
+    def close(self):
+        """Close the underlying HTTP sessions and release pooled connections."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._thread_local = threading.local()
+        if DISKCACHE_AVAILABLE and isinstance(self._cache, diskcache.Cache):
+            self._cache.close()
+    
     def generate_outreach_email(self, 
                                 your_business: Dict,
                                 lead: Dict,
@@ -75,12 +310,175 @@ class AIGenerator(LoggerMixin):
             prompt = self._build_email_prompt(your_business, lead, matched_services, tone)
             
             # Generate email
-            if self.backend == "openai":
-                response = self._generate_with_openai(prompt)
+            response = self._generate_cached(prompt)
+            
+            return self._build_email_result(your_business, lead, matched_services, response)
+            
+        except Exception as e:
+            self.log_error(f"Error generating email: {e}", exc_info=True)
+            return self._build_email_result(your_business, lead, matched_services, error=e)
+    
+    def generate_lead_package(self,
+                              your_business: Dict,
+                              lead: Dict,
+                              your_services: List[str],
+                              snippet_1k: str,
+                              tone: str = "professional") -> Dict:
+        """
+        Summarize a lead, match services and write the outreach email in one LLM call.
+        
+        Replaces separate summarize_lead_business, match_services_to_lead and
+        generate_outreach_email round trips with a single JSON-mode request.
+        
+        Args:
+            your_business: Your business information (name, description, services)
+            lead: Lead information (company_name, website, description, industry)
+            your_services: Your company's services to match from
+            snippet_1k: Website content, already truncated to SUMMARY_SNIPPET_CHARS
+            tone: Email tone (professional, friendly, casual)
+        
+        Returns:
+            Email dictionary (same shape as generate_outreach_email) plus 'summary':
+            {
+                'summary': str,
+                'subject': str,
+                'body': str,
+                'matched_services': List[str],
+                'success': bool,
+                'error': Optional[str]
+            }
+        """
+        self.log_info(f"Generating lead package for {lead.get('company_name', 'Unknown')}")
+        
+        try:
+            prompt = self._PACKAGE_TMPL.substitute(
+                your_name=your_business.get('name', 'Our Company'),
+                your_description=your_business.get('description', 'We provide business services'),
+                company=lead.get('company_name', 'Unknown Company'),
+                website=lead.get('website', 'N/A'),
+                industry=lead.get('industry', 'General Business'),
+                description=lead.get('description', 'No description available'),
+                content=snippet_1k,
+                services='- ' + '\n- '.join(your_services) if your_services else '',
+                tone=tone
+            ).strip()
+            
+            data = json.loads(self._generate_cached(prompt, task="package"))
+            
+            if self._embedder is not None and your_services:
+                matched = self._match_services_with_embeddings(
+                    your_services, lead, snippet_1k[:self.MATCH_SNIPPET_CHARS]
+                )
             else:
-                response = self._generate_with_ollama(prompt)
+                matched = [s for s in data.get('matched_services', []) if s in your_services][:5]
+            if not matched:
+                matched = your_services[:3]
             
-            # Parse response
+            subject = str(data.get('email_subject', '')).strip()
+            body = str(data.get('email_body', '')).strip()
+            if not subject or not body:
+                raise ValueError("Response is missing the email subject or body")
+            
+            self.log_info(f"Successfully generated lead package for {lead.get('company_name')}")
+            return {
+                'summary': str(data.get('summary', '')).strip() or lead.get('description', ''),
+                'subject': subject,
+                'body': body,
+                'matched_services': matched,
+                'success': True,
+                'error': None
+            }
+            
+        except Exception as e:
+            self.log_error(f"Error generating lead package: {e}", exc_info=True)
+            matched = your_services[:3]
+            email_content = self._build_email_result(your_business, lead, matched, error=e)
+            email_content['summary'] = lead.get('description', 'Business description not available.')
+            return email_content
+    
+    def generate_outreach_emails_batch(self,
+                                       your_business: Dict,
+                                       leads: List[Dict],
+                                       matched_services_list: List[List[str]],
+                                       tone: str = "professional",
+                                       concurrency: int = 10) -> List[Dict]:
+        """
+        Generate outreach emails for many leads concurrently.
+        
+        Requests are issued in parallel with at most ``concurrency`` in flight.
+        With the OpenAI backend, batches larger than ``BATCH_API_THRESHOLD``
+        are submitted as an OpenAI Batch API job instead.
+        
+        Args:
+            your_business: Your business information
+            leads: Lead information, one dict per lead
+            matched_services_list: Matched services for each lead (same order as leads)
+            tone: Email tone (professional, friendly, casual)
+            concurrency: Maximum number of in-flight requests
+        
+        Returns:
+            List of email dictionaries (same shape as generate_outreach_email),
+            in the same order as leads
+        """
+        self.log_info(f"Generating outreach emails for {len(leads)} leads")
+        
+        prompts = [
+            self._build_email_prompt(your_business, lead, matched, tone)
+            for lead, matched in zip(leads, matched_services_list)
+        ]
+        
+        # Answer repeated prompts from the AI cache; only misses hit the LLM
+        keys = [self._cache_key(prompt, "email") for prompt in prompts]
+        responses = [self._cache_get(key) for key in keys]
+        missing = [i for i, response in enumerate(responses) if response is None]
+        pending = [prompts[i] for i in missing]
+        
+        try:
+            if not pending:
+                generated_list = []
+            elif self.backend == "openai" and len(pending) > self.BATCH_API_THRESHOLD:
+                generated_list = self.submit_batch_job(pending)
+            else:
+                generated_list = asyncio.run(self._gather_with_semaphore(pending, concurrency))
+        except Exception as e:
+            self.log_error(f"Error generating email batch: {e}", exc_info=True)
+            generated_list = [e] * len(pending)
+        
+        for i, generated in zip(missing, generated_list):
+            responses[i] = generated
+            if not isinstance(generated, Exception):
+                self._cache_set(keys[i], generated)
+        
+        results = []
+        for lead, matched, response in zip(leads, matched_services_list, responses):
+            if isinstance(response, Exception):
+                self.log_error(f"Error generating email for {lead.get('company_name')}: {response}")
+                results.append(self._build_email_result(your_business, lead, matched, error=response))
+            else:
+                results.append(self._build_email_result(your_business, lead, matched, response))
+        
+        generated = sum(1 for r in results if r['success'])
+        self.log_info(f"Generated {generated}/{len(results)} emails")
+        return results
+    
+    def _build_email_result(self, your_business: Dict, lead: Dict,
+                            matched_services: List[str],
+                            response: Optional[str] = None,
+                            error: Optional[Exception] = None) -> Dict:
+        """
+        Build the email result dictionary from an AI response or an error.
+        
+        Args:
+            your_business: Your business info
+            lead: Lead info
+            matched_services: Matched services
+            response: Raw AI response (None if generation failed)
+            error: Exception raised during generation
+        
+        Returns:
+            Email dictionary with subject, body, matched_services, success, error
+        """
+        if error is None and response is not None:
             email_content = self._parse_email_response(response)
             email_content['matched_services'] = matched_services
             email_content['success'] = True
@@ -88,16 +486,14 @@ class AIGenerator(LoggerMixin):
             
             self.log_info(f"Successfully generated email for {lead.get('company_name')}")
             return email_content
-            
-        except Exception as e:
-            self.log_error(f"Error generating email: {e}", exc_info=True)
-            return {
-                'subject': f"Partnership Opportunity with {your_business.get('name', '')}",
-                'body': self._generate_fallback_email(your_business, lead, matched_services),
-                'matched_services': matched_services,
-                'success': False,
-                'error': str(e)
-            }
+        
+        return {
+            'subject': f"Partnership Opportunity with {your_business.get('name', '')}",
+            'body': self._generate_fallback_email(your_business, lead, matched_services),
+            'matched_services': matched_services,
+            'success': False,
+            'error': str(error)
+        }
     
     def _build_email_prompt(self, your_business: Dict, lead: Dict,
                            matched_services: List[str], tone: str) -> str:
@@ -113,22 +509,21 @@ class AIGenerator(LoggerMixin):
         Returns:
             Formatted prompt string
         """
-        prompt = f"""
-You are a B2B marketing expert writing a personalized outreach email.
-
-YOUR COMPANY:
-- Name: {your_business.get('name', 'Our Company')}
-- Description: {your_business.get('description', 'We provide business services')}
-- Services: {', '.join(your_business.get('services', [])[:5])}
-
-LEAD COMPANY:
+        services_block = '- ' + '\n- '.join(matched_services) if matched_services else ''
+        head = _your_business_block(
+            your_business.get('name', 'Our Company'),
+            your_business.get('description', 'We provide business services'),
+            tuple(your_business.get('services', [])[:5])
+        )
+        
+        prompt = head + f"""LEAD COMPANY:
 - Name: {lead.get('company_name', 'Unknown Company')}
 - Website: {lead.get('website', 'N/A')}
 - Description: {lead.get('description', 'No description available')}
 - Industry: {lead.get('industry', 'General Business')}
 
 MATCHED SERVICES:
-{chr(10).join(f'- {service}' for service in matched_services)}
+{services_block}
 
 INSTRUCTIONS:
 1. Write a personalized B2B outreach email with a {tone} tone
@@ -152,61 +547,322 @@ Best regards,
 """
         return prompt.strip()
     
-    def _generate_with_openai(self, prompt: str) -> str:
+    def _generate_cached(self, prompt: str, task: str = "email") -> str:
+        """
+        Generate content with the configured backend, reusing cached results.
+        
+        Identical prompts (for the same backend and model) are answered from
+        the cache instead of calling the LLM again.
+        
+        Args:
+            prompt: Input prompt
+            task: Task type (email, summary, match), used to pick the Ollama model
+        
+        Returns:
+            Generated text
+        """
+        if self._cache is None:
+            return self._generate(prompt, task)
+        
+        key = self._cache_key(prompt, task)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        result = self._generate(prompt, task)
+        self._cache_set(key, result)
+        return result
+    
+    def _cache_key(self, prompt: str, task: str) -> str:
+        """Cache key of a prompt for the current backend and the task's model."""
+        model = self.config.OPENAI_MODEL if self.backend == "openai" else self._ollama_model(task)
+        return hashlib.blake2b(
+            f"{self.backend}:{model}\0{prompt}".encode('utf-8'), digest_size=16
+        ).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Cached response for a key, or None (also when caching is disabled)."""
+        if self._cache is None:
+            return None
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.log_debug(f"AI cache hit: {key}")
+        return cached
+    
+    def _cache_set(self, key: str, result: str):
+        """Store a response (no-op when caching is disabled)."""
+        if self._cache is None:
+            return
+        if isinstance(self._cache, dict):
+            self._cache[key] = result
+        else:
+            self._cache.set(key, result, expire=self.config.AI_CACHE_TTL)
+    
+    def _generate(self, prompt: str, task: str = "email") -> str:
+        """
+        Generate content with the configured backend.
+        
+        Args:
+            prompt: Input prompt
+            task: Task type (email, summary, match, package); package requests JSON output
+        
+        Returns:
+            Generated text
+        """
+        json_mode = task == "package"
+        if self.backend == "openai":
+            return self._generate_with_openai(
+                prompt,
+                json_mode=json_mode,
+                max_tokens=OPENAI_MAX_TOKENS.get(task, OPENAI_DEFAULT_MAX_TOKENS)
+            )
+        return self._generate_with_ollama(prompt, self._ollama_model(task), json_mode=json_mode)
+    
+    def _ollama_model(self, task: str) -> str:
+        """
+        Get the Ollama model configured for a task.
+        
+        Args:
+            task: Task type (email, summary, match)
+        
+        Returns:
+            Ollama model name
+        """
+        return {
+            "email": self.config.OLLAMA_MODEL_EMAIL,
+            "summary": self.config.OLLAMA_MODEL_SUMMARY,
+            "match": self.config.OLLAMA_MODEL_MATCH,
+        }.get(task, self.config.OLLAMA_MODEL)
+    
+    def _generate_with_openai(self, prompt: str, json_mode: bool = False,
+                              max_tokens: int = OPENAI_DEFAULT_MAX_TOKENS) -> str:
         """
         Generate content using OpenAI API.
         
         Args:
             prompt: Input prompt
+            json_mode: Constrain the response to a JSON object
+            max_tokens: Maximum number of tokens to generate
         
         Returns:
             Generated text
         """
         try:
+            extra = self._openai_extra_args(json_mode)
             response = openai.chat.completions.create(
                 model=self.config.OPENAI_MODEL,
                 messages=[
-                    {"role": "system", "content": "You are an expert B2B marketing copywriter specializing in personalized outreach."},
+                    {"role": "system", "content": self.SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.7,
-                max_tokens=500
+                temperature=OPENAI_TEMPERATURE,
+                max_tokens=max_tokens,
+                stream=True,
+                **extra
             )
             
-            return response.choices[0].message.content.strip()
+            chunks = []
+            for chunk in response:
+                if chunk.choices:
+                    chunks.append(chunk.choices[0].delta.content or '')
+            
+            return ''.join(chunks).strip()
             
         except Exception as e:
             self.log_error(f"OpenAI API error: {e}")
             raise
     
-    def _generate_with_ollama(self, prompt: str) -> str:
+    def _openai_extra_args(self, json_mode: bool = False) -> Dict:
+        """
+        Build optional OpenAI request arguments.
+        
+        Args:
+            json_mode: Constrain the response to a JSON object
+        
+        Returns:
+            Keyword arguments for chat.completions.create
+        """
+        extra = {}
+        if json_mode:
+            extra['response_format'] = {'type': 'json_object'}
+        if self.config.OPENAI_LATENCY_OPTIMIZED:
+            extra['extra_body'] = OPENAI_LATENCY_EXTRA_BODY
+        return extra
+    
+    async def _agenerate_with_openai(self, client: "openai.AsyncOpenAI", prompt: str) -> str:
+        """
+        Generate content using the async OpenAI client.
+        
+        Args:
+            client: Shared AsyncOpenAI client
+            prompt: Input prompt
+        
+        Returns:
+            Generated text
+        """
+        response = await client.chat.completions.create(
+            model=self.config.OPENAI_MODEL,
+            messages=[
+                {"role": "system", "content": self.SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=OPENAI_TEMPERATURE,
+            max_tokens=OPENAI_MAX_TOKENS["email"],
+            **self._openai_extra_args()
+        )
+        
+        return response.choices[0].message.content.strip()
+    
+    async def _gather_with_semaphore(self, prompts: List[str], concurrency: int) -> List:
+        """
+        Run prompts concurrently, capping the number of in-flight requests.
+        
+        Args:
+            prompts: Input prompts
+            concurrency: Maximum number of in-flight requests
+        
+        Returns:
+            Generated text (or the raised exception) for each prompt, in order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        client = openai.AsyncOpenAI(api_key=self.config.OPENAI_API_KEY) if self.backend == "openai" else None
+        
+        async def run(prompt: str) -> str:
+            async with semaphore:
+                if client is not None:
+                    return await self._agenerate_with_openai(client, prompt)
+                return await asyncio.to_thread(self._generate_with_ollama, prompt, self.config.OLLAMA_MODEL_EMAIL)
+        
+        try:
+            return await asyncio.gather(*(run(p) for p in prompts), return_exceptions=True)
+        finally:
+            if client is not None:
+                await client.close()
+    
+    def submit_batch_job(self, prompts: List[str], poll_interval: float = 30) -> List:
+        """
+        Generate content for many prompts through the OpenAI Batch API.
+        
+        Writes the requests to a JSONL file, uploads it, creates a batch job,
+        polls until it finishes and downloads the results.
+        
+        Args:
+            prompts: Input prompts
+            poll_interval: Seconds between job status checks
+        
+        Returns:
+            Generated text (or an exception for failed requests) for each prompt, in order
+        """
+        client = openai.OpenAI(api_key=self.config.OPENAI_API_KEY)
+        
+        batch_file = self.config.OUTPUT_DIR / f"batch_requests_{int(time.time())}.jsonl"
+        with open(batch_file, 'w', encoding='utf-8') as f:
+            for i, prompt in enumerate(prompts):
+                f.write(json.dumps({
+                    'custom_id': str(i),
+                    'method': 'POST',
+                    'url': '/v1/chat/completions',
+                    'body': {
+                        'model': self.config.OPENAI_MODEL,
+                        'messages': [
+                            {'role': 'system', 'content': self.SYSTEM_PROMPT},
+                            {'role': 'user', 'content': prompt}
+                        ],
+                        'temperature': OPENAI_TEMPERATURE,
+                        'max_tokens': OPENAI_MAX_TOKENS['email']
+                    }
+                }) + '\n')
+        
+        with open(batch_file, 'rb') as f:
+            input_file = client.files.create(file=f, purpose='batch')
+        
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint='/v1/chat/completions',
+            completion_window='24h'
+        )
+        self.log_info(f"Submitted OpenAI batch job {batch.id} with {len(prompts)} requests")
+        
+        while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+        
+        if batch.status != 'completed' or not batch.output_file_id:
+            raise RuntimeError(f"OpenAI batch job {batch.id} ended with status: {batch.status}")
+        
+        results: List = [RuntimeError("No result returned by batch job")] * len(prompts)
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            index = int(item['custom_id'])
+            if item.get('error'):
+                results[index] = RuntimeError(str(item['error']))
+            else:
+                body = item['response']['body']
+                results[index] = body['choices'][0]['message']['content'].strip()
+        
+        self.log_info(f"OpenAI batch job {batch.id} completed")
+        return results
+    
+    def _generate_with_ollama(self, prompt: str, model: Optional[str] = None,
+                              json_mode: bool = False) -> str:
         """
         Generate content using Ollama (local LLaMA).
         
         Args:
             prompt: Input prompt
+            model: Ollama model to use (default: OLLAMA_MODEL)
+            json_mode: Constrain the response to valid JSON
         
         Returns:
             Generated text
         """
+        url = f"{self.config.OLLAMA_BASE_URL}/api/generate"
+        body = self._build_ollama_body(prompt, model or self.config.OLLAMA_MODEL, json_mode)
+        
         try:
-            url = f"{self.config.OLLAMA_BASE_URL}/api/generate"
-            payload = {
-                "model": self.config.OLLAMA_MODEL,
-                "prompt": prompt,
-                "stream": False
-            }
-            
-            response = requests.post(url, json=payload, timeout=60)
-            response.raise_for_status()
+            # Stream NDJSON chunks so the response is consumed while the model generates
+            chunks = []
+            with self.session.post(url, data=body, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    data = _json_loads(line)
+                    chunks.append(data.get('response', ''))
+                    if data.get('done'):
+                        break
             
-            data = response.json()
-            return data.get('response', '').strip()
+            return ''.join(chunks).strip()
             
         except Exception as e:
             self.log_error(f"Ollama API error: {e}")
             raise
     
+    def _build_ollama_body(self, prompt: str, model: str, json_mode: bool = False) -> bytes:
+        """
+        Serialize a streaming Ollama generate request.
+        
+        Args:
+            prompt: Input prompt
+            model: Ollama model to use
+            json_mode: Constrain the response to valid JSON
+        
+        Returns:
+            JSON-encoded request body
+        """
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "stream": True,
+            "options": self.OLLAMA_OPTIONS
+        }
+        if json_mode:
+            payload["format"] = "json"
+        return _json_dumps(payload)
+    
     def _parse_email_response(self, response: str) -> Dict:
         """
         Parse AI response into subject and body.
@@ -218,16 +874,12 @@ Best regards,
             Dictionary with subject and body
         """
         try:
-            # Split by SUBJECT: and BODY:
-            parts = response.split('BODY:', 1)
+            match = _EMAIL_RE.match(response)
             
-            if len(parts) == 2:
-                subject_part = parts[0].replace('SUBJECT:', '').strip()
-                body_part = parts[1].strip()
-                
+            if match:
                 return {
-                    'subject': subject_part,
-                    'body': body_part
+                    'subject': match.group(1),
+                    'body': match.group(2)
                 }
             else:
                 # Fallback: use first line as subject
@@ -283,13 +935,13 @@ Best regards,
         
         return email
     
-    def summarize_lead_business(self, lead: Dict, website_content: str) -> str:
+    def summarize_lead_business(self, lead: Dict, snippet_1k: str) -> str:
         """
         Generate a summary of the lead's business.
         
         Args:
             lead: Lead information
-            website_content: Content from lead's website
+            snippet_1k: Website content, already truncated to SUMMARY_SNIPPET_CHARS
         
         Returns:
             Business summary
@@ -297,23 +949,14 @@ Best regards,
         self.log_info(f"Summarizing business: {lead.get('company_name')}")
         
         try:
-            prompt = f"""
-Analyze the following information about a company and provide a concise 2-3 sentence summary of their business:
-
-Company: {lead.get('company_name', 'Unknown')}
-Website: {lead.get('website', 'N/A')}
-Industry: {lead.get('industry', 'Unknown')}
-
-Website Content:
-{website_content[:1000]}
-
-Provide a clear, professional summary of what this company does and their main offerings.
-"""
+            prompt = self._SUMMARY_TMPL.substitute(
+                company=lead.get('company_name', 'Unknown'),
+                website=lead.get('website', 'N/A'),
+                industry=lead.get('industry', 'Unknown'),
+                content=snippet_1k
+            )
             
-            if self.backend == "openai":
-                summary = self._generate_with_openai(prompt)
-            else:
-                summary = self._generate_with_ollama(prompt)
+            summary = self._generate_cached(prompt, task="summary")
             
             self.log_info("Successfully generated business summary")
             return summary.strip()
@@ -324,45 +967,40 @@ Provide a clear, professional summary of what this company does and their main o
     
     def match_services_to_lead(self, your_services: List[str],
                                lead: Dict,
-                               website_content: str) -> List[str]:
+                               snippet_500: str) -> List[str]:
         """
         Match your services to lead's needs using AI.
         
         Args:
             your_services: Your company's services
             lead: Lead information
-            website_content: Content from lead's website
+            snippet_500: Website content, already truncated to MATCH_SNIPPET_CHARS
         
         Returns:
             List of matched services
         """
         self.log_info(f"Matching services for {lead.get('company_name')}")
         
+        if self._embedder is not None and your_services:
+            try:
+                matched = self._match_services_with_embeddings(your_services, lead, snippet_500)
+                self.log_info(f"Matched {len(matched)} services")
+                return matched
+            except Exception as e:
+                self.log_warning(f"Embedding match failed, falling back to LLM: {e}")
+        
         try:
-            services_text = '\n'.join(f'{i+1}. {s}' for i, s in enumerate(your_services))
+            services_text = self._numbered_services(your_services)
             
-            prompt = f"""
-Analyze which services would be most relevant and valuable for this company:
-
-LEAD COMPANY:
-Name: {lead.get('company_name')}
-Industry: {lead.get('industry')}
-Description: {lead.get('description', '')}
-
-Website Content Summary:
-{website_content[:500]}
-
-AVAILABLE SERVICES:
-{services_text}
-
-TASK:
-Select the 3-5 most relevant services that would benefit this company. Return ONLY the exact service names, one per line, without numbers or explanations.
-"""
+            prompt = self._MATCH_TMPL.substitute(
+                company=lead.get('company_name'),
+                industry=lead.get('industry'),
+                description=lead.get('description', ''),
+                content=snippet_500,
+                services=services_text
+            )
             
-            if self.backend == "openai":
-                response = self._generate_with_openai(prompt)
-            else:
-                response = self._generate_with_ollama(prompt)
+            response = self._generate_cached(prompt, task="match")
             
             # Parse matched services
             matched = [line.strip() for line in response.split('\n') if line.strip()]
@@ -378,3 +1016,152 @@ Select the 3-5 most relevant services that would benefit this company. Return ON
         except Exception as e:
             self.log_error(f"Error matching services: {e}")
             return your_services[:3]  # Fallback
+    
+    def _numbered_services(self, your_services: List[str]) -> str:
+        """
+        Format services as a numbered list, memoized since the list rarely changes between leads.
+        
+        Args:
+            your_services: Your company's services
+        
+        Returns:
+            Numbered services, one per line
+        """
+        key = tuple(your_services)
+        services_text = self._services_text_cache.get(key)
+        if services_text is None:
+            services_text = '\n'.join(f'{i+1}. {s}' for i, s in enumerate(your_services))
+            self._services_text_cache[key] = services_text
+        return services_text
+    
+    def _match_services_with_embeddings(self, your_services: List[str],
+                                        lead: Dict, snippet_500: str) -> List[str]:
+        """
+        Match services by cosine similarity between service and lead embeddings.
+        
+        Args:
+            your_services: Your company's services
+            lead: Lead information
+            snippet_500: Website content snippet
+        
+        Returns:
+            Most similar services, best first
+        """
+        key = tuple(your_services)
+        service_embeddings = self._service_embeddings.get(key)
+        if service_embeddings is None:
+            service_embeddings = self._embedder.encode(your_services, normalize_embeddings=True)
+            self._service_embeddings[key] = service_embeddings
+        
+        lead_text = f"{lead.get('description', '')} {snippet_500}".strip()
+        query = self._embedder.encode([lead_text], normalize_embeddings=True)
+        scores = (query @ service_embeddings.T)[0]
+        
+        top = np.argsort(-scores)[:self.EMBEDDING_TOP_K]
+        return [your_services[i] for i in top]
+
+
+class AsyncAIGenerator(AIGenerator):
+    """
+    Async AI generator for fanning out many Ollama requests at once.
+    
+    Shares prompt building and parsing with AIGenerator, but sends Ollama
+    requests over a single HTTP/2 httpx.AsyncClient so they run concurrently
+    instead of one after another.
+    """
+    
+    MAX_CONNECTIONS = 32
+    
+    def __init__(self):
+        """Initialize Async AI Generator with a shared async HTTP client."""
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx is required for AsyncAIGenerator. Install with: pip install 'httpx[http2]'")
+        
+        super().__init__()
+        self.setup_logging("AsyncAIGenerator")
+        self.client = self._create_client()
+    
+    def _create_client(self) -> "httpx.AsyncClient":
+        """Create the pooled HTTP/2 client used for Ollama requests."""
+        return httpx.AsyncClient(
+            http2=True,
+            timeout=60.0,
+            limits=httpx.Limits(
+                max_connections=self.MAX_CONNECTIONS,
+                max_keepalive_connections=self.MAX_CONNECTIONS
+            )
+        )
+    
+    async def aclose(self):
+        """Close the async HTTP client; a fresh client is created for later use."""
+        await self.client.aclose()
+        self.client = self._create_client()
+    
+    async def _agenerate_with_ollama(self, prompt: str) -> str:
+        """
+        Generate content using Ollama without blocking the event loop.
+        
+        Args:
+            prompt: Input prompt
+        
+        Returns:
+            Generated text
+        """
+        url = f"{self.config.OLLAMA_BASE_URL}/api/generate"
+        body = self._build_ollama_body(prompt, self.config.OLLAMA_MODEL_EMAIL)
+        
+        try:
+            chunks = []
+            async with self.client.stream(
+                "POST", url, content=body, headers={'Content-Type': 'application/json'}
+            ) as response:
+                response.raise_for_status()
+                
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    data = _json_loads(line)
+                    chunks.append(data.get('response', ''))
+                    if data.get('done'):
+                        break
+            
+            return ''.join(chunks).strip()
+            
+        except Exception as e:
+            self.log_error(f"Ollama API error: {e}")
+            raise
+    
+    async def agenerate_emails(self, prompts: List[str]) -> List:
+        """
+        Generate content for all prompts concurrently.
+        
+        Args:
+            prompts: Input prompts
+        
+        Returns:
+            Generated text (or the raised exception) for each prompt, in order
+        """
+        self.log_info(f"Generating {len(prompts)} responses concurrently")
+        return await asyncio.gather(
+            *(self._agenerate_with_ollama(p) for p in prompts),
+            return_exceptions=True
+        )
+    
+    def generate_batch(self, prompts: List[str]) -> List:
+        """
+        Synchronous wrapper around agenerate_emails.
+        
+        Args:
+            prompts: Input prompts
+        
+        Returns:
+            Generated text (or the raised exception) for each prompt, in order
+        """
+        async def run():
+            try:
+                return await self.agenerate_emails(prompts)
+            finally:
+                # Pooled connections are bound to this event loop
+                await self.aclose()
+        
+        return asyncio.run(run())
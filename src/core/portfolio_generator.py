@@ -16,15 +16,129 @@ from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
+from reportlab.lib.utils import simpleSplit
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
+import functools
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from src.utils.logger import LoggerMixin
 from src.utils.config import get_config
 
 
+@dataclass(slots=True, frozen=True)
+class ColorScheme:
+    """Industry color scheme used to style a portfolio."""
+    primary: colors.Color
+    secondary: colors.Color
+    bg: colors.Color
+
+
+# Sample stylesheet shared by every portfolio; parsed once at import time
+_STYLES = getSampleStyleSheet()
+
+# Color-independent base styles, cloned per industry color scheme
+_BASE_STYLES = {
+    'intro_heading': ParagraphStyle(
+        'SectionHeading',
+        parent=_STYLES['Heading2'],
+        fontSize=20,
+        spaceAfter=15,
+        fontName='Helvetica-Bold',
+        borderPadding=(0, 0, 5, 0),
+        borderWidth=2,
+        borderRadius=0
+    ),
+    'heading': ParagraphStyle(
+        'SectionHeading',
+        parent=_STYLES['Heading2'],
+        fontSize=20,
+        spaceAfter=15,
+        fontName='Helvetica-Bold'
+    ),
+    'contact_heading': ParagraphStyle(
+        'SectionHeading',
+        parent=_STYLES['Heading2'],
+        fontSize=18,
+        spaceAfter=15,
+        fontName='Helvetica-Bold'
+    ),
+    'body': ParagraphStyle(
+        'BodyText',
+        parent=_STYLES['Normal'],
+        fontSize=11,
+        alignment=TA_JUSTIFY,
+        spaceAfter=12,
+        leading=16
+    ),
+    'value_body': ParagraphStyle(
+        'BodyText',
+        parent=_STYLES['Normal'],
+        fontSize=11,
+        spaceAfter=10,
+        leftIndent=20,
+        bulletIndent=10
+    ),
+    'contact': ParagraphStyle(
+        'Contact',
+        parent=_STYLES['Normal'],
+        fontSize=11,
+        spaceAfter=8
+    ),
+    'cta': ParagraphStyle(
+        'CTA',
+        parent=_STYLES['Normal'],
+        fontSize=12,
+        fontName='Helvetica-Bold',
+        alignment=TA_CENTER
+    ),
+}
+
+
+# Static section copy, pre-rendered once; only colors/contact details vary per lead
+_VALUE_POINTS = [
+    ("Expertise", "Years of proven experience in delivering results"),
+    ("Customization", "Tailored solutions designed for your specific needs"),
+    ("Support", "Dedicated support team available throughout your journey"),
+    ("Results", "Track record of successful client partnerships")
+]
+_VALUE_POINT_TEMPLATES = [
+    f"<b><font color='{{primary}}'>✓ {title}:</font></b> {description}"
+    for title, description in _VALUE_POINTS
+]
+_CONTACT_TEMPLATE = """
+        <b>{name}</b><br/>
+        Website: {url}<br/>
+        Email: {contact_email}<br/>
+        """
+_CTA_TEXT = "We look forward to partnering with you!"
+_SERVICE_INDEX_TEMPLATE = "<b>{i}.</b>"
+_SERVICE_BODY_TEMPLATE = "<b>{name}</b><br/>Tailored solution to enhance your business operations."
+
+
+@functools.lru_cache(maxsize=None)
+def _services_table_style(scheme: ColorScheme) -> TableStyle:
+    """Services table style for a color scheme (shared by every portfolio)."""
+    return TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('TEXTCOLOR', (0, 0), (0, -1), scheme.primary),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('BACKGROUND', (1, 0), (1, -1), scheme.bg),
+        ('BOX', (0, 0), (-1, -1), 1, colors.lightgrey),
+        ('LEFTPADDING', (0, 0), (-1, -1), 10),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+        ('TOPPADDING', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ])
+
+
 class PortfolioGenerator(LoggerMixin):
     """
     Generates customized PDF portfolios for B2B outreach.
@@ -36,18 +150,18 @@ class PortfolioGenerator(LoggerMixin):
     - Professional formatting
     """
     
-    # Industry color schemes (Primary, Secondary, Accent)
+    # Industry color schemes (Primary, Secondary, Background)
     INDUSTRY_COLORS = {
-        'Technology': (colors.HexColor('#0066CC'), colors.HexColor('#00A8E8'), colors.HexColor('#F0F4F8')),
-        'Marketing': (colors.HexColor('#FF6B35'), colors.HexColor('#004E89'), colors.HexColor('#FFF5E1')),
-        'Finance': (colors.HexColor('#1A5490'), colors.HexColor('#2E8BC0'), colors.HexColor('#E8F4F8')),
-        'Healthcare': (colors.HexColor('#00A8A8'), colors.HexColor('#4ECDC4'), colors.HexColor('#F0F9F9')),
-        'Education': (colors.HexColor('#5B4B8A'), colors.HexColor('#8E7CC3'), colors.HexColor('#F5F3FF')),
-        'Consulting': (colors.HexColor('#2C3E50'), colors.HexColor('#34495E'), colors.HexColor('#ECF0F1')),
-        'Manufacturing': (colors.HexColor('#E67E22'), colors.HexColor('#D68910'), colors.HexColor('#FEF5E7')),
-        'Real Estate': (colors.HexColor('#27AE60'), colors.HexColor('#52BE80'), colors.HexColor('#E8F8F5')),
-        'Legal': (colors.HexColor('#8B4513'), colors.HexColor('#A0522D'), colors.HexColor('#FFF8DC')),
-        'default': (colors.HexColor('#333333'), colors.HexColor('#666666'), colors.HexColor('#F5F5F5'))
+        'Technology': ColorScheme(colors.HexColor('#0066CC'), colors.HexColor('#00A8E8'), colors.HexColor('#F0F4F8')),
+        'Marketing': ColorScheme(colors.HexColor('#FF6B35'), colors.HexColor('#004E89'), colors.HexColor('#FFF5E1')),
+        'Finance': ColorScheme(colors.HexColor('#1A5490'), colors.HexColor('#2E8BC0'), colors.HexColor('#E8F4F8')),
+        'Healthcare': ColorScheme(colors.HexColor('#00A8A8'), colors.HexColor('#4ECDC4'), colors.HexColor('#F0F9F9')),
+        'Education': ColorScheme(colors.HexColor('#5B4B8A'), colors.HexColor('#8E7CC3'), colors.HexColor('#F5F3FF')),
+        'Consulting': ColorScheme(colors.HexColor('#2C3E50'), colors.HexColor('#34495E'), colors.HexColor('#ECF0F1')),
+        'Manufacturing': ColorScheme(colors.HexColor('#E67E22'), colors.HexColor('#D68910'), colors.HexColor('#FEF5E7')),
+        'Real Estate': ColorScheme(colors.HexColor('#27AE60'), colors.HexColor('#52BE80'), colors.HexColor('#E8F8F5')),
+        'Legal': ColorScheme(colors.HexColor('#8B4513'), colors.HexColor('#A0522D'), colors.HexColor('#FFF8DC')),
+        'default': ColorScheme(colors.HexColor('#333333'), colors.HexColor('#666666'), colors.HexColor('#F5F5F5'))
     }
     
     def __init__(self):
@@ -56,26 +170,72 @@ class PortfolioGenerator(LoggerMixin):
         self.config = get_config()
         self.output_dir = self.config.PORTFOLIO_DIR
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Paragraph styles memoized per color scheme
+        self._style_cache: Dict[ColorScheme, Dict[str, ParagraphStyle]] = {}
+        
+        # Rendered PDFs keyed by input hash (None when caching is disabled)
+        self.cache_dir: Optional[Path] = None
+        if self.config.PORTFOLIO_CACHE_ENABLED:
+            self.cache_dir = self.config.CACHE_DIR / 'portfolios'
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _get_styles(self, scheme: ColorScheme) -> Dict[str, ParagraphStyle]:
+        """
+        Get paragraph styles for a color scheme, building them on first use.
+        
+        Args:
+            scheme: Industry color scheme
+        
+        Returns:
+            Dictionary of style name to ParagraphStyle
+        """
+        styles = self._style_cache.get(scheme)
+        if styles is not None:
+            return styles
+        
+        base = _BASE_STYLES
+        styles = {
+            'intro_heading': base['intro_heading'].clone(
+                'SectionHeading', textColor=scheme.primary, borderColor=scheme.primary
+            ),
+            'heading': base['heading'].clone('SectionHeading', textColor=scheme.primary),
+            'contact_heading': base['contact_heading'].clone('SectionHeading', textColor=scheme.primary),
+            'body': base['body'],
+            'value_body': base['value_body'],
+            'contact': base['contact'],
+            'cta': base['cta'].clone('CTA', textColor=scheme.secondary),
+            'normal': _STYLES['Normal'],
+        }
+        self._style_cache[scheme] = styles
+        return styles
     
     def generate_portfolio(self,
                           your_business: Dict,
                           lead: Dict,
                           matched_services: List[str],
-                          email_content: Dict) -> Dict:
+                          email_content: Dict,
+                          return_bytes: bool = False) -> Dict:
         """
         Generate a customized PDF portfolio for a lead.
         
+        The PDF is built in memory and written to disk in a single write.
+        Identical inputs on the same day reuse the cached PDF instead of
+        laying it out again.
+        
         Args:
             your_business: Your business information
             lead: Lead company information
             matched_services: Services matched to this lead
             email_content: Generated email content
+            return_bytes: Return the PDF as bytes instead of writing it to disk
         
         Returns:
             Dictionary with portfolio info:
             {
-                'file_path': str,
+                'file_path': str,  # empty when return_bytes is True
                 'file_name': str,
+                'pdf_bytes': bytes,  # only when return_bytes is True
                 'success': bool,
                 'error': Optional[str]
             }
@@ -91,32 +251,32 @@ class PortfolioGenerator(LoggerMixin):
             
             # Get industry colors
             industry = lead.get('industry', 'default')
-            colors_scheme = self.INDUSTRY_COLORS.get(industry, self.INDUSTRY_COLORS['default'])
+            scheme = self.INDUSTRY_COLORS.get(industry, self.INDUSTRY_COLORS['default'])
             
-            # Create PDF
-            doc = SimpleDocTemplate(
-                str(file_path),
-                pagesize=letter,
-                rightMargin=0.75*inch,
-                leftMargin=0.75*inch,
-                topMargin=0.75*inch,
-                bottomMargin=0.75*inch
-            )
+            cache_path = self._cache_path(your_business, lead, matched_services)
+            pdf_bytes = cache_path.read_bytes() if cache_path and cache_path.exists() else None
             
-            # Build content
-            story = []
-            story.extend(self._create_cover_page(your_business, lead, colors_scheme))
-            story.append(PageBreak())
-            story.extend(self._create_introduction(your_business, lead, colors_scheme))
-            story.append(Spacer(1, 0.3*inch))
-            story.extend(self._create_services_section(matched_services, your_business, colors_scheme))
-            story.append(Spacer(1, 0.3*inch))
-            story.extend(self._create_value_proposition(your_business, lead, colors_scheme))
-            story.append(Spacer(1, 0.3*inch))
-            story.extend(self._create_contact_section(your_business, colors_scheme))
+            if pdf_bytes is None:
+                pdf_bytes = self._build_pdf(your_business, lead, matched_services, scheme)
+                if cache_path:
+                    # Write then rename so concurrent workers never read a partial file
+                    tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+                    tmp_path.write_bytes(pdf_bytes)
+                    os.replace(tmp_path, cache_path)
+            else:
+                self.log_debug(f"Portfolio cache hit: {cache_path.name}")
             
-            # Build PDF
-            doc.build(story)
+            if return_bytes:
+                self.log_info(f"Successfully created in-memory portfolio: {file_name}")
+                return {
+                    'file_path': '',
+                    'file_name': file_name,
+                    'pdf_bytes': pdf_bytes,
+                    'success': True,
+                    'error': None
+                }
+            
+            file_path.write_bytes(pdf_bytes)
             
             self.log_info(f"Successfully created portfolio: {file_path}")
             return {
@@ -135,116 +295,180 @@ class PortfolioGenerator(LoggerMixin):
                 'error': str(e)
             }
     
-    def _create_cover_page(self, your_business: Dict, lead: Dict, colors_scheme: tuple) -> List:
-        """Create cover page elements."""
-        elements = []
-        styles = getSampleStyleSheet()
+    def _build_pdf(self, your_business: Dict, lead: Dict, matched_services: List[str],
+                   scheme: ColorScheme) -> bytes:
+        """
+        Lay out the portfolio and return the PDF bytes.
         
-        primary_color, secondary_color, bg_color = colors_scheme
+        Args:
+            your_business: Your business information
+            lead: Lead company information
+            matched_services: Services matched to this lead
+            scheme: Industry color scheme
         
-        # Add spacing
-        elements.append(Spacer(1, 1.5*inch))
+        Returns:
+            PDF file contents
+        """
+        buffer = io.BytesIO()
+        doc = SimpleDocTemplate(
+            buffer,
+            pagesize=letter,
+            rightMargin=0.75*inch,
+            leftMargin=0.75*inch,
+            topMargin=0.75*inch,
+            bottomMargin=0.75*inch
+        )
         
-        # Title
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=32,
-            textColor=primary_color,
-            alignment=TA_CENTER,
-            spaceAfter=30,
-            fontName='Helvetica-Bold'
+        # Build content
+        # Page 1 is drawn directly on the canvas by _draw_cover_page
+        story = [PageBreak()]
+        story.extend(self._create_introduction(your_business, lead, scheme))
+        story.append(Spacer(1, 0.3*inch))
+        story.extend(self._create_services_section(matched_services, your_business, scheme))
+        story.append(Spacer(1, 0.3*inch))
+        story.extend(self._create_value_proposition(your_business, lead, scheme))
+        story.append(Spacer(1, 0.3*inch))
+        story.extend(self._create_contact_section(your_business, scheme))
+        
+        # Build PDF
+        doc.build(
+            story,
+            onFirstPage=functools.partial(
+                self._draw_cover_page, your_business=your_business, lead=lead, scheme=scheme
+            )
         )
         
-        elements.append(Paragraph(
-            f"{your_business.get('name', 'Our Company')}",
-            title_style
-        ))
+        return buffer.getvalue()
+    
+    def _cache_path(self, your_business: Dict, lead: Dict,
+                    matched_services: List[str]) -> Optional[Path]:
+        """
+        Get the cache file for a set of portfolio inputs.
         
-        # Subtitle
-        subtitle_style = ParagraphStyle(
-            'CustomSubtitle',
-            parent=styles['Heading2'],
-            fontSize=18,
-            textColor=secondary_color,
-            alignment=TA_CENTER,
-            spaceAfter=40
+        The cover page shows today's date, so the date is part of the key.
+        
+        Returns:
+            Cache file path, or None when caching is disabled
+        """
+        if self.cache_dir is None:
+            return None
+        
+        payload = json.dumps(
+            {'b': your_business, 'l': lead, 's': matched_services,
+             'd': datetime.now().strftime('%Y-%m-%d')},
+            sort_keys=True, default=str
         )
+        key = hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+        return self.cache_dir / f"{key}.pdf"
+    
+    def generate_portfolios_batch(self,
+                                  tasks: List[Tuple[Dict, Dict, List[str], Dict]],
+                                  max_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Generate portfolios for many leads in parallel worker processes.
         
-        elements.append(Paragraph(
-            "Business Partnership Proposal",
-            subtitle_style
-        ))
+        PDF layout is CPU-bound, so leads are spread across processes rather
+        than threads. Output file names are timestamped per lead, so workers
+        need no coordination.
         
-        elements.append(Spacer(1, 0.5*inch))
+        Args:
+            tasks: (your_business, lead, matched_services, email_content) per lead
+            max_workers: Number of worker processes (default: CPU count)
         
-        # Prepared for
-        prepared_style = ParagraphStyle(
-            'Prepared',
-            parent=styles['Normal'],
-            fontSize=14,
-            textColor=colors.grey,
-            alignment=TA_CENTER,
-            spaceAfter=10
+        Returns:
+            List of portfolio info dictionaries (same shape as generate_portfolio),
+            in the same order as tasks
+        """
+        if not tasks:
+            return []
+        
+        workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+        self.log_info(f"Generating {len(tasks)} portfolios with {workers} worker processes")
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            return list(executor.map(_generate_one, tasks))
+    
+    def _draw_cover_page(self, canvas, doc, your_business: Dict, lead: Dict,
+                         scheme: ColorScheme):
+        """
+        Draw the cover page directly on the canvas.
+        
+        The cover is plain centered text, so it is drawn with the low-level
+        canvas API instead of laying out Platypus flowables for every lead.
+        """
+        center_x = doc.pagesize[0] / 2
+        max_width = doc.width
+        y = doc.pagesize[1] - doc.topMargin - 1.5*inch
+        
+        canvas.saveState()
+        
+        # Title
+        canvas.setFillColor(scheme.primary)
+        y = self._draw_centered_lines(
+            canvas, your_business.get('name', 'Our Company'),
+            'Helvetica-Bold', 32, center_x, y, max_width
         )
         
-        elements.append(Paragraph(
-            f"Prepared for:<br/><b>{lead.get('company_name', 'Your Company')}</b>",
-            prepared_style
-        ))
+        # Subtitle
+        y -= 30
+        canvas.setFillColor(scheme.secondary)
+        y = self._draw_centered_lines(
+            canvas, "Business Partnership Proposal", 'Helvetica', 18, center_x, y, max_width
+        )
         
-        elements.append(Spacer(1, 1*inch))
+        # Prepared for
+        y -= 40 + 0.5*inch
+        canvas.setFillColor(colors.grey)
+        y = self._draw_centered_lines(canvas, "Prepared for:", 'Helvetica', 14, center_x, y, max_width)
+        y = self._draw_centered_lines(
+            canvas, lead.get('company_name', 'Your Company'),
+            'Helvetica-Bold', 14, center_x, y, max_width
+        )
         
         # Date
-        date_style = ParagraphStyle(
-            'Date',
-            parent=styles['Normal'],
-            fontSize=12,
-            textColor=colors.grey,
-            alignment=TA_CENTER
+        y -= 10 + 1*inch
+        self._draw_centered_lines(
+            canvas, datetime.now().strftime('%B %d, %Y'), 'Helvetica', 12, center_x, y, max_width
         )
         
-        elements.append(Paragraph(
-            datetime.now().strftime('%B %d, %Y'),
-            date_style
-        ))
+        canvas.restoreState()
+    
+    @staticmethod
+    def _draw_centered_lines(canvas, text: str, font_name: str, font_size: float,
+                             center_x: float, y: float, max_width: float) -> float:
+        """
+        Draw text centered at center_x, wrapping to max_width.
         
-        return elements
+        Args:
+            canvas: ReportLab canvas
+            text: Text to draw
+            font_name: Font name
+            font_size: Font size in points
+            center_x: Horizontal center
+            y: Top of the text block
+            max_width: Maximum line width
+        
+        Returns:
+            Y position below the drawn text
+        """
+        leading = font_size * 1.2
+        canvas.setFont(font_name, font_size)
+        for line in simpleSplit(text, font_name, font_size, max_width):
+            y -= leading
+            canvas.drawCentredString(center_x, y, line)
+        return y
     
-    def _create_introduction(self, your_business: Dict, lead: Dict, colors_scheme: tuple) -> List:
+    def _create_introduction(self, your_business: Dict, lead: Dict, scheme: ColorScheme) -> List:
         """Create introduction section."""
         elements = []
-        styles = getSampleStyleSheet()
-        
-        primary_color, secondary_color, bg_color = colors_scheme
+        styles = self._get_styles(scheme)
+        body_style = styles['body']
         
         # Section title
-        heading_style = ParagraphStyle(
-            'SectionHeading',
-            parent=styles['Heading2'],
-            fontSize=20,
-            textColor=primary_color,
-            spaceAfter=15,
-            fontName='Helvetica-Bold',
-            borderPadding=(0, 0, 5, 0),
-            borderColor=primary_color,
-            borderWidth=2,
-            borderRadius=0
-        )
-        
-        elements.append(Paragraph("About Us", heading_style))
+        elements.append(Paragraph("About Us", styles['intro_heading']))
         elements.append(Spacer(1, 0.2*inch))
         
         # Company description
-        body_style = ParagraphStyle(
-            'BodyText',
-            parent=styles['Normal'],
-            fontSize=11,
-            alignment=TA_JUSTIFY,
-            spaceAfter=12,
-            leading=16
-        )
-        
         description = your_business.get('description', 'We provide professional business services.')
         elements.append(Paragraph(description, body_style))
         
@@ -259,149 +483,91 @@ class PortfolioGenerator(LoggerMixin):
         
         return elements
     
-    def _create_services_section(self, services: List[str], your_business: Dict, colors_scheme: tuple) -> List:
+    def _create_services_section(self, services: List[str], your_business: Dict, scheme: ColorScheme) -> List:
         """Create services showcase section."""
         elements = []
-        styles = getSampleStyleSheet()
-        
-        primary_color, secondary_color, bg_color = colors_scheme
+        styles = self._get_styles(scheme)
         
         # Section title
-        heading_style = ParagraphStyle(
-            'SectionHeading',
-            parent=styles['Heading2'],
-            fontSize=20,
-            textColor=primary_color,
-            spaceAfter=15,
-            fontName='Helvetica-Bold'
-        )
-        
-        elements.append(Paragraph("Our Recommended Services for You", heading_style))
+        elements.append(Paragraph("Our Recommended Services for You", styles['heading']))
         elements.append(Spacer(1, 0.2*inch))
         
         # Services table
-        service_data = []
-        
-        for i, service in enumerate(services, 1):
-            service_data.append([
-                Paragraph(f"<b>{i}.</b>", styles['Normal']),
-                Paragraph(f"<b>{service}</b><br/>Tailored solution to enhance your business operations.", styles['Normal'])
-            ])
+        normal = styles['normal']
+        service_data = [
+            [
+                Paragraph(_SERVICE_INDEX_TEMPLATE.format(i=i), normal),
+                Paragraph(_SERVICE_BODY_TEMPLATE.format(name=service), normal)
+            ]
+            for i, service in enumerate(services, 1)
+        ]
         
         service_table = Table(service_data, colWidths=[0.5*inch, 5.5*inch])
-        service_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('TEXTCOLOR', (0, 0), (0, -1), primary_color),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('BACKGROUND', (1, 0), (1, -1), bg_color),
-            ('BOX', (0, 0), (-1, -1), 1, colors.lightgrey),
-            ('LINEBELOW', (0, 0), (-1, -2), 0.5, colors.lightgrey),
-            ('LEFTPADDING', (0, 0), (-1, -1), 10),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ]))
+        service_table.setStyle(_services_table_style(scheme))
         
         elements.append(service_table)
         
         return elements
     
-    def _create_value_proposition(self, your_business: Dict, lead: Dict, colors_scheme: tuple) -> List:
+    def _create_value_proposition(self, your_business: Dict, lead: Dict, scheme: ColorScheme) -> List:
         """Create value proposition section."""
         elements = []
-        styles = getSampleStyleSheet()
-        
-        primary_color, secondary_color, bg_color = colors_scheme
+        styles = self._get_styles(scheme)
         
         # Section title
-        heading_style = ParagraphStyle(
-            'SectionHeading',
-            parent=styles['Heading2'],
-            fontSize=20,
-            textColor=primary_color,
-            spaceAfter=15,
-            fontName='Helvetica-Bold'
-        )
-        
-        elements.append(Paragraph("Why Choose Us", heading_style))
+        elements.append(Paragraph("Why Choose Us", styles['heading']))
         elements.append(Spacer(1, 0.2*inch))
         
         # Value points
-        value_points = [
-            ("Expertise", "Years of proven experience in delivering results"),
-            ("Customization", "Tailored solutions designed for your specific needs"),
-            ("Support", "Dedicated support team available throughout your journey"),
-            ("Results", "Track record of successful client partnerships")
-        ]
-        
-        body_style = ParagraphStyle(
-            'BodyText',
-            parent=styles['Normal'],
-            fontSize=11,
-            spaceAfter=10,
-            leftIndent=20,
-            bulletIndent=10
+        primary = str(scheme.primary)
+        elements.extend(
+            Paragraph(template.format(primary=primary), styles['value_body'])
+            for template in _VALUE_POINT_TEMPLATES
         )
         
-        for title, description in value_points:
-            elements.append(Paragraph(
-                f"<b><font color='{primary_color}'>✓ {title}:</font></b> {description}",
-                body_style
-            ))
-        
         return elements
     
-    def _create_contact_section(self, your_business: Dict, colors_scheme: tuple) -> List:
+    def _create_contact_section(self, your_business: Dict, scheme: ColorScheme) -> List:
         """Create contact information section."""
         elements = []
-        styles = getSampleStyleSheet()
-        
-        primary_color, secondary_color, bg_color = colors_scheme
+        styles = self._get_styles(scheme)
         
         elements.append(Spacer(1, 0.5*inch))
         
         # Section title
-        heading_style = ParagraphStyle(
-            'SectionHeading',
-            parent=styles['Heading2'],
-            fontSize=18,
-            textColor=primary_color,
-            spaceAfter=15,
-            fontName='Helvetica-Bold'
-        )
-        
-        elements.append(Paragraph("Let's Connect", heading_style))
+        elements.append(Paragraph("Let's Connect", styles['contact_heading']))
         
         # Contact info
-        contact_style = ParagraphStyle(
-            'Contact',
-            parent=styles['Normal'],
-            fontSize=11,
-            spaceAfter=8
+        contact_info = _CONTACT_TEMPLATE.format(
+            name=your_business.get('name', 'Our Company'),
+            url=your_business.get('url', 'www.example.com'),
+            contact_email=your_business.get('contact_email', 'contact@example.com')
         )
         
-        contact_info = f"""
-        <b>{your_business.get('name', 'Our Company')}</b><br/>
-        Website: {your_business.get('url', 'www.example.com')}<br/>
-        Email: {your_business.get('contact_email', 'contact@example.com')}<br/>
-        """
-        
-        elements.append(Paragraph(contact_info, contact_style))
+        elements.append(Paragraph(contact_info, styles['contact']))
         elements.append(Spacer(1, 0.2*inch))
         
         # Call to action
-        cta_style = ParagraphStyle(
-            'CTA',
-            parent=styles['Normal'],
-            fontSize=12,
-            textColor=secondary_color,
-            fontName='Helvetica-Bold',
-            alignment=TA_CENTER
-        )
-        
-        elements.append(Paragraph(
-            "We look forward to partnering with you!",
-            cta_style
-        ))
+        elements.append(Paragraph(_CTA_TEXT, styles['cta']))
         
         return elements
+
+
+# Per-process generator used by generate_portfolios_batch workers
+_worker_generator: Optional[PortfolioGenerator] = None
+
+
+def _init_worker():
+    """Create the worker's PortfolioGenerator and warm its style cache."""
+    global _worker_generator
+    _worker_generator = PortfolioGenerator()
+    for scheme in PortfolioGenerator.INDUSTRY_COLORS.values():
+        _worker_generator._get_styles(scheme)
+
+
+def _generate_one(task: Tuple[Dict, Dict, List[str], Dict]) -> Dict:
+    """Generate a single portfolio inside a worker process."""
+    global _worker_generator
+    if _worker_generator is None:
+        _init_worker()
+    return _worker_generator.generate_portfolio(*task)
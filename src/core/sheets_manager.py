@@ -12,15 +12,31 @@ Features:
 """
 
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from typing import Dict, List, Optional
+from collections import Counter, namedtuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
+from functools import cached_property
+import re
 import time
 from src.utils.logger import LoggerMixin
+from src.utils.google_api import build_service, execute_with_backoff
 from src.utils.config import get_config
 
 
+# Format of the 'Date Added' column
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _column_letter(index: int) -> str:
+    """Convert a 1-based column index to its A1 letter (1 -> A, 27 -> AA)."""
+    letters = ''
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
 class SheetsManager(LoggerMixin):
     """
     Manages Google Sheets operations for lead tracking.
@@ -32,6 +48,12 @@ class SheetsManager(LoggerMixin):
     - Column management
     """
     
+    # (spreadsheet_id, worksheet_name) pairs whose headers were verified in this process
+    _headers_verified = set()
+    
+    # Queued rows that trigger an automatic flush in add_leads
+    FLUSH_THRESHOLD = 100
+    
     # Default sheet headers
     HEADERS = [
         'Company Name',
@@ -55,6 +77,27 @@ class SheetsManager(LoggerMixin):
         self.spreadsheet_id = self.config.GOOGLE_SHEETS_SPREADSHEET_ID
         self.worksheet_name = self.config.GOOGLE_SHEETS_WORKSHEET_NAME
         
+        # A1 ranges derived from HEADERS; data ranges skip the header row
+        last_column = _column_letter(len(self.HEADERS))
+        self._range_headers = f"{self.worksheet_name}!A1:{last_column}1"
+        self._range_all = f"{self.worksheet_name}!A2:{last_column}"
+        self._range_website = f"{self.worksheet_name}!B2:B"
+        # Cell prefixes for bulk status updates (prefix + str(row), e.g. "Leads!J" + "7")
+        self._status_prefix = f"{self.worksheet_name}!{_column_letter(self.HEADERS.index('Status') + 1)}"
+        self._notes_prefix = f"{self.worksheet_name}!{_column_letter(self.HEADERS.index('Notes') + 1)}"
+        
+        # Normalized websites already in the sheet (loaded lazily from column B)
+        self._known_websites: Optional[set] = None
+        # Normalized website -> 1-based sheet row, loaded together with the set
+        self._website_to_row: Optional[Dict[str, int]] = None
+        
+        # Rows queued by add_leads, written by flush() in a single append
+        self._pending_rows: List[List] = []
+        
+        # (timestamp, result) of the last sheet read/get_stats, reused for SHEETS_CACHE_TTL
+        self._leads_cache: Optional[Tuple[float, List[List[str]]]] = None
+        self._stats_cache: Optional[Tuple[float, Dict]] = None
+        
         # Initialize service
         self._initialize_service()
     
@@ -68,49 +111,80 @@ class SheetsManager(LoggerMixin):
             )
             
             # Build service
-            self.service = build('sheets', 'v4', credentials=credentials)
+            self.service = build_service('sheets', 'v4', credentials)
             self.log_info("Google Sheets service initialized successfully")
             
-            # Ensure headers exist
-            self._ensure_headers()
+            # Ensure headers exist (once per worksheet per process)
+            key = (self.spreadsheet_id, self.worksheet_name)
+            if key not in SheetsManager._headers_verified and self._ensure_headers():
+                SheetsManager._headers_verified.add(key)
             
         except Exception as e:
             self.log_error(f"Failed to initialize Google Sheets service: {e}", exc_info=True)
             raise
     
-    def _ensure_headers(self):
-        """Ensure spreadsheet has the correct headers."""
+    def _ensure_headers(self) -> bool:
+        """
+        Ensure spreadsheet has the correct headers.
+        
+        Returns:
+            True if the headers were verified or written, False on error
+        """
         try:
-            # Check if sheet exists
-            sheet_metadata = self.service.spreadsheets().get(
-                spreadsheetId=self.spreadsheet_id
-            ).execute()
-            
-            sheets = sheet_metadata.get('sheets', [])
-            sheet_exists = any(
-                sheet['properties']['title'] == self.worksheet_name 
-                for sheet in sheets
-            )
-            
-            if not sheet_exists:
+            # Fetch sheet properties and the header row in one request
+            try:
+                sheet_metadata = execute_with_backoff(self.service.spreadsheets().get(
+                    spreadsheetId=self.spreadsheet_id,
+                    ranges=[self._range_headers],
+                    includeGridData=True,
+                    fields='sheets(properties(sheetId,title),data(rowData(values(formattedValue))))'
+                ))
+            except HttpError as e:
+                # The header range cannot be parsed when the worksheet is missing
+                if e.resp.status != 400:
+                    raise
+                sheet_metadata = {}
+            
+            sheet_id = self._resolve_sheet_id(sheet_metadata)
+            values = []
+            
+            if sheet_id is None:
                 # Create worksheet
                 self._create_worksheet()
-            
-            # Check headers
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range=f"{self.worksheet_name}!A1:K1"
-            ).execute()
-            
-            values = result.get('values', [])
+            else:
+                # Prime the _sheet_id cache from the metadata we already have
+                self.__dict__['_sheet_id'] = sheet_id
+                values = self._header_values(sheet_metadata)
             
             if not values or values[0] != self.HEADERS:
                 # Write headers
                 self._write_headers()
                 self.log_info("Headers written to spreadsheet")
             
+            return True
+            
         except Exception as e:
             self.log_error(f"Error ensuring headers: {e}")
+            return False
+    
+    def _header_values(self, sheet_metadata: Dict) -> List[List[str]]:
+        """
+        Extract the header row from a spreadsheets().get grid-data response.
+        
+        Args:
+            sheet_metadata: Response fetched with includeGridData
+        
+        Returns:
+            Header row in values().get format ([] when the row is empty)
+        """
+        for sheet in sheet_metadata.get('sheets', []):
+            if sheet['properties']['title'] != self.worksheet_name:
+                continue
+            for grid in sheet.get('data', []):
+                for row in grid.get('rowData', []):
+                    return [[cell.get('formattedValue', '') for cell in row.get('values', [])]]
+        
+        return []
     
     def _create_worksheet(self):
         """Create a new worksheet."""
@@ -125,10 +199,17 @@ class SheetsManager(LoggerMixin):
                 }]
             }
             
-            self.service.spreadsheets().batchUpdate(
+            response = execute_with_backoff(self.service.spreadsheets().batchUpdate(
                 spreadsheetId=self.spreadsheet_id,
                 body=request_body
-            ).execute()
+            ))
+            
+            # The addSheet reply carries the new sheet's ID
+            self.__dict__.pop('_sheet_id', None)
+            replies = response.get('replies') or [{}]
+            properties = replies[0].get('addSheet', {}).get('properties', {})
+            if 'sheetId' in properties:
+                self.__dict__['_sheet_id'] = properties['sheetId']
             
             self.log_info(f"Created worksheet: {self.worksheet_name}")
             
@@ -143,12 +224,12 @@ class SheetsManager(LoggerMixin):
                 'values': [self.HEADERS]
             }
             
-            self.service.spreadsheets().values().update(
+            execute_with_backoff(self.service.spreadsheets().values().update(
                 spreadsheetId=self.spreadsheet_id,
-                range=f"{self.worksheet_name}!A1:K1",
+                range=self._range_headers,
                 valueInputOption='RAW',
                 body=body
-            ).execute()
+            ))
             
             # Format headers (bold)
             self._format_headers()
@@ -165,7 +246,7 @@ class SheetsManager(LoggerMixin):
                     {
                         'repeatCell': {
                             'range': {
-                                'sheetId': self._get_sheet_id(),
+                                'sheetId': self._sheet_id,
                                 'startRowIndex': 0,
                                 'endRowIndex': 1
                             },
@@ -192,30 +273,39 @@ class SheetsManager(LoggerMixin):
                 ]
             }
             
-            self.service.spreadsheets().batchUpdate(
+            execute_with_backoff(self.service.spreadsheets().batchUpdate(
                 spreadsheetId=self.spreadsheet_id,
                 body=request_body
-            ).execute()
+            ))
             
         except Exception as e:
             self.log_warning(f"Could not format headers: {e}")
     
-    def _get_sheet_id(self) -> int:
-        """Get sheet ID by worksheet name."""
-        try:
-            sheet_metadata = self.service.spreadsheets().get(
-                spreadsheetId=self.spreadsheet_id
-            ).execute()
-            
-            for sheet in sheet_metadata.get('sheets', []):
-                if sheet['properties']['title'] == self.worksheet_name:
-                    return sheet['properties']['sheetId']
-            
-            return 0  # Default to first sheet
-            
-        except Exception as e:
-            self.log_error(f"Error getting sheet ID: {e}")
-            return 0
+    @cached_property
+    def _sheet_id(self) -> int:
+        """Sheet ID of the worksheet (fetched once, then cached)."""
+        sheet_metadata = execute_with_backoff(self.service.spreadsheets().get(
+            spreadsheetId=self.spreadsheet_id
+        ))
+        
+        sheet_id = self._resolve_sheet_id(sheet_metadata)
+        return 0 if sheet_id is None else sheet_id  # Default to first sheet
+    
+    def _resolve_sheet_id(self, sheet_metadata: Dict) -> Optional[int]:
+        """
+        Find the worksheet's sheet ID in spreadsheet metadata.
+        
+        Args:
+            sheet_metadata: Response of spreadsheets().get()
+        
+        Returns:
+            Sheet ID, or None if the worksheet does not exist
+        """
+        for sheet in sheet_metadata.get('sheets', []):
+            if sheet['properties']['title'] == self.worksheet_name:
+                return sheet['properties']['sheetId']
+        
+        return None
     
     def add_lead(self, lead_data: Dict) -> Dict:
         """
@@ -228,10 +318,11 @@ class SheetsManager(LoggerMixin):
             Result dictionary with success status
         """
         self.log_info(f"Adding lead: {lead_data.get('company_name', 'Unknown')}")
+        website = lead_data.get('website', '')
         
         try:
             # Check for duplicates
-            if self.is_duplicate(lead_data.get('website', '')):
+            if self.is_duplicate(website):
                 self.log_warning(f"Duplicate lead found: {lead_data.get('company_name')}")
                 return {
                     'success': False,
@@ -240,32 +331,23 @@ class SheetsManager(LoggerMixin):
                 }
             
             # Prepare row data
-            row_data = [
-                lead_data.get('company_name', ''),
-                lead_data.get('website', ''),
-                lead_data.get('contact_email', ''),
-                lead_data.get('industry', ''),
-                ', '.join(lead_data.get('matched_services', [])),
-                lead_data.get('email_subject', ''),
-                lead_data.get('email_body', ''),
-                lead_data.get('portfolio_path', ''),
-                datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'New',
-                ''
-            ]
+            row_data = self._build_row(lead_data)
             
             # Append row
             body = {
                 'values': [row_data]
             }
             
-            result = self.service.spreadsheets().values().append(
+            result = execute_with_backoff(self.service.spreadsheets().values().append(
                 spreadsheetId=self.spreadsheet_id,
-                range=f"{self.worksheet_name}!A:K",
+                range=self._range_all,
                 valueInputOption='RAW',
                 insertDataOption='INSERT_ROWS',
                 body=body
-            ).execute()
+            ))
+            
+            self._remember_rows(result, [row_data])
+            self._invalidate_read_cache()
             
             self.log_info(f"Successfully added lead: {lead_data.get('company_name')}")
             return {
@@ -277,6 +359,8 @@ class SheetsManager(LoggerMixin):
             
         except HttpError as e:
             self.log_error(f"HTTP error adding lead: {e}")
+            self._known_websites = None  # Sheet state unknown; reload on next check
+            self._website_to_row = None
             return {
                 'success': False,
                 'error': str(e),
@@ -284,16 +368,178 @@ class SheetsManager(LoggerMixin):
             }
         except Exception as e:
             self.log_error(f"Error adding lead: {e}", exc_info=True)
+            self._known_websites = None  # Sheet state unknown; reload on next check
+            self._website_to_row = None
             return {
                 'success': False,
                 'error': str(e),
                 'is_duplicate': False
             }
     
+    def add_leads(self, leads: List[Dict], flush: bool = True) -> Dict:
+        """
+        Queue several leads and write them with as few API calls as possible.
+        
+        Duplicates (already in the sheet or repeated within the batch) are
+        skipped. Queued rows are written in one append request once
+        FLUSH_THRESHOLD rows are pending, and at the end when flush is True.
+        
+        Args:
+            leads: Lead dictionaries (same fields as add_lead)
+            flush: Write remaining queued rows before returning
+        
+        Returns:
+            Result dictionary:
+            {
+                'success': bool,
+                'added': int,
+                'queued': int,
+                'duplicates': int,
+                'error': Optional[str]
+            }
+        """
+        self.log_info(f"Adding {len(leads)} leads")
+        
+        added = 0
+        duplicates = 0
+        error = None
+        date_added = datetime.now().strftime(DATE_FORMAT)  # One timestamp per batch
+        
+        for lead_data in leads:
+            website = lead_data.get('website', '')
+            if self.is_duplicate(website):
+                self.log_warning(f"Duplicate lead found: {lead_data.get('company_name')}")
+                duplicates += 1
+                continue
+            
+            self._pending_rows.append(self._build_row(lead_data, date_added))
+            if website and self._known_websites is not None:
+                # Row index is recorded once the flush reports where rows landed
+                self._known_websites.add(self._normalize_url(website))
+            
+            if len(self._pending_rows) >= self.FLUSH_THRESHOLD:
+                result = self.flush()
+                added += result['added']
+                error = error or result['error']
+        
+        if flush:
+            result = self.flush()
+            added += result['added']
+            error = error or result['error']
+        
+        return {
+            'success': error is None,
+            'added': added,
+            'queued': len(self._pending_rows),
+            'duplicates': duplicates,
+            'error': error
+        }
+    
+    def flush(self) -> Dict:
+        """
+        Write all queued rows in a single append request.
+        
+        Returns:
+            Result dictionary with success status and number of rows added
+        """
+        if not self._pending_rows:
+            return {'success': True, 'added': 0, 'error': None}
+        
+        rows = self._pending_rows
+        self._pending_rows = []
+        
+        try:
+            # Append (not batchUpdate) so existing rows are never overwritten
+            result = execute_with_backoff(self.service.spreadsheets().values().append(
+                spreadsheetId=self.spreadsheet_id,
+                range=self._range_all,
+                valueInputOption='RAW',
+                insertDataOption='INSERT_ROWS',
+                body={'values': rows}
+            ))
+            
+            self._remember_rows(result, rows)
+            self._invalidate_read_cache()
+            
+            self.log_info(f"Successfully added {len(rows)} leads")
+            return {'success': True, 'added': len(rows), 'error': None}
+            
+        except Exception as e:
+            self.log_error(f"Error adding {len(rows)} leads: {e}", exc_info=True)
+            self._known_websites = None  # Sheet state unknown; reload on next check
+            self._website_to_row = None
+            return {'success': False, 'added': 0, 'error': str(e)}
+    
+    def _remember_rows(self, append_result: Dict, rows: List[List]):
+        """
+        Record appended rows in the website caches.
+        
+        Args:
+            append_result: Response of a values.append call
+            rows: Rows that were appended, in order
+        """
+        if self._known_websites is None:
+            return
+        
+        websites = [self._normalize_url(row[1]) for row in rows if row[1]]
+        self._known_websites.update(websites)
+        
+        if self._website_to_row is None:
+            return
+        
+        updated_range = append_result.get('updates', {}).get('updatedRange', '')
+        match = re.search(r'!\$?[A-Z]+\$?(\d+)', updated_range)
+        if not match:
+            # Row positions unknown; reload the row map on next status update
+            self._website_to_row = None
+            return
+        
+        first_row = int(match.group(1))
+        for offset, row in enumerate(rows):
+            if row[1]:
+                self._website_to_row[self._normalize_url(row[1])] = first_row + offset
+    
+    def _invalidate_read_cache(self):
+        """Drop cached get_all_leads/get_stats results after a write."""
+        self._leads_cache = None
+        self._stats_cache = None
+    
+    def _cache_fresh(self, entry: Optional[Tuple[float, object]]) -> bool:
+        """Check whether a (timestamp, result) cache entry is within SHEETS_CACHE_TTL."""
+        return entry is not None and time.monotonic() - entry[0] < self.config.SHEETS_CACHE_TTL
+    
+    def _build_row(self, lead_data: Dict, date_added: Optional[str] = None) -> List:
+        """
+        Build a sheet row (in HEADERS order) from lead data.
+        
+        Args:
+            lead_data: Dictionary containing lead information
+            date_added: Pre-formatted 'Date Added' value (default: now)
+        
+        Returns:
+            Row values
+        """
+        services = lead_data.get('matched_services')
+        return [
+            lead_data.get('company_name', ''),
+            lead_data.get('website', ''),
+            lead_data.get('contact_email', ''),
+            lead_data.get('industry', ''),
+            ', '.join(services) if isinstance(services, list) else (services or ''),
+            lead_data.get('email_subject', ''),
+            lead_data.get('email_body', ''),
+            lead_data.get('portfolio_path', ''),
+            date_added or datetime.now().strftime(DATE_FORMAT),
+            'New',
+            ''
+        ]
+    
     def is_duplicate(self, website: str) -> bool:
         """
         Check if a lead with the same website already exists.
         
+        Column B is read once and cached; later checks are set lookups.
+        
         Args:
             website: Website URL to check
         
@@ -304,59 +550,52 @@ class SheetsManager(LoggerMixin):
             return False
         
         try:
-            # Get all website values (column B)
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range=f"{self.worksheet_name}!B:B"
-            ).execute()
-            
-            values = result.get('values', [])
+            if self._known_websites is None:
+                self._load_known_websites()
             
-            # Normalize URLs for comparison
-            website_normalized = website.lower().strip().rstrip('/')
-            
-            for row in values[1:]:  # Skip header
-                if row:
-                    existing_website = row[0].lower().strip().rstrip('/')
-                    if existing_website == website_normalized:
-                        return True
-            
-            return False
+            return self._normalize_url(website) in self._known_websites
             
         except Exception as e:
             self.log_error(f"Error checking for duplicates: {e}")
             return False
     
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """Normalize a website URL for duplicate comparison."""
+        return url.lower().strip().rstrip('/')
+    
+    def _load_known_websites(self):
+        """Load normalized websites (and their rows) from column B into the caches."""
+        result = execute_with_backoff(self.service.spreadsheets().values().get(
+            spreadsheetId=self.spreadsheet_id,
+            range=self._range_website
+        ))
+        
+        values = result.get('values', [])
+        
+        # Row 1 is the header; reversed so the first occurrence of a website wins
+        rows = {
+            self._normalize_url(row[0]): i
+            for i, row in reversed(list(enumerate(values, start=2)))
+            if row
+        }
+        known = set(rows)
+        
+        self._known_websites = known
+        self._website_to_row = rows
+        self.log_debug(f"Loaded {len(known)} known websites")
+    
     def get_all_leads(self) -> List[Dict]:
         """
         Get all leads from the spreadsheet.
         
+        Results are reused for SHEETS_CACHE_TTL seconds or until the next write.
+        
         Returns:
             List of lead dictionaries
         """
         try:
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range=f"{self.worksheet_name}!A:K"
-            ).execute()
-            
-            values = result.get('values', [])
-            
-            if not values or len(values) < 2:
-                return []
-            
-            # Convert to list of dictionaries
-            headers = values[0]
-            leads = []
-            
-            for row in values[1:]:
-                # Pad row if necessary
-                while len(row) < len(headers):
-                    row.append('')
-                
-                lead = dict(zip(headers, row))
-                leads.append(lead)
-            
+            leads = [dict(zip(self.HEADERS, lead)) for lead in self._iter_leads()]
             self.log_info(f"Retrieved {len(leads)} leads from spreadsheet")
             return leads
             
@@ -364,6 +603,36 @@ class SheetsManager(LoggerMixin):
             self.log_error(f"Error getting leads: {e}")
             return []
     
+    def _iter_leads(self) -> Iterator['Lead']:
+        """
+        Iterate over sheet rows as Lead tuples, padded to the header width.
+        
+        Yields:
+            Lead named tuples
+        """
+        width = len(self.HEADERS)
+        for row in self._get_rows():
+            yield Lead._make(row[:width] + [''] * (width - len(row)))
+    
+    def _get_rows(self) -> List[List[str]]:
+        """
+        Read all data rows (header excluded), reusing a fresh cached read.
+        
+        Returns:
+            Raw row values as returned by the Sheets API
+        """
+        if self._cache_fresh(self._leads_cache):
+            return self._leads_cache[1]
+        
+        result = execute_with_backoff(self.service.spreadsheets().values().get(
+            spreadsheetId=self.spreadsheet_id,
+            range=self._range_all
+        ))
+        
+        rows = result.get('values', [])
+        self._leads_cache = (time.monotonic(), rows)
+        return rows
+    
     def update_lead_status(self, website: str, status: str, notes: str = '') -> bool:
         """
         Update the status of a lead.
@@ -376,93 +645,92 @@ class SheetsManager(LoggerMixin):
         Returns:
             True if successful, False otherwise
         """
+        return self.update_lead_statuses([(website, status, notes)]) == 1
+    
+    def update_lead_statuses(self, updates: List[Tuple[str, str, str]]) -> int:
+        """
+        Update the status of several leads in a single batchUpdate request.
+        
+        Rows are resolved from the cached website -> row map, so no column
+        rescan is needed per lead.
+        
+        Args:
+            updates: (website, status, notes) tuples
+        
+        Returns:
+            Number of leads updated
+        """
         try:
-            # Find the row
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range=f"{self.worksheet_name}!B:B"
-            ).execute()
-            
-            values = result.get('values', [])
-            row_index = None
-            
-            website_normalized = website.lower().strip().rstrip('/')
-            
-            for i, row in enumerate(values[1:], start=2):  # Start from row 2 (skip header)
-                if row:
-                    existing_website = row[0].lower().strip().rstrip('/')
-                    if existing_website == website_normalized:
-                        row_index = i
-                        break
+            if self._website_to_row is None:
+                self._load_known_websites()
             
-            if row_index is None:
-                self.log_warning(f"Lead not found: {website}")
-                return False
+            data = []
+            updated = 0
             
-            # Update status and notes
-            updates = []
-            
-            if status:
-                updates.append({
-                    'range': f"{self.worksheet_name}!I{row_index}",
-                    'values': [[status]]
-                })
+            for website, status, notes in updates:
+                row_index = self._website_to_row.get(self._normalize_url(website))
+                if row_index is None:
+                    self.log_warning(f"Lead not found: {website}")
+                    continue
+                
+                if status:
+                    data.append({
+                        'range': self._status_prefix + str(row_index),
+                        'values': [[status]]
+                    })
+                
+                if notes:
+                    data.append({
+                        'range': self._notes_prefix + str(row_index),
+                        'values': [[notes]]
+                    })
+                
+                updated += 1
             
-            if notes:
-                updates.append({
-                    'range': f"{self.worksheet_name}!J{row_index}",
-                    'values': [[notes]]
-                })
+            if not data:
+                return updated
             
             body = {
                 'valueInputOption': 'RAW',
-                'data': updates
+                'data': data
             }
             
-            self.service.spreadsheets().values().batchUpdate(
+            execute_with_backoff(self.service.spreadsheets().values().batchUpdate(
                 spreadsheetId=self.spreadsheet_id,
                 body=body
-            ).execute()
+            ))
             
-            self.log_info(f"Updated lead status: {website}")
-            return True
+            self._invalidate_read_cache()
+            
+            self.log_info(f"Updated status of {updated} leads")
+            return updated
             
         except Exception as e:
             self.log_error(f"Error updating lead status: {e}")
-            return False
+            return 0
     
     def get_stats(self) -> Dict:
         """
         Get statistics about leads in the spreadsheet.
         
+        Results are reused for SHEETS_CACHE_TTL seconds or until the next write.
+        
         Returns:
             Dictionary with statistics
         """
+        if self._cache_fresh(self._stats_cache):
+            return self._stats_cache[1]
+        
         try:
-            leads = self.get_all_leads()
-            
-            if not leads:
-                return {
-                    'total_leads': 0,
-                    'by_status': {},
-                    'by_industry': {}
-                }
+            leads = list(self._iter_leads())
             
             stats = {
                 'total_leads': len(leads),
-                'by_status': {},
-                'by_industry': {}
+                'by_status': dict(Counter(lead.status for lead in leads)),
+                'by_industry': dict(Counter(lead.industry for lead in leads))
             }
             
-            for lead in leads:
-                # Count by status
-                status = lead.get('Status', 'Unknown')
-                stats['by_status'][status] = stats['by_status'].get(status, 0) + 1
-                
-                # Count by industry
-                industry = lead.get('Industry', 'Unknown')
-                stats['by_industry'][industry] = stats['by_industry'].get(industry, 0) + 1
-            
+            self._stats_cache = (time.monotonic(), stats)
             return stats
             
         except Exception as e:
@@ -472,3 +740,7 @@ class SheetsManager(LoggerMixin):
                 'by_status': {},
                 'by_industry': {}
             }
+
+
+# Lightweight row record for internal iteration (fields follow HEADERS, e.g. 'Date Added' -> date_added)
+Lead = namedtuple('Lead', [header.lower().replace(' ', '_') for header in SheetsManager.HEADERS])
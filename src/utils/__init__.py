@@ -6,10 +6,14 @@ Exports utility classes and functions.
 from .logger import setup_logger, get_logger
 from .config import Config
 from .analytics import Analytics
+from .dns_cache import install_dns_cache
+# google_api is not re-exported: it pulls in googleapiclient, which must stay
+# lazy. Import it as `from src.utils.google_api import ...`
 
 __all__ = [
     'setup_logger',
     'get_logger',
     'Config',
-    'Analytics'
+    'Analytics',
+    'install_dns_cache'
 ]
@@ -34,12 +34,22 @@ class Config:
         # OpenAI Configuration
         self.OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
         self.OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        # Request latency-optimized inference (only for endpoints that support performance_config)
+        self.OPENAI_LATENCY_OPTIMIZED = os.getenv("OPENAI_LATENCY_OPTIMIZED", "false").lower() == "true"
         
         # Ollama Configuration (Alternative)
         self.OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
         self.OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama2")
+        # Per-task models, e.g. a small quantized model for emails (default: OLLAMA_MODEL)
+        self.OLLAMA_MODEL_EMAIL = os.getenv("OLLAMA_MODEL_EMAIL", self.OLLAMA_MODEL)
+        self.OLLAMA_MODEL_SUMMARY = os.getenv("OLLAMA_MODEL_SUMMARY", self.OLLAMA_MODEL)
+        self.OLLAMA_MODEL_MATCH = os.getenv("OLLAMA_MODEL_MATCH", self.OLLAMA_MODEL)
         self.USE_OLLAMA = os.getenv("USE_OLLAMA", "false").lower() == "true"
         
+        # Local embedding model for service matching (Optional)
+        self.USE_EMBEDDING_MATCH = os.getenv("USE_EMBEDDING_MATCH", "false").lower() == "true"
+        self.EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+        
         # Search API Configuration
         self.SERPAPI_KEY = os.getenv("SERPAPI_KEY", "")
         self.BING_SEARCH_API_KEY = os.getenv("BING_SEARCH_API_KEY", "")
@@ -57,6 +67,8 @@ class Config:
         )
         self.GOOGLE_SHEETS_SPREADSHEET_ID = os.getenv("GOOGLE_SHEETS_SPREADSHEET_ID", "")
         self.GOOGLE_SHEETS_WORKSHEET_NAME = os.getenv("GOOGLE_SHEETS_WORKSHEET_NAME", "Leads")
+        # Seconds get_all_leads/get_stats results are reused (0 disables)
+        self.SHEETS_CACHE_TTL = float(os.getenv("SHEETS_CACHE_TTL", "30"))
         
         # Google Drive Configuration
         self.GOOGLE_DRIVE_FOLDER_ID = os.getenv("GOOGLE_DRIVE_FOLDER_ID", "")
@@ -74,6 +86,17 @@ class Config:
         self.LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
         self.OUTPUT_DIR = Path(os.getenv("OUTPUT_DIR", "output"))
         self.PORTFOLIO_DIR = Path(os.getenv("PORTFOLIO_DIR", "output/portfolios"))
+        self.CACHE_DIR = Path(os.getenv("CACHE_DIR", "output/cache"))
+        
+        # AI Response Cache
+        self.AI_CACHE_ENABLED = os.getenv("AI_CACHE_ENABLED", "true").lower() == "true"
+        self.AI_CACHE_TTL = int(os.getenv("AI_CACHE_TTL", str(86400 * 30)))
+        
+        # Rendered portfolio PDFs reused for identical inputs on the same day
+        self.PORTFOLIO_CACHE_ENABLED = os.getenv("PORTFOLIO_CACHE_ENABLED", "true").lower() == "true"
+        
+        # DNS cache for outbound API calls (seconds, 0 disables)
+        self.DNS_CACHE_TTL = float(os.getenv("DNS_CACHE_TTL", "300"))
         
         # Rate Limiting
         self.API_RATE_LIMIT_DELAY = float(os.getenv("API_RATE_LIMIT_DELAY", "2"))
@@ -86,6 +109,7 @@ class Config:
         """Create necessary directories if they don't exist."""
         self.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
         self.PORTFOLIO_DIR.mkdir(parents=True, exist_ok=True)
+        self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
         Path("logs").mkdir(exist_ok=True)
     
     def validate(self) -> tuple[bool, list[str]]:
@@ -0,0 +1,56 @@
+"""
+DNS Cache Module
+
+Process-local TTL cache for hostname resolution, so repeated calls to the
+same API host (OpenAI, Ollama) skip the system resolver.
+"""
+
+import socket
+import threading
+import time
+from typing import Dict, Tuple
+
+
+_original_getaddrinfo = socket.getaddrinfo
+_cache: Dict[Tuple, Tuple[float, list]] = {}
+_lock = threading.Lock()
+_installed = False
+
+
+def install_dns_cache(ttl: float = 300, maxsize: int = 256):
+    """
+    Wrap socket.getaddrinfo with a TTL cache. Safe to call more than once.
+    
+    Args:
+        ttl: Seconds a successful lookup is reused
+        maxsize: Maximum number of cached lookups
+    """
+    global _installed
+    if _installed or ttl <= 0:
+        return
+    
+    def cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+        key = (host, port, family, type, proto, flags)
+        now = time.monotonic()
+        
+        entry = _cache.get(key)
+        if entry is not None and entry[0] > now:
+            return list(entry[1])
+        
+        result = _original_getaddrinfo(host, port, family, type, proto, flags)
+        
+        with _lock:
+            if len(_cache) >= maxsize:
+                # Drop the oldest entry (dicts keep insertion order)
+                _cache.pop(next(iter(_cache)), None)
+            _cache[key] = (now + ttl, result)
+        return list(result)
+    
+    socket.getaddrinfo = cached_getaddrinfo
+    _installed = True
+
+
+def clear_dns_cache():
+    """Remove all cached lookups."""
+    with _lock:
+        _cache.clear()
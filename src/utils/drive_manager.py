@@ -11,12 +11,14 @@ Features:
 """
 
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
 from googleapiclient.errors import HttpError
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from pathlib import Path
+import threading
 from src.utils.logger import LoggerMixin
+from src.utils.google_api import build_service, execute_with_backoff
 from src.utils.config import get_config
 
 
@@ -31,13 +33,25 @@ class DriveManager(LoggerMixin):
     - File organization
     """
     
+    # Files above this size use a chunked resumable upload; smaller files are
+    # sent in a single request (saves the resumable-session round trip)
+    RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+    UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+    
+    # Maximum calls per Drive batch HTTP request
+    BATCH_LIMIT = 100
+    
     def __init__(self):
         """Initialize Google Drive Manager."""
         self.setup_logging("DriveManager")
         self.config = get_config()
         self.service = None
+        self.credentials = None
         self.folder_id = self.config.GOOGLE_DRIVE_FOLDER_ID
         
+        # httplib2 is not thread-safe, so upload_files workers get their own service
+        self._thread_local = threading.local()
+        
         # Initialize service
         self._initialize_service()
     
@@ -45,13 +59,13 @@ class DriveManager(LoggerMixin):
         """Initialize Google Drive API service."""
         try:
             # Load credentials
-            credentials = service_account.Credentials.from_service_account_file(
+            self.credentials = service_account.Credentials.from_service_account_file(
                 self.config.GOOGLE_SHEETS_CREDENTIALS_FILE,
                 scopes=['https://www.googleapis.com/auth/drive.file']
             )
             
             # Build service
-            self.service = build('drive', 'v3', credentials=credentials)
+            self.service = build_service('drive', 'v3', self.credentials)
             self.log_info("Google Drive service initialized successfully")
             
         except Exception as e:
@@ -66,6 +80,58 @@ class DriveManager(LoggerMixin):
             file_path: Path to file to upload
             folder_id: Optional folder ID (uses default if not provided)
         
+        Returns:
+            Dictionary with upload result including file ID and shareable link
+        """
+        return self._upload(self.service, file_path, folder_id, share=True)
+    
+    def upload_files(self, file_paths: List[str], folder_id: Optional[str] = None,
+                     max_workers: int = 8) -> List[Dict]:
+        """
+        Upload several files concurrently and share them in batched requests.
+        
+        Args:
+            file_paths: Paths of files to upload
+            folder_id: Optional folder ID (uses default if not provided)
+            max_workers: Maximum concurrent uploads
+        
+        Returns:
+            List of upload results (same shape as upload_file), in input order
+        """
+        if not file_paths:
+            return []
+        
+        self.log_info(f"Uploading {len(file_paths)} files")
+        
+        def upload(path: str) -> Dict:
+            return self._upload(self._get_thread_service(), path, folder_id, share=False)
+        
+        workers = min(max_workers, len(file_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(upload, file_paths))
+        
+        self._make_shareable_batch([r['file_id'] for r in results if r['success']])
+        
+        return results
+    
+    def _get_thread_service(self):
+        """Get a Drive service owned by the current thread."""
+        service = getattr(self._thread_local, 'service', None)
+        if service is None:
+            service = build_service('drive', 'v3', self.credentials)
+            self._thread_local.service = service
+        return service
+    
+    def _upload(self, service, file_path: str, folder_id: Optional[str], share: bool) -> Dict:
+        """
+        Upload a single file with the given service.
+        
+        Args:
+            service: Drive service to use
+            file_path: Path to file to upload
+            folder_id: Optional folder ID (uses default if not provided)
+            share: Make the file shareable right after upload
+        
         Returns:
             Dictionary with upload result including file ID and shareable link
         """
@@ -88,20 +154,25 @@ class DriveManager(LoggerMixin):
                 file_metadata['parents'] = [target_folder]
             
             # Upload file
-            media = MediaFileUpload(
-                file_path,
-                mimetype='application/pdf',
-                resumable=True
-            )
+            if file_path_obj.stat().st_size > self.RESUMABLE_THRESHOLD:
+                media = MediaFileUpload(
+                    file_path,
+                    mimetype='application/pdf',
+                    chunksize=self.UPLOAD_CHUNK_SIZE,
+                    resumable=True
+                )
+            else:
+                media = MediaFileUpload(file_path, mimetype='application/pdf')
             
-            file = self.service.files().create(
+            file = execute_with_backoff(service.files().create(
                 body=file_metadata,
                 media_body=media,
                 fields='id, name, webViewLink'
-            ).execute()
+            ))
             
             # Make file shareable (anyone with link can view)
-            self._make_shareable(file['id'])
+            if share:
+                self._make_shareable(file['id'])
             
             self.log_info(f"File uploaded successfully: {file['name']}")
             
@@ -145,16 +216,48 @@ class DriveManager(LoggerMixin):
                 'role': 'reader'
             }
             
-            self.service.permissions().create(
+            execute_with_backoff(self.service.permissions().create(
                 fileId=file_id,
                 body=permission
-            ).execute()
+            ))
             
             self.log_debug(f"File {file_id} made shareable")
             
         except Exception as e:
             self.log_warning(f"Could not make file shareable: {e}")
     
+    def _make_shareable_batch(self, file_ids: List[str]):
+        """
+        Make several files shareable using batched permission requests.
+        
+        Args:
+            file_ids: Google Drive file IDs
+        """
+        failed = []
+        
+        def callback(request_id, response, exception):
+            if exception is not None:
+                failed.append((request_id, exception))
+        
+        for start in range(0, len(file_ids), self.BATCH_LIMIT):
+            batch = self.service.new_batch_http_request(callback=callback)
+            for file_id in file_ids[start:start + self.BATCH_LIMIT]:
+                batch.add(
+                    self.service.permissions().create(
+                        fileId=file_id,
+                        body={'type': 'anyone', 'role': 'reader'}
+                    ),
+                    request_id=file_id
+                )
+            
+            try:
+                execute_with_backoff(batch)
+            except Exception as e:
+                self.log_warning(f"Could not make files shareable: {e}")
+        
+        for file_id, exception in failed:
+            self.log_warning(f"Could not make file {file_id} shareable: {exception}")
+    
     def create_folder(self, folder_name: str, parent_folder_id: Optional[str] = None) -> Dict:
         """
         Create a new folder in Google Drive.
@@ -177,10 +280,10 @@ class DriveManager(LoggerMixin):
             if parent_folder_id:
                 folder_metadata['parents'] = [parent_folder_id]
             
-            folder = self.service.files().create(
+            folder = execute_with_backoff(self.service.files().create(
                 body=folder_metadata,
                 fields='id, name'
-            ).execute()
+            ))
             
             self.log_info(f"Folder created: {folder['name']}")
             
@@ -213,7 +316,7 @@ class DriveManager(LoggerMixin):
         self.log_info(f"Deleting file: {file_id}")
         
         try:
-            self.service.files().delete(fileId=file_id).execute()
+            execute_with_backoff(self.service.files().delete(fileId=file_id))
             self.log_info(f"File deleted: {file_id}")
             return True
             
@@ -237,11 +340,11 @@ class DriveManager(LoggerMixin):
             if folder_id:
                 query = f"'{folder_id}' in parents"
             
-            results = self.service.files().list(
+            results = execute_with_backoff(self.service.files().list(
                 q=query,
                 pageSize=max_results,
                 fields="files(id, name, mimeType, createdTime, webViewLink)"
-            ).execute()
+            ))
             
             files = results.get('files', [])
             self.log_info(f"Found {len(files)} files")
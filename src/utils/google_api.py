@@ -0,0 +1,74 @@
+"""
+Google API Helpers
+
+Shared client construction and retry logic for Google Sheets/Drive.
+Quota (429) and transient server errors are retried with truncated
+exponential backoff, as recommended by Google's API usage guidelines.
+"""
+
+import random
+import time
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from src.utils.logger import get_logger
+
+
+# HTTP statuses worth retrying (rate limit and transient server errors)
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+logger = get_logger("google_api")
+
+
+def build_service(service_name: str, version: str, credentials, timeout: float = 30):
+    """
+    Build a Google API client on a persistent, authorized HTTP connection.
+
+    The bundled static discovery document is used, so building makes no
+    network call; cache_discovery is off because there is nothing to cache.
+    The returned service is not thread-safe (httplib2), so build one per thread.
+
+    Args:
+        service_name: API name (e.g. 'sheets', 'drive')
+        version: API version (e.g. 'v4')
+        credentials: google.auth credentials
+        timeout: Socket timeout in seconds
+
+    Returns:
+        googleapiclient Resource
+    """
+    http = AuthorizedHttp(credentials, http=httplib2.Http(timeout=timeout))
+    return build(service_name, version, http=http, cache_discovery=False)
+
+
+def execute_with_backoff(request, max_attempts: int = 5, max_delay: float = 32.0):
+    """
+    Execute a googleapiclient request, retrying quota and transient errors.
+
+    Args:
+        request: Request object returned by a service method (not yet executed)
+        max_attempts: Total number of attempts before the error is raised
+        max_delay: Upper bound for the backoff delay in seconds
+
+    Returns:
+        Response of request.execute()
+
+    Raises:
+        HttpError: If the error is not retryable or attempts are exhausted
+    """
+    delay = 1.0
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return request.execute()
+        except HttpError as e:
+            if e.resp.status not in RETRYABLE_STATUSES or attempt == max_attempts:
+                raise
+
+            wait = delay + random.random()
+            logger.warning(
+                f"Google API returned {e.resp.status}, retrying in {wait:.1f}s "
+                f"(attempt {attempt}/{max_attempts})"
+            )
+            time.sleep(wait)
+            delay = min(delay * 2, max_delay)
@@ -2,8 +2,10 @@
 Unit tests for AIGenerator module
 """
 
+import json
 import pytest
-from src.core.ai_generator import AIGenerator
+from unittest.mock import MagicMock, patch
+from src.core.ai_generator import AIGenerator, AsyncAIGenerator
 
 
 class TestAIGenerator:
@@ -19,6 +21,12 @@ class TestAIGenerator:
         assert generator is not None
         assert generator.backend in ["openai", "ollama"]
     
+    def test_session_pooling(self, generator):
+        """Test that a shared pooled HTTP session is configured."""
+        adapter = generator.session.get_adapter('http://localhost:11434')
+        assert adapter._pool_maxsize == 20
+        assert generator.session.headers['Connection'] == 'keep-alive'
+    
     def test_parse_email_response(self, generator):
         """Test email response parsing."""
         response = """
@@ -37,6 +45,18 @@ Team
         assert 'subject' in result
         assert 'body' in result
         assert "Test Subject Line" in result['subject']
+        assert result['subject'] == "Test Subject Line"
+        assert result['body'].startswith("This is the email body.")
+        assert result['body'].endswith("Team")
+    
+    def test_parse_email_response_requires_markers(self, generator):
+        """Test that text without SUBJECT:/BODY: markers isn't split on a stray 'body:'."""
+        response = "Hello there\nAnybody: interested in a partnership?"
+        
+        result = generator._parse_email_response(response)
+        
+        assert result['subject'] == "Hello there"
+        assert result['body'] == "Anybody: interested in a partnership?"
     
     def test_generate_fallback_email(self, generator):
         """Test fallback email generation."""
@@ -52,7 +72,125 @@ Team
         assert 'Test Company' in email
         assert 'Lead Company' in email
     
+    def test_generate_outreach_emails_batch(self, generator):
+        """Test concurrent batch email generation keeps lead order and falls back on errors."""
+        your_business = {'name': 'Test Company', 'services': ['Service 1']}
+        leads = [{'company_name': 'Lead A'}, {'company_name': 'Lead B'}]
+        
+        def fake_generate(prompt, model=None):
+            if 'Lead B' in prompt:
+                raise RuntimeError("backend down")
+            return "SUBJECT: Hello Lead A\n\nBODY:\nBody text"
+        
+        generator.backend = "ollama"
+        generator._cache = {}
+        with patch.object(generator, '_generate_with_ollama', side_effect=fake_generate):
+            results = generator.generate_outreach_emails_batch(
+                your_business, leads, [['Service 1'], ['Service 1']], concurrency=2
+            )
+        
+        assert len(results) == 2
+        assert results[0]['success'] and results[0]['subject'] == "Hello Lead A"
+        assert not results[1]['success'] and 'Lead B' in results[1]['body']
+    
+    def test_generate_outreach_emails_batch_uses_cache(self, generator):
+        """Test batched emails are read from and written to the prompt cache."""
+        your_business = {'name': 'Test Company', 'services': ['Service 1']}
+        leads = [{'company_name': 'Lead A'}, {'company_name': 'Lead B'}]
+        matched = [['Service 1'], ['Service 1']]
+        
+        generator.backend = "ollama"
+        generator._cache = {}
+        with patch.object(generator, '_generate_with_ollama',
+                          return_value="SUBJECT: Hi\n\nBODY:\nBody text") as backend:
+            first = generator.generate_outreach_emails_batch(your_business, leads, matched)
+            second = generator.generate_outreach_emails_batch(your_business, leads, matched)
+        
+        assert backend.call_count == 2
+        assert first == second
+        assert all(r['success'] for r in second)
+    
+    def test_generate_cached(self, generator):
+        """Test identical prompts are answered from the cache."""
+        generator._cache = {}
+        with patch.object(generator, '_generate', return_value="cached text") as backend:
+            assert generator._generate_cached("same prompt") == "cached text"
+            assert generator._generate_cached("same prompt") == "cached text"
+        
+        assert backend.call_count == 1
+    
+    def test_match_services_to_lead(self, generator):
+        """Test service matching keeps only offered services."""
+        services = ['SEO', 'Web Design', 'PPC Ads']
+        lead = {'company_name': 'Lead Company', 'industry': 'Retail'}
+        
+        with patch.object(generator, '_generate_cached', return_value="Web Design\nUnknown Service\nSEO") as gen:
+            matched = generator.match_services_to_lead(services, lead, "We sell shoes online")
+        
+        assert matched == ['Web Design', 'SEO']
+        assert "We sell shoes online" in gen.call_args[0][0]
+    
+    def test_generate_with_ollama_streaming(self, generator):
+        """Test streamed Ollama chunks are joined into one response."""
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_lines.return_value = [
+            b'{"response": "Hello", "done": false}',
+            b'',
+            b'{"response": " world", "done": true}',
+        ]
+        
+        with patch.object(generator.session, 'post', return_value=response) as post:
+            assert generator._generate_with_ollama("prompt") == "Hello world"
+        
+        assert post.call_args.kwargs['stream'] is True
+        assert json.loads(post.call_args.kwargs['data'])['stream'] is True
+    
+    def test_generate_lead_package(self, generator):
+        """Test the combined summary/match/email call parses one JSON response."""
+        response = json.dumps({
+            'summary': 'Sells shoes online.',
+            'matched_services': ['SEO', 'Unknown Service'],
+            'email_subject': 'Grow Lead Company',
+            'email_body': 'Hello there'
+        })
+        
+        with patch.object(generator, '_generate_cached', return_value=response) as gen:
+            package = generator.generate_lead_package(
+                {'name': 'Test Company'}, {'company_name': 'Lead Company'},
+                ['SEO', 'Web Design'], "We sell shoes"
+            )
+        
+        assert gen.call_args.kwargs['task'] == "package"
+        assert package['success']
+        assert package['summary'] == 'Sells shoes online.'
+        assert package['matched_services'] == ['SEO']
+        assert package['subject'] == 'Grow Lead Company'
+    
     # TODO: Add more tests
     # - test_generate_outreach_email (mock AI responses)
-    # - test_match_services_to_lead
     # - test_summarize_lead_business
+
+
+class TestAsyncAIGenerator:
+    """Test cases for AsyncAIGenerator class."""
+    
+    def test_generate_batch(self):
+        """Test concurrent Ollama fan-out keeps prompt order."""
+        httpx = pytest.importorskip("httpx")
+        
+        def handler(request):
+            prompt = json.loads(request.content)['prompt']
+            lines = [
+                json.dumps({'response': 'reply to ', 'done': False}),
+                json.dumps({'response': prompt, 'done': True}),
+            ]
+            return httpx.Response(200, content='\n'.join(lines).encode())
+        
+        generator = AsyncAIGenerator()
+        generator.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        generator._create_client = lambda: None
+        
+        results = generator.generate_batch(["one", "two", "three"])
+        
+        assert results == ["reply to one", "reply to two", "reply to three"]
@@ -3,15 +3,21 @@ Unit tests for PortfolioGenerator module
 """
 
 import pytest
+from unittest.mock import patch
 from src.core.portfolio_generator import PortfolioGenerator
+from src.utils.config import get_config
 
 
 class TestPortfolioGenerator:
     """Test cases for PortfolioGenerator class."""
     
     @pytest.fixture
-    def generator(self):
-        """Create PortfolioGenerator instance for testing."""
+    def generator(self, tmp_path, monkeypatch):
+        """Create PortfolioGenerator instance writing PDFs and cache under tmp_path."""
+        config = get_config()
+        monkeypatch.setattr(config, 'PORTFOLIO_DIR', tmp_path / 'portfolios')
+        monkeypatch.setattr(config, 'CACHE_DIR', tmp_path / 'cache')
+        monkeypatch.setattr(config, 'PORTFOLIO_CACHE_ENABLED', True)
         return PortfolioGenerator()
     
     def test_initialization(self, generator):
@@ -25,7 +31,67 @@ class TestPortfolioGenerator:
         assert 'Marketing' in generator.INDUSTRY_COLORS
         assert 'default' in generator.INDUSTRY_COLORS
     
+    def test_styles_cached_per_color_scheme(self, generator):
+        """Test paragraph styles are built once per color scheme."""
+        scheme = generator.INDUSTRY_COLORS['Technology']
+        styles = generator._get_styles(scheme)
+        
+        assert generator._get_styles(scheme) is styles
+        assert styles['heading'].textColor == scheme.primary
+        assert styles['cta'].textColor == scheme.secondary
+    
+    def test_generate_portfolio(self, generator):
+        """Test portfolio PDF generation with sample data."""
+        result = generator.generate_portfolio(
+            {'name': 'Test Company', 'description': 'We build things.'},
+            {'company_name': 'Lead Company', 'industry': 'Technology'},
+            ['Service 1', 'Service 2'],
+            {'subject': 'Hello', 'body': 'Body'}
+        )
+        
+        assert result['success'], result['error']
+        assert result['file_name'].endswith('.pdf')
+    
+    def test_generate_portfolio_bytes(self, generator):
+        """Test in-memory portfolio generation skips the disk write."""
+        result = generator.generate_portfolio(
+            {'name': 'Test Company'},
+            {'company_name': 'Bytes Lead'},
+            ['Service 1'],
+            {},
+            return_bytes=True
+        )
+        
+        assert result['success'], result['error']
+        assert result['pdf_bytes'].startswith(b'%PDF')
+        assert not (generator.output_dir / result['file_name']).exists()
+    
+    def test_generate_portfolio_reuses_cached_pdf(self, generator):
+        """Test identical inputs reuse the cached PDF instead of rebuilding it."""
+        args = ({'name': 'Test Company'}, {'company_name': 'Cached Lead'}, ['Service 1'], {})
+        first = generator.generate_portfolio(*args, return_bytes=True)
+        
+        with patch.object(generator, '_build_pdf') as build_pdf:
+            second = generator.generate_portfolio(*args, return_bytes=True)
+        
+        assert not build_pdf.called
+        assert second['pdf_bytes'] == first['pdf_bytes']
+        assert generator.cache_dir.parent == generator.config.CACHE_DIR
+        assert list(generator.cache_dir.glob('*.pdf'))
+    
+    def test_generate_portfolios_batch(self, generator):
+        """Test parallel portfolio generation keeps task order."""
+        your_business = {'name': 'Test Company', 'description': 'We build things.'}
+        tasks = [
+            (your_business, {'company_name': f'Lead {i}', 'industry': 'Finance'}, ['Service 1'], {})
+            for i in range(3)
+        ]
+        
+        results = generator.generate_portfolios_batch(tasks, max_workers=2)
+        
+        assert [r['success'] for r in results] == [True, True, True]
+        assert [r['file_name'].split('_')[2] for r in results] == ['0', '1', '2']
+    
     # TODO: Add more tests
-    # - test_generate_portfolio (with mock data)
     # - test_create_cover_page
     # - test_create_services_section